@@ -1,27 +1,105 @@
 """JSONSQL commands (select, insert, update, delete) and API subcommands."""
 
-import json
-from typing import Any
-
+import os
+import re
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, Any
+
+import orjson
 import typer
-from rich.console import Console
 
-from iptvportal.cli.core.editor import open_jsonsql_editor
-from iptvportal.cli.formatters import (
-    display_dry_run,
-    display_request_and_result,
-    display_result,
-)
-from iptvportal.cli.utils import execute_query, parse_json_param
 from iptvportal.exceptions import IPTVPortalError
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Helpers such as the editor, formatters and HTTP client are imported inside the
+# branches that use them, so --help and --dry-run do not load them.
+@lru_cache(maxsize=2)
+def _console(stderr: bool = False) -> "Console":
+    """Return the shared stdout (or stderr) console, created on first use."""
+    from rich.console import Console
+
+    return Console(stderr=stderr)
+
+
 jsonsql_app = typer.Typer(
     name="jsonsql",
     help="JSONSQL queries and API operations",
     no_args_is_help=True,
 )
 
+# Options shared by the select/insert/update/delete commands.
+# Declared once so each command reuses the same OptionInfo instead of building its own.
+EditOption = Annotated[
+    bool, typer.Option("--edit", "-e", help="Open editor to write JSONSQL query")
+]
+DryRunOption = Annotated[bool, typer.Option("--dry-run", help="Show query without executing")]
+ShowRequestOption = Annotated[
+    bool, typer.Option("--show-request", help="Show JSON-RPC request along with result")
+]
+OutputFormatOption = Annotated[
+    str, typer.Option("--format", help="Output format: table, json, yaml")
+]
+ConfigFileOption = Annotated[str | None, typer.Option("--config", help="Config file path")]
+DebugOption = Annotated[
+    bool,
+    typer.Option("--debug", "-d", help="Enable debug mode with detailed step-by-step logging"),
+]
+DebugFormatOption = Annotated[
+    str, typer.Option("--debug-format", help="Debug output format: text, json, yaml")
+]
+DebugFileOption = Annotated[
+    str | None, typer.Option("--debug-file", help="Save debug logs to file")
+]
+
+# Debug log titles shared by the query commands.
+EXECUTING_MESSAGES = {
+    method: f"Executing {method.upper()} query..."
+    for method in ("select", "insert", "update", "delete")
+}
+EDITOR_INPUT_TITLE = "JSONSQL Input (from editor)"
+CLI_PARAMS_TITLE = "JSONSQL Parameters (from CLI)"
+EXECUTION_TITLE = "Execution"
+RESULT_TITLE = "Query Result"
+
+# Starting content for --edit, serialized once
+EDITOR_TEMPLATES = {
+    method: orjson.dumps(template, option=orjson.OPT_INDENT_2)
+    for method, template in {
+        "select": {
+            "data": ["*"],
+            "from": "table_name",
+            "where": {"eq": ["column", "value"]},
+            "limit": 10,
+        },
+        "insert": {
+            "into": "table_name",
+            "columns": ["column1", "column2"],
+            "values": [["value1", "value2"]],
+            "returning": "id",
+        },
+        "update": {
+            "table": "table_name",
+            "set": {"column": "value"},
+            "where": {"eq": ["id", 123]},
+        },
+        "delete": {"from": "table_name", "where": {"eq": ["id", 123]}},
+    }.items()
+}
+
+
+# Comma separator with surrounding whitespace, for --data/--columns lists
+COLUMN_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def split_columns(value: str) -> list[str]:
+    """Split a comma-separated column list, trimming whitespace around names."""
+    return COLUMN_SEPARATOR.split(value.strip())
+
 
 def build_select_params(
     data: str | None,
@@ -34,36 +112,128 @@ def build_select_params(
     group_by: str | None,
 ) -> dict:
     """Build SELECT query parameters."""
-    params = {}
+    from iptvportal.cli.utils import parse_json_param
+
+    # Parse comma-separated columns
+    columns = split_columns(data) if data else ["*"]
+
+    # Empty strings and unset flags are dropped; limit/offset keep 0.
+    return {
+        key: value
+        for key, value in (
+            ("data", columns),
+            ("from", from_ or None),
+            ("where", parse_json_param(where, "where") if where else None),
+            ("order_by", order_by or None),
+            ("limit", limit),
+            ("offset", offset),
+            ("distinct", True if distinct else None),
+            ("group_by", group_by or None),
+        )
+        if value is not None
+    }
+
+
+def run_query_command(
+    method: str,
+    build_params: Callable[[], dict[str, Any]],
+    *,
+    edit: bool,
+    has_cli_params: bool,
+    dry_run: bool,
+    show_request: bool,
+    output_format: str,
+    config_file: str | None,
+    debug: bool,
+    debug_format: str,
+    debug_file: str | None,
+    show_result: Callable[[Any], None] | None = None,
+    **execute_kwargs: Any,
+) -> None:
+    """
+    Run the flow shared by the select/insert/update/delete commands.
+
+    Gets params from the editor or build_params, then either shows a dry run
+    or executes the query and displays the result. Errors are reported and
+    turned into exit code 1.
+
+    Args:
+        method: JSONSQL method name
+        build_params: Builds params from CLI options; raises typer.Exit on
+            missing required options
+        edit: Take params from the editor instead of CLI options
+        has_cli_params: Whether query options were given (warned about with --edit)
+        dry_run: Show the request without executing it
+        show_request: Show the JSON-RPC request along with the result
+        output_format: Output format (table, json, yaml)
+        config_file: Optional config file path
+        debug: Enable step-by-step debug output
+        debug_format: Debug output format
+        debug_file: Optional file to save debug logs to
+        show_result: Optional result display override (default: display_result)
+        **execute_kwargs: Extra keyword arguments for execute_query
+    """
+    from iptvportal.cli.debug import DebugLogger
 
-    if data:
-        # Parse comma-separated columns
-        params["data"] = [col.strip() for col in data.split(",")]
-    else:
-        params["data"] = ["*"]
+    debug_logger = DebugLogger(
+        enabled=debug,
+        format_type=debug_format,
+        output_file=debug_file,
+    )
+
+    try:
+        if edit:
+            from iptvportal.cli.core.editor import open_jsonsql_editor
+
+            if has_cli_params:
+                _console().print(
+                    "[yellow]Warning: CLI parameters will be ignored when using --edit[/yellow]"
+                )
 
-    if from_:
-        params["from"] = from_
+            params = open_jsonsql_editor(EDITOR_TEMPLATES[method], return_parsed=True)
+            debug_logger.log("jsonsql_input", params, EDITOR_INPUT_TITLE)
+        else:
+            params = build_params()
+            debug_logger.log("jsonsql_params", params, CLI_PARAMS_TITLE)
 
-    if where:
-        params["where"] = parse_json_param(where)
+        if dry_run:
+            from iptvportal.cli.formatters import display_dry_run
 
-    if order_by:
-        params["order_by"] = order_by
+            display_dry_run(params, method, sql=None, format_type=output_format)
+        else:
+            from iptvportal.cli.formatters import display_request_and_result, display_result
+            from iptvportal.cli.utils import execute_query
 
-    if limit is not None:
-        params["limit"] = limit
+            debug_logger.log("executing", EXECUTING_MESSAGES[method], EXECUTION_TITLE)
+            result = execute_query(
+                method, params, config_file, debug_logger=debug_logger, **execute_kwargs
+            )
+            debug_logger.log("result", result, RESULT_TITLE)
 
-    if offset is not None:
-        params["offset"] = offset
+            if show_request:
+                display_request_and_result(
+                    params, method, result, sql=None, format_type=output_format
+                )
+            elif show_result is not None:
+                show_result(result)
+            else:
+                display_result(result, output_format)
 
-    if distinct:
-        params["distinct"] = True
+        # Save debug logs to file if specified
+        debug_logger.save_to_file()
 
-    if group_by:
-        params["group_by"] = group_by
+    except Exception as e:
+        if isinstance(e, typer.Exit):
+            raise
+        from iptvportal.cli.utils import print_query_error
 
-    return params
+        if isinstance(e, IPTVPortalError):
+            debug_logger.exception(e, "IPTVPortal error occurred")
+            print_query_error("Query failed", e, debug)
+        else:
+            debug_logger.exception(e, "Unexpected error occurred")
+            print_query_error("Unexpected error", e, debug)
+        raise typer.Exit(1) from e
 
 
 @jsonsql_app.command(name="select")
@@ -78,15 +248,11 @@ def select_command(
     distinct: bool = typer.Option(False, "--distinct", help="SELECT DISTINCT"),
     group_by: str | None = typer.Option(None, "--group-by", help="GROUP BY column"),
     # Editor mode
-    edit: bool = typer.Option(False, "--edit", "-e", help="Open editor to write JSONSQL query"),
+    edit: EditOption = False,
     # Common options
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show query without executing"),
-    show_request: bool = typer.Option(
-        False,
-        "--show-request",
-        help="Show JSON-RPC request along with result",
-    ),
-    output_format: str = typer.Option("table", "--format", help="Output format: table, json, yaml"),
+    dry_run: DryRunOption = False,
+    show_request: ShowRequestOption = False,
+    output_format: OutputFormatOption = "table",
     map_schema: bool = typer.Option(
         True,
         "--map-schema/--no-map-schema",
@@ -95,24 +261,11 @@ def select_command(
             "(auto-generate schema if missing)"
         ),
     ),
-    config_file: str | None = typer.Option(None, "--config", help="Config file path"),
+    config_file: ConfigFileOption = None,
     # Debug options
-    debug: bool = typer.Option(
-        False,
-        "--debug",
-        "-d",
-        help="Enable debug mode with detailed step-by-step logging",
-    ),
-    debug_format: str = typer.Option(
-        "text",
-        "--debug-format",
-        help="Debug output format: text, json, yaml",
-    ),
-    debug_file: str | None = typer.Option(
-        None,
-        "--debug-file",
-        help="Save debug logs to file",
-    ),
+    debug: DebugOption = False,
+    debug_format: DebugFormatOption = "text",
+    debug_file: DebugFileOption = None,
 ) -> None:
     """
     Execute SELECT query.
@@ -131,93 +284,50 @@ def select_command(
         # Debug mode
         iptvportal jsonsql select --from subscriber --limit 5 --debug
     """
-    from iptvportal.cli.debug import DebugLogger
 
-    # Initialize debug logger
-    debug_logger = DebugLogger(
-        enabled=debug,
-        format_type=debug_format,
-        output_file=debug_file,
-    )
-
-    try:
-        if edit:
-            # Editor mode: open editor for JSONSQL input
-            if any([data, from_, where, order_by, limit, offset, distinct, group_by]):
-                console.print(
-                    "[yellow]Warning: CLI parameters will be ignored when using --edit[/yellow]"
-                )
-
-            # Provide template
-            template = json.dumps(
-                {
-                    "data": ["*"],
-                    "from": "table_name",
-                    "where": {"eq": ["column", "value"]},
-                    "limit": 10,
-                },
-                indent=2,
-            )
-
-            jsonsql_str = open_jsonsql_editor(template)
-            params = json.loads(jsonsql_str)
-            debug_logger.log("jsonsql_input", params, "JSONSQL Input (from editor)")
+    def build_params() -> dict[str, Any]:
+        if not from_:
+            _console().print("[red]Error: --from is required when not using --edit[/red]")
+            raise typer.Exit(1)
+        return build_select_params(data, from_, where, order_by, limit, offset, distinct, group_by)
+
+    def show_result(result: Any) -> None:
+        from iptvportal.cli.formatters import (
+            STREAM_THRESHOLD,
+            display_result,
+            display_result_stream,
+        )
+
+        if output_format != "table" and isinstance(result, list) and len(result) > STREAM_THRESHOLD:
+            # Large dumps: write rows incrementally
+            display_result_stream(result, output_format)
         else:
-            # Native mode: build JSONSQL from parameters
-            if not from_:
-                console.print("[red]Error: --from is required when not using --edit[/red]")
-                raise typer.Exit(1)
-
-            params = build_select_params(
-                data, from_, where, order_by, limit, offset, distinct, group_by
-            )
-            debug_logger.log("jsonsql_params", params, "JSONSQL Parameters (from CLI)")
-
-        if dry_run:
-            # Show what would be executed
-            display_dry_run(params, "select", sql=None, format_type=output_format)
-        else:
-            # Execute query with optional schema mapping
-            debug_logger.log("executing", "Executing SELECT query...", "Execution")
-            result: Any = execute_query(
-                "select",
-                params,
-                config_file,
-                use_schema_mapping=map_schema,
-                debug_logger=debug_logger,
-            )
-            debug_logger.log("result", result, "Query Result")
-
-            if show_request:
-                # Show request and result
-                display_request_and_result(
-                    params, "select", result, sql=None, format_type=output_format
-                )
-            else:
-                # Show only result
-                display_result(result, output_format)
-
-        # Save debug logs to file if specified
-        debug_logger.save_to_file()
-
-    except IPTVPortalError as e:
-        debug_logger.exception(e, "IPTVPortal error occurred")
-        if debug:
-            console.print(f"\n[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
-    except Exception as e:
-        debug_logger.exception(e, "Unexpected error occurred")
-        if debug:
-            console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
+            display_result(result, output_format)
+
+    run_query_command(
+        "select",
+        build_params,
+        edit=edit,
+        has_cli_params=bool(
+            data
+            or from_
+            or where
+            or order_by
+            or limit is not None
+            or offset is not None
+            or distinct
+            or group_by
+        ),
+        dry_run=dry_run,
+        show_request=show_request,
+        output_format=output_format,
+        config_file=config_file,
+        debug=debug,
+        debug_format=debug_format,
+        debug_file=debug_file,
+        show_result=show_result,
+        use_schema_mapping=map_schema,
+    )
 
 
 @jsonsql_app.command(name="insert")
@@ -228,33 +338,16 @@ def insert_command(
     values: str | None = typer.Option(None, "--values", help="Values (JSON array of arrays)"),
     returning: str | None = typer.Option(None, "--returning", help="Columns to return"),
     # Editor mode
-    edit: bool = typer.Option(False, "--edit", "-e", help="Open editor to write JSONSQL query"),
+    edit: EditOption = False,
     # Common options
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show query without executing"),
-    show_request: bool = typer.Option(
-        False,
-        "--show-request",
-        help="Show JSON-RPC request along with result",
-    ),
-    output_format: str = typer.Option("json", "--format", help="Output format: json, yaml"),
-    config_file: str | None = typer.Option(None, "--config", help="Config file path"),
+    dry_run: DryRunOption = False,
+    show_request: ShowRequestOption = False,
+    output_format: OutputFormatOption = "json",
+    config_file: ConfigFileOption = None,
     # Debug options
-    debug: bool = typer.Option(
-        False,
-        "--debug",
-        "-d",
-        help="Enable debug mode with detailed step-by-step logging",
-    ),
-    debug_format: str = typer.Option(
-        "text",
-        "--debug-format",
-        help="Debug output format: text, json, yaml",
-    ),
-    debug_file: str | None = typer.Option(
-        None,
-        "--debug-file",
-        help="Save debug logs to file",
-    ),
+    debug: DebugOption = False,
+    debug_format: DebugFormatOption = "text",
+    debug_file: DebugFileOption = None,
 ) -> None:
     """
     Execute INSERT query.
@@ -269,90 +362,35 @@ def insert_command(
         # Debug mode
         iptvportal jsonsql insert --into package --columns "name,paid" --values '[["movie", true]]' --debug
     """
-    from iptvportal.cli.debug import DebugLogger
-
-    # Initialize debug logger
-    debug_logger = DebugLogger(
-        enabled=debug,
-        format_type=debug_format,
-        output_file=debug_file,
-    )
 
-    try:
-        if edit:
-            # Editor mode
-            if any([into, columns, values, returning]):
-                console.print(
-                    "[yellow]Warning: CLI parameters will be ignored when using --edit[/yellow]"
-                )
+    def build_params() -> dict[str, Any]:
+        from iptvportal.cli.utils import parse_json_param
 
-            template = json.dumps(
-                {
-                    "into": "table_name",
-                    "columns": ["column1", "column2"],
-                    "values": [["value1", "value2"]],
-                    "returning": "id",
-                },
-                indent=2,
+        if not into or not columns or not values:
+            _console().print(
+                "[red]Error: --into, --columns, and --values are required when not using --edit[/red]"
             )
-
-            jsonsql_str = open_jsonsql_editor(template)
-            params = json.loads(jsonsql_str)
-            debug_logger.log("jsonsql_input", params, "JSONSQL Input (from editor)")
-        else:
-            # Native mode
-            if not into or not columns or not values:
-                console.print(
-                    "[red]Error: --into, --columns, and --values are required when not using --edit[/red]"
-                )
-                raise typer.Exit(1)
-
-            params = {
-                "into": into,
-                "columns": [col.strip() for col in columns.split(",")],
-                "values": parse_json_param(values),
-            }
-
-            if returning:
-                params["returning"] = returning
-
-            debug_logger.log("jsonsql_params", params, "JSONSQL Parameters (from CLI)")
-
-        if dry_run:
-            display_dry_run(params, "insert", sql=None, format_type=output_format)
-        else:
-            debug_logger.log("executing", "Executing INSERT query...", "Execution")
-            result = execute_query("insert", params, config_file, debug_logger=debug_logger)
-            debug_logger.log("result", result, "Query Result")
-
-            if show_request:
-                display_request_and_result(
-                    params, "insert", result, sql=None, format_type=output_format
-                )
-            else:
-                display_result(result, output_format)
-
-        # Save debug logs to file if specified
-        debug_logger.save_to_file()
-
-    except IPTVPortalError as e:
-        debug_logger.exception(e, "IPTVPortal error occurred")
-        if debug:
-            console.print(f"\n[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
-    except Exception as e:
-        debug_logger.exception(e, "Unexpected error occurred")
-        if debug:
-            console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
+            raise typer.Exit(1)
+        return {
+            "into": into,
+            "columns": split_columns(columns),
+            "values": parse_json_param(values, "values"),
+            **({"returning": returning} if returning else {}),
+        }
+
+    run_query_command(
+        "insert",
+        build_params,
+        edit=edit,
+        has_cli_params=bool(into or columns or values or returning),
+        dry_run=dry_run,
+        show_request=show_request,
+        output_format=output_format,
+        config_file=config_file,
+        debug=debug,
+        debug_format=debug_format,
+        debug_file=debug_file,
+    )
 
 
 @jsonsql_app.command(name="update")
@@ -363,33 +401,16 @@ def update_command(
     where: str | None = typer.Option(None, "--where", help="WHERE condition (JSONSQL format)"),
     returning: str | None = typer.Option(None, "--returning", help="Columns to return"),
     # Editor mode
-    edit: bool = typer.Option(False, "--edit", "-e", help="Open editor to write JSONSQL query"),
+    edit: EditOption = False,
     # Common options
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show query without executing"),
-    show_request: bool = typer.Option(
-        False,
-        "--show-request",
-        help="Show JSON-RPC request along with result",
-    ),
-    output_format: str = typer.Option("json", "--format", help="Output format: json, yaml"),
-    config_file: str | None = typer.Option(None, "--config", help="Config file path"),
+    dry_run: DryRunOption = False,
+    show_request: ShowRequestOption = False,
+    output_format: OutputFormatOption = "json",
+    config_file: ConfigFileOption = None,
     # Debug options
-    debug: bool = typer.Option(
-        False,
-        "--debug",
-        "-d",
-        help="Enable debug mode with detailed step-by-step logging",
-    ),
-    debug_format: str = typer.Option(
-        "text",
-        "--debug-format",
-        help="Debug output format: text, json, yaml",
-    ),
-    debug_file: str | None = typer.Option(
-        None,
-        "--debug-file",
-        help="Save debug logs to file",
-    ),
+    debug: DebugOption = False,
+    debug_format: DebugFormatOption = "text",
+    debug_file: DebugFileOption = None,
 ) -> None:
     """
     Execute UPDATE query.
@@ -404,87 +425,35 @@ def update_command(
         # Debug mode
         iptvportal jsonsql update --table subscriber --set '{"disabled": true}' --where '{"eq": ["username", "test"]}' --debug
     """
-    from iptvportal.cli.debug import DebugLogger
-
-    # Initialize debug logger
-    debug_logger = DebugLogger(
-        enabled=debug,
-        format_type=debug_format,
-        output_file=debug_file,
-    )
 
-    try:
-        if edit:
-            # Editor mode
-            if any([table, set_, where, returning]):
-                console.print(
-                    "[yellow]Warning: CLI parameters will be ignored when using --edit[/yellow]"
-                )
+    def build_params() -> dict[str, Any]:
+        from iptvportal.cli.utils import parse_json_param
 
-            template = json.dumps(
-                {"table": "table_name", "set": {"column": "value"}, "where": {"eq": ["id", 123]}},
-                indent=2,
+        if not table or not set_:
+            _console().print(
+                "[red]Error: --table and --set are required when not using --edit[/red]"
             )
-
-            jsonsql_str = open_jsonsql_editor(template)
-            params = json.loads(jsonsql_str)
-            debug_logger.log("jsonsql_input", params, "JSONSQL Input (from editor)")
-        else:
-            # Native mode
-            if not table or not set_:
-                console.print(
-                    "[red]Error: --table and --set are required when not using --edit[/red]"
-                )
-                raise typer.Exit(1)
-
-            params = {
-                "table": table,
-                "set": parse_json_param(set_),
-            }
-
-            if where:
-                params["where"] = parse_json_param(where)
-
-            if returning:
-                params["returning"] = returning
-
-            debug_logger.log("jsonsql_params", params, "JSONSQL Parameters (from CLI)")
-
-        if dry_run:
-            display_dry_run(params, "update", sql=None, format_type=output_format)
-        else:
-            debug_logger.log("executing", "Executing UPDATE query...", "Execution")
-            result = execute_query("update", params, config_file, debug_logger=debug_logger)
-            debug_logger.log("result", result, "Query Result")
-
-            if show_request:
-                display_request_and_result(
-                    params, "update", result, sql=None, format_type=output_format
-                )
-            else:
-                display_result(result, output_format)
-
-        # Save debug logs to file if specified
-        debug_logger.save_to_file()
-
-    except IPTVPortalError as e:
-        debug_logger.exception(e, "IPTVPortal error occurred")
-        if debug:
-            console.print(f"\n[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
-    except Exception as e:
-        debug_logger.exception(e, "Unexpected error occurred")
-        if debug:
-            console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
-        raise typer.Exit(1) from e
+            raise typer.Exit(1)
+        return {
+            "table": table,
+            "set": parse_json_param(set_, "set"),
+            **({"where": parse_json_param(where, "where")} if where else {}),
+            **({"returning": returning} if returning else {}),
+        }
+
+    run_query_command(
+        "update",
+        build_params,
+        edit=edit,
+        has_cli_params=bool(table or set_ or where or returning),
+        dry_run=dry_run,
+        show_request=show_request,
+        output_format=output_format,
+        config_file=config_file,
+        debug=debug,
+        debug_format=debug_format,
+        debug_file=debug_file,
+    )
 
 
 @jsonsql_app.command(name="delete")
@@ -494,33 +463,16 @@ def delete_command(
     where: str | None = typer.Option(None, "--where", help="WHERE condition (JSONSQL format)"),
     returning: str | None = typer.Option(None, "--returning", help="Columns to return"),
     # Editor mode
-    edit: bool = typer.Option(False, "--edit", "-e", help="Open editor to write JSONSQL query"),
+    edit: EditOption = False,
     # Common options
-    dry_run: bool = typer.Option(False, "--dry-run", help="Show query without executing"),
-    show_request: bool = typer.Option(
-        False,
-        "--show-request",
-        help="Show JSON-RPC request along with result",
-    ),
-    output_format: str = typer.Option("json", "--format", help="Output format: json, yaml"),
-    config_file: str | None = typer.Option(None, "--config", help="Config file path"),
+    dry_run: DryRunOption = False,
+    show_request: ShowRequestOption = False,
+    output_format: OutputFormatOption = "json",
+    config_file: ConfigFileOption = None,
     # Debug options
-    debug: bool = typer.Option(
-        False,
-        "--debug",
-        "-d",
-        help="Enable debug mode with detailed step-by-step logging",
-    ),
-    debug_format: str = typer.Option(
-        "text",
-        "--debug-format",
-        help="Debug output format: text, json, yaml",
-    ),
-    debug_file: str | None = typer.Option(
-        None,
-        "--debug-file",
-        help="Save debug logs to file",
-    ),
+    debug: DebugOption = False,
+    debug_format: DebugFormatOption = "text",
+    debug_file: DebugFileOption = None,
 ) -> None:
     """
     Execute DELETE query.
@@ -535,85 +487,186 @@ def delete_command(
         # Debug mode
         iptvportal jsonsql delete --from terminal --where '{"eq": ["id", 123]}' --debug
     """
-    from iptvportal.cli.debug import DebugLogger
 
-    # Initialize debug logger
-    debug_logger = DebugLogger(
-        enabled=debug,
-        format_type=debug_format,
-        output_file=debug_file,
+    def build_params() -> dict[str, Any]:
+        from iptvportal.cli.utils import parse_json_param
+
+        if not from_:
+            _console().print("[red]Error: --from is required when not using --edit[/red]")
+            raise typer.Exit(1)
+        return {
+            "from": from_,
+            **({"where": parse_json_param(where, "where")} if where else {}),
+            **({"returning": returning} if returning else {}),
+        }
+
+    run_query_command(
+        "delete",
+        build_params,
+        edit=edit,
+        has_cli_params=bool(from_ or where or returning),
+        dry_run=dry_run,
+        show_request=show_request,
+        output_format=output_format,
+        config_file=config_file,
+        debug=debug,
+        debug_format=debug_format,
+        debug_file=debug_file,
     )
 
-    try:
-        if edit:
-            # Editor mode
-            if any([from_, where, returning]):
-                console.print(
-                    "[yellow]Warning: CLI parameters will be ignored when using --edit[/yellow]"
-                )
 
-            template = json.dumps({"from": "table_name", "where": {"eq": ["id", 123]}}, indent=2)
+BATCH_METHODS = ("select", "insert", "update", "delete")
 
-            jsonsql_str = open_jsonsql_editor(template)
-            params = json.loads(jsonsql_str)
-            debug_logger.log("jsonsql_input", params, "JSONSQL Input (from editor)")
-        else:
-            # Native mode
-            if not from_:
-                console.print("[red]Error: --from is required when not using --edit[/red]")
-                raise typer.Exit(1)
 
-            params = {"from": from_}
+def load_batch_operations(lines: Any) -> list[tuple[int, str, dict[str, Any]]]:
+    """
+    Parse newline-delimited JSONSQL operations.
 
-            if where:
-                params["where"] = parse_json_param(where)
+    Each non-empty line must be an object like
+    ``{"op": "select", "params": {"from": "subscriber", "limit": 10}}``.
 
-            if returning:
-                params["returning"] = returning
+    Args:
+        lines: Iterable of text lines (e.g. an open file)
 
-            debug_logger.log("jsonsql_params", params, "JSONSQL Parameters (from CLI)")
+    Returns:
+        List of (line number, method, params) tuples
 
-        if dry_run:
-            display_dry_run(params, "delete", sql=None, format_type=output_format)
-        else:
-            debug_logger.log("executing", "Executing DELETE query...", "Execution")
-            result = execute_query("delete", params, config_file, debug_logger=debug_logger)
-            debug_logger.log("result", result, "Query Result")
+    Raises:
+        ValueError: If a line is not a valid operation record
+    """
+    operations = []
 
-            if show_request:
-                display_request_and_result(
-                    params, "delete", result, sql=None, format_type=output_format
-                )
-            else:
-                display_result(result, output_format)
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
 
-        # Save debug logs to file if specified
-        debug_logger.save_to_file()
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"line {line_no}: invalid JSON: {e}") from e
 
-    except IPTVPortalError as e:
-        debug_logger.exception(e, "IPTVPortal error occurred")
-        if debug:
-            console.print(f"\n[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
+        if not isinstance(record, dict):
+            raise ValueError(f"line {line_no}: expected a JSON object")
+
+        method = record.get("op")
+        if method not in BATCH_METHODS:
+            raise ValueError(
+                f"line {line_no}: 'op' must be one of {', '.join(BATCH_METHODS)}, got {method!r}"
+            )
+
+        params = record.get("params")
+        if not isinstance(params, dict):
+            raise ValueError(f"line {line_no}: 'params' must be a JSON object")
+
+        operations.append((line_no, method, params))
+
+    return operations
+
+
+@jsonsql_app.command(name="batch")
+def batch_command(
+    file: str = typer.Option(
+        ..., "--file", help="NDJSON file with one {op, params} record per line ('-' for stdin)"
+    ),
+    concurrency: int = typer.Option(
+        1, "--concurrency", min=1, help="Number of queries to run in parallel"
+    ),
+    rpc_batch: bool = typer.Option(
+        False,
+        "--rpc-batch",
+        help="Send all queries as a single JSON-RPC batch request (one round trip)",
+    ),
+    config_file: ConfigFileOption = None,
+) -> None:
+    """
+    Execute many JSONSQL queries in one process over a shared connection.
+
+    Reads newline-delimited records of the form {"op": "select", "params": {...}}
+    and writes one JSON line per record to stdout: {"line": n, "op": ..., "result": ...}
+    or {"line": n, "op": ..., "error": ...}. Exits with code 1 if any query failed.
+
+    Examples:
+        iptvportal jsonsql batch --file queries.ndjson
+        iptvportal jsonsql batch --file queries.ndjson --concurrency 4
+        iptvportal jsonsql batch --file queries.ndjson --rpc-batch
+        cat queries.ndjson | iptvportal jsonsql batch --file -
+    """
+    err_console = _console(stderr=True)
+
+    try:
+        if file == "-":
+            operations = load_batch_operations(sys.stdin)
         else:
-            console.print(f"[bold red]Query failed:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
+            with open(file, encoding="utf-8") as f:
+                operations = load_batch_operations(f)
+    except FileNotFoundError:
+        err_console.print(f"[bold red]Error:[/bold red] File not found: {file}")
+        raise typer.Exit(1)
+    except OSError as e:
+        # Directories, permission errors and other unreadable paths
+        err_console.print(f"[bold red]Error:[/bold red] Cannot read {file}: {e.strerror or e}")
+        raise typer.Exit(1)
+    except ValueError as e:
+        err_console.print(f"[bold red]Invalid batch file:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    from iptvportal.cli.utils import execute_batch
+
+    failed = 0
+    out = sys.stdout.buffer
+
+    try:
+        results = execute_batch(
+            ((method, params) for _, method, params in operations),
+            config_file,
+            concurrency=concurrency,
+            rpc_batch=rpc_batch,
+        )
+        for (line_no, method, _), (result, error) in zip(operations, results, strict=True):
+            record: dict[str, Any] = {"line": line_no, "op": method}
+            if error is None:
+                record["result"] = result
+            else:
+                record["error"] = str(error)
+                failed += 1
+            out.write(orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE))
+            out.flush()
+    except IPTVPortalError as e:
+        err_console.print(f"[bold red]Batch failed:[/bold red] {e}")
         raise typer.Exit(1) from e
     except Exception as e:
-        debug_logger.exception(e, "Unexpected error occurred")
-        if debug:
-            console.print(f"\n[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]See debug output above for details[/yellow]")
-        else:
-            console.print(f"[bold red]Unexpected error:[/bold red] {e}")
-            console.print("[yellow]Tip: Use --debug flag for detailed error information[/yellow]")
+        err_console.print(f"[bold red]Unexpected error:[/bold red] {e}")
         raise typer.Exit(1) from e
 
+    if failed:
+        err_console.print(f"[yellow]{failed} of {len(operations)} queries failed[/yellow]")
+        raise typer.Exit(1)
+
 
 # Register subcommands under jsonsql
 # These imports are at the end to avoid circular dependencies
+_subcommands_registered = False
+
+
+def _completing_other_command() -> bool:
+    """Check whether shell completion is running for a command outside jsonsql."""
+    if not os.environ.get("_IPTVPORTAL_COMPLETE"):
+        return False
+    return "jsonsql" not in os.environ.get("COMP_WORDS", "").split()
+
+
 def _register_subcommands() -> None:
-    """Register API subcommands under jsonsql."""
+    """
+    Register API subcommands under jsonsql.
+
+    Safe to call more than once. When the shell is completing a command
+    outside the jsonsql group, the subcommand modules are not imported.
+    """
+    global _subcommands_registered
+    if _subcommands_registered or _completing_other_command():
+        return
+
     from iptvportal.cli.commands.auth import auth_command
     from iptvportal.cli.commands.schema import schema_app
     from iptvportal.cli.commands.sql import sql_app
@@ -626,6 +679,7 @@ def _register_subcommands() -> None:
     )
     jsonsql_app.add_typer(sql_app, name="sql")
     jsonsql_app.add_typer(schema_app, name="schema")
+    _subcommands_registered = True
 
 
 # Register subcommands when module is imported
@@ -1,19 +1,59 @@
 """Schema management CLI commands."""
 
-import json
+import re
 from pathlib import Path
+from typing import Any
 
+import orjson
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from iptvportal.cli.utils import load_config
 from iptvportal.core.client import IPTVPortalClient
-from iptvportal.schema import SchemaLoader, TableSchema
+from iptvportal.schema import FieldType, SchemaLoader, TableSchema
 
 console = Console()
 schema_app = typer.Typer(name="schema", help="Manage table schemas")
 
+FROM_TABLE_PATTERN = re.compile(r"\bFROM\s+([A-Za-z_][\w.]*)", re.IGNORECASE)
+LIMIT_PATTERN = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+VALID_FIELD_TYPES = frozenset(field_type.value for field_type in FieldType)
+
+
+def _write_schema_file(schema_dict: dict[str, Any], output_path: str, format: str) -> str:
+    """
+    Write a schema dict as JSON or YAML and return the path actually written.
+
+    Falls back to JSON when PyYAML is not installed.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    if format != "json":
+        try:
+            import yaml
+        except ImportError:
+            console.print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
+            output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
+        else:
+            # Dump straight to UTF-8 bytes and write them in one call
+            Path(output_path).write_bytes(
+                yaml.dump(
+                    schema_dict,
+                    Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+                    encoding="utf-8",
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            )
+            return output_path
+
+    Path(output_path).write_bytes(
+        orjson.dumps(schema_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
+    return output_path
+
 
 @schema_app.command(name="show")
 def show_command(
@@ -52,20 +92,14 @@ def show_command(
                 table_display.add_column("Defined Fields", style="blue")
                 table_display.add_column("Type", style="yellow")
 
-                for table_name in sorted(tables):
-                    schema = client.schema_registry.get(table_name)
-                    schema_type = (
-                        "Auto-generated"
-                        if not schema.fields
-                        or all(f.description == "Auto-generated field" for f in schema.fields.values())
-                        else "Predefined"
-                    )
-
+                for table_name, total_fields, defined_fields, is_auto in sorted(
+                    client.schema_registry.list_tables_metadata()
+                ):
                     table_display.add_row(
                         table_name,
-                        str(schema.total_fields or len(schema.fields)),
-                        str(len(schema.fields)),
-                        schema_type,
+                        str(total_fields or defined_fields),
+                        str(defined_fields),
+                        "Auto-generated" if is_auto else "Predefined",
                     )
 
                 console.print(table_display)
@@ -73,7 +107,8 @@ def show_command(
                 return
 
             # Show specific table schema
-            if not client.schema_registry.has(table):
+            schema = client.schema_registry.get(table)
+            if schema is None:
                 console.print(f"[yellow]Schema for table '{table}' not found[/yellow]")
                 console.print("\n[dim]Generate it with:[/dim]")
                 console.print(
@@ -81,8 +116,6 @@ def show_command(
                 )
                 raise typer.Exit(1)
 
-            schema = client.schema_registry.get(table)
-
             console.print(f"\n[bold cyan]Schema for table: {table}[/bold cyan]\n")
 
             # Schema metadata
@@ -110,8 +143,7 @@ def show_command(
                 fields_table.add_column("Python Name", style="blue")
                 fields_table.add_column("Description", style="dim")
 
-                for pos in sorted(schema.fields.keys()):
-                    field = schema.fields[pos]
+                for pos, field in schema.fields.items():
                     fields_table.add_row(
                         str(pos),
                         field.name,
@@ -173,27 +205,19 @@ def from_sql_command(
         settings = load_config(config_file)
 
         # Extract table name from query (simple parsing)
-        query_upper = query.upper()
-        if "FROM" not in query_upper:
+        match = FROM_TABLE_PATTERN.search(query)
+        if not match:
             console.print("[red]Error: Could not extract table name from query[/red]")
             console.print("[dim]Query must contain FROM clause[/dim]")
             raise typer.Exit(1)
 
-        # Simple table name extraction
-        parts = query_upper.split("FROM")[1].split()
-        if not parts:
-            console.print("[red]Error: Could not extract table name[/red]")
-            raise typer.Exit(1)
-
-        table_name = parts[0].strip().lower()
-        # Remove any trailing clauses
-        table_name = table_name.split()[0].strip(";,")
+        table_name = match.group(1).lower()
 
         console.print(f"\n[cyan]Generating schema for table: {table_name}[/cyan]")
         console.print(f"[dim]Executing query with LIMIT {limit}...[/dim]\n")
 
         # Add LIMIT to query if not present
-        if "LIMIT" not in query_upper:
+        if not LIMIT_PATTERN.search(query):
             query = f"{query.rstrip(';')} LIMIT {limit}"
 
         with IPTVPortalClient(settings) as client:
@@ -204,9 +228,7 @@ def from_sql_command(
             jsonsql = transpiler.transpile(query)
 
             # Determine method from transpiled result
-            method = jsonsql.get("_method", "select")
-            if "_method" in jsonsql:
-                del jsonsql["_method"]
+            method = jsonsql.pop("_method", "select")
 
             # Execute query
             from iptvportal.cli.utils import build_jsonrpc_request
@@ -287,26 +309,7 @@ def from_sql_command(
                 # Convert schema to dict
                 schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-                # Ensure output directory exists
-                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-                # Write to file
-                if format == "json":
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
-                else:  # yaml
-                    try:
-                        import yaml
-
-                        with open(output_path, "w") as f:
-                            yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                    except ImportError:
-                        console.print(
-                            "[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]"
-                        )
-                        output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                        with open(output_path, "w") as f:
-                            json.dump(schema_dict, f, indent=2)
+                output_path = _write_schema_file(schema_dict, output_path, format)
 
                 console.print(f"[green]✓ Schema saved to: {output_path}[/green]\n")
 
@@ -336,36 +339,18 @@ def export_command(
         settings = load_config(config_file)
 
         with IPTVPortalClient(settings) as client:
-            if not client.schema_registry.has(table_name):
+            schema = client.schema_registry.get(table_name)
+            if schema is None:
                 console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
                 raise typer.Exit(1)
 
-            schema = client.schema_registry.get(table_name)
-
             # Determine output path
             output_path = output or f"config/{table_name}-schema.{format}"
 
             # Convert schema to dict
             schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to file
-            if format == "json":
-                with open(output_path, "w") as f:
-                    json.dump(schema_dict, f, indent=2)
-            else:  # yaml
-                try:
-                    import yaml
-
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    console.print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
-                    output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
+            output_path = _write_schema_file(schema_dict, output_path, format)
 
             console.print(
                 f"[green]✓ Schema for '{table_name}' exported to: {output_path}[/green]\n"
@@ -454,23 +439,9 @@ def validate_command(file_path: str = typer.Argument(..., help="Schema file to v
         for table_name in tables:
             schema = registry.get(table_name)
 
-            # Check for duplicate positions
-            positions = list(schema.fields.keys())
-            if len(positions) != len(set(positions)):
-                errors.append(f"{table_name}: Duplicate field positions detected")
-
             # Check for invalid field types
-            for _pos, field in schema.fields.items():
-                if field.field_type.value not in [
-                    "integer",
-                    "string",
-                    "boolean",
-                    "float",
-                    "datetime",
-                    "date",
-                    "json",
-                    "unknown",
-                ]:
+            for field in schema.fields.values():
+                if field.field_type.value not in VALID_FIELD_TYPES:
                     errors.append(
                         f"{table_name}.{field.name}: Invalid field type '{field.field_type.value}'"
                     )
@@ -553,19 +524,13 @@ def introspect_command(
         
         if from_sql:
             # Extract table name from SQL query
-            query_upper = from_sql.upper()
-            if "FROM" not in query_upper:
+            match = FROM_TABLE_PATTERN.search(from_sql)
+            if not match:
                 console.print("[red]Error: Could not extract table name from SQL query[/red]")
                 console.print("[dim]Query must contain FROM clause[/dim]")
                 raise typer.Exit(1)
-            
-            parts = query_upper.split("FROM")[1].split()
-            if not parts:
-                console.print("[red]Error: Could not extract table name[/red]")
-                raise typer.Exit(1)
-            
-            resolved_table_name = parts[0].strip().lower()
-            resolved_table_name = resolved_table_name.split()[0].strip(";,")
+
+            resolved_table_name = match.group(1).lower()
         
         if not resolved_table_name:
             console.print("[red]Error: Table name is required[/red]")
@@ -734,7 +699,7 @@ def introspect_command(
                             cache_data = database.fetch_rows(resolved_table_name, limit=sample_size)
                             
                             if cache_data:
-                                field_names = [schema.fields[i].name for i in sorted(schema.fields.keys())]
+                                field_names = [field.name for field in schema.fields.values()]
                                 cache_analysis = analyzer.analyze_sample(cache_data, field_names)
                                 
                                 # Update schema metadata with cache analysis
@@ -793,8 +758,7 @@ def introspect_command(
         fields_table.add_column("Type", style="green")
         fields_table.add_column("Description", style="dim")
 
-        for pos in sorted(schema.fields.keys()):
-            field = schema.fields[pos]
+        for pos, field in schema.fields.items():
             fields_table.add_row(
                 str(pos), field.name, field.field_type.value, field.description or "-"
             )
@@ -882,24 +846,7 @@ def introspect_command(
             # Convert schema to dict
             schema_dict = {"schemas": {resolved_table_name: schema.to_dict()}}
 
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to file
-            if format == "json":
-                with open(output_path, "w") as f:
-                    json.dump(schema_dict, f, indent=2)
-            else:  # yaml
-                try:
-                    import yaml
-
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    console.print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
-                    output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
+            output_path = _write_schema_file(schema_dict, output_path, format)
 
             console.print(f"[green]✓ Schema saved to: {output_path}[/green]\n")
         else:
@@ -921,6 +868,12 @@ def validate_mapping_command(
         ..., "--mappings", "-m", help="Field mappings to validate (e.g., '0:id,1:username,2:email')"
     ),
     sample_size: int = typer.Option(1000, "--sample-size", "-s", help="Sample size for validation"),
+    batch_size: int = typer.Option(
+        50, "--batch-size", min=1, help="Number of columns fetched per validation query"
+    ),
+    concurrency: int = typer.Option(
+        16, "--concurrency", min=1, help="Number of queries to run in parallel"
+    ),
     save: bool = typer.Option(False, "--save", help="Save validation results to schema"),
     output: str | None = typer.Option(None, "--output", "-o", help="Output file path"),
     config_file: str | None = typer.Option(None, "--config", "-c", help="Config file path"),
@@ -973,13 +926,18 @@ def validate_mapping_command(
         async def do_validation():
             async with AsyncIPTVPortalClient(settings) as client:
                 validator = RemoteFieldValidator(client)
-                return await validator.validate_table_schema(
+                results = await validator.validate_table_schema_batch(
                     table_name=table_name,
                     field_mappings=field_mappings,
                     sample_size=sample_size,
+                    batch_size=batch_size,
+                    concurrency=concurrency,
                 )
+                # The client already loaded the configured schemas; keep its
+                # registry so saving does not need a second client
+                return results, client.schema_registry
 
-        results = asyncio.run(do_validation())
+        results, registry = asyncio.run(do_validation())
 
         # Display results
         console.print("[bold]Validation Results:[/bold]\n")
@@ -1045,61 +1003,50 @@ def validate_mapping_command(
         # Save results if requested
         if save or output:
             # Load or create schema
-            with IPTVPortalClient(settings) as client:
-                if client.schema_registry.has(table_name):
-                    schema = client.schema_registry.get(table_name)
-                else:
-                    # Create minimal schema
-                    from iptvportal.schema import FieldDefinition, FieldType, TableSchema
-
-                    fields = {}
-                    for position, col_name in field_mappings.items():
-                        result = results[position]
-                        if "error" not in result:
-                            # Infer field type from dtype
-                            dtype_str = result["dtype"]
-                            validator_inst = RemoteFieldValidator(None)  # Just for dtype inference
-                            field_type_str = validator_inst.infer_field_type_from_dtype(dtype_str)
-                            field_type = FieldType(field_type_str)
-
-                            fields[position] = FieldDefinition(
-                                name=col_name,
-                                position=position,
-                                remote_name=col_name,
-                                field_type=field_type,
-                                remote_mapping=result,
-                            )
-
-                    schema = TableSchema(
-                        table_name=table_name,
-                        fields=fields,
-                        total_fields=len(fields),
-                    )
-
-                # Update remote_mapping for each field
-                for position, result in results.items():
-                    if position in schema.fields and "error" not in result:
-                        schema.fields[position].remote_mapping = result
-
-                # Save schema
-                output_path = output or f"config/{table_name}-validated-schema.yaml"
-                schema_dict = {"schemas": {table_name: schema.to_dict()}}
+            schema = registry.get(table_name)
+            if schema is None:
+                # Create minimal schema
+                from iptvportal.schema import FieldDefinition, FieldType, TableSchema
+
+                fields = {}
+                for position, col_name in field_mappings.items():
+                    result = results[position]
+                    if "error" not in result:
+                        # Infer field type from dtype
+                        dtype_str = result["dtype"]
+                        field_type_str = RemoteFieldValidator.infer_field_type_from_dtype(
+                            dtype_str
+                        )
+                        field_type = FieldType(field_type_str)
+
+                        fields[position] = FieldDefinition(
+                            name=col_name,
+                            position=position,
+                            remote_name=col_name,
+                            field_type=field_type,
+                            remote_mapping=result,
+                        )
 
-                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                schema = TableSchema(
+                    table_name=table_name,
+                    fields=fields,
+                    total_fields=len(fields),
+                )
 
-                try:
-                    import yaml
+            # Update remote_mapping for each field
+            for position, result in results.items():
+                if position in schema.fields and "error" not in result:
+                    schema.fields[position].remote_mapping = result
 
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    import json
+            # Save schema
+            output_path = output or f"config/{table_name}-validated-schema.yaml"
+            schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-                    output_path = output_path.replace(".yaml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
+            # A .json --output is written as JSON; anything else stays YAML
+            output_format = "json" if output_path.endswith(".json") else "yaml"
+            output_path = _write_schema_file(schema_dict, output_path, output_format)
 
-                console.print(f"[green]✓ Validated schema saved to: {output_path}[/green]\n")
+            console.print(f"[green]✓ Validated schema saved to: {output_path}[/green]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -1135,7 +1082,8 @@ def generate_models_command(
         iptvportal schema generate-models schemas.yaml --no-relationships
     """
     try:
-        if not Path(schema_file).exists():
+        schema_path = Path(schema_file)
+        if not schema_path.exists():
             console.print(f"[red]File not found: {schema_file}[/red]")
             raise typer.Exit(1)
 
@@ -1144,8 +1092,8 @@ def generate_models_command(
         # Generate models
         from iptvportal.schema.codegen import ORMGenerator
 
-        results = ORMGenerator.load_and_generate(
-            schema_path=schema_file,
+        generator = ORMGenerator(SchemaLoader.from_yaml(schema_path))
+        results = generator.generate_model_files(
             output_format=format,
             output_dir=Path(output_dir),
             include_relationships=relationships,
@@ -1154,22 +1102,17 @@ def generate_models_command(
         # Display results
         console.print(f"[green]✓ Generated {len(results)} model(s):[/green]\n")
 
-        for table_name, _code in results.items():
-            # Get class name from code
-            class_name = table_name.replace("_", " ").title().replace(" ", "")
-            file_name = f"{class_name.lower()}.py"
-
-            console.print(f"  • {class_name} → {output_dir}/{file_name}")
+        for model in results.values():
+            console.print(f"  • {model.class_name} → {output_dir}/{model.file_name}")
 
         console.print(f"\n[green]✓ Models saved to: {output_dir}/[/green]\n")
 
         # Show a preview of the first model
         if results:
-            first_table = list(results.keys())[0]
-            first_code = results[first_table]
+            first_code = next(iter(results.values())).code
 
             console.print("[bold]Preview (first model):[/bold]\n")
-            console.print("[dim]" + "\n".join(first_code.split("\n")[:20]) + "[/dim]")
+            console.print("[dim]" + "\n".join(first_code.split("\n", 20)[:20]) + "[/dim]")
             console.print("[dim]...[/dim]\n")
 
     except Exception as e:
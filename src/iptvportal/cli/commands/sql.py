@@ -1,19 +1,38 @@
 """SQL subapp for executing SQL queries via transpiler."""
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
-from iptvportal.cli.core.editor import open_sql_editor
-from iptvportal.cli.formatters import (
-    display_dry_run,
-    display_request_and_result,
-    display_result,
-)
-from iptvportal.cli.utils import execute_query
 from iptvportal.exceptions import IPTVPortalError
-from iptvportal.jsonsql import SQLTranspiler
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from iptvportal.jsonsql import SQLTranspiler
+
+# JSONSQL keys that mark a FROM query as a select
+_SELECT_KEYS = frozenset({"data", "where", "order_by", "limit"})
+
+
+# This module is imported whenever the jsonsql group registers its subcommands,
+# so the console, editor, formatters and transpiler are set up on first use.
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _transpiler() -> "SQLTranspiler":
+    """Return the shared transpiler; it holds no per-query state."""
+    from iptvportal.jsonsql import SQLTranspiler
+
+    return SQLTranspiler()
+
 
 sql_app = typer.Typer(
     name="sql",
@@ -108,6 +127,7 @@ def sql_main(
     if ctx.invoked_subcommand is not None:
         return
 
+    console = _console()
     try:
         sql_query: str | None = None
 
@@ -115,6 +135,8 @@ def sql_main(
         if edit:
             if query:
                 console.print("[yellow]Warning: --query will be ignored when using --edit[/yellow]")
+            from iptvportal.cli.core.editor import open_sql_editor
+
             sql_query = open_sql_editor()
         elif query:
             sql_query = query
@@ -127,25 +149,31 @@ def sql_main(
 
         # Transpile SQL to JSONSQL
         debug_logger.log("transpiling", "Transpiling SQL to JSONSQL...", "Transpilation")
-        transpiler = SQLTranspiler()
-        result = transpiler.transpile(sql_query)
+        result = _transpiler().transpile(sql_query)
         debug_logger.log("transpiled", result, "Transpiled JSONSQL")
 
         # Determine method from transpiled result
-        method = result.get("_method", "select")  # Default to select if not specified
-        if "_method" in result:
-            del result["_method"]
+        method = result.pop("_method", "select")  # Default to select if not specified
 
         # Infer method from JSONSQL structure if _method not present
-        if "into" in result:
+        keys = result.keys()
+        if "into" in keys:
             method = "insert"
-        elif "table" in result and "set" in result:
+        elif "table" in keys and "set" in keys:
             method = "update"
-        elif "from" in result and any(k in result for k in ["data", "where", "order_by", "limit"]):
+        elif "from" in keys and not keys.isdisjoint(_SELECT_KEYS):
             method = "select"
 
         debug_logger.log("method", method, "Detected Method")
 
+        from iptvportal.cli.formatters import (
+            STREAM_THRESHOLD,
+            display_dry_run,
+            display_request_and_result,
+            display_result,
+            display_result_stream,
+        )
+
         if dry_run:
             # Show transpiled query without executing
             display_dry_run(result, method, sql=sql_query, format_type=output_format)
@@ -154,6 +182,8 @@ def sql_main(
             debug_logger.log("executing", f"Executing {method} query...", "Execution")
 
             # Execute query with optional schema mapping
+            from iptvportal.cli.utils import execute_query
+
             query_result = execute_query(
                 method,
                 result,
@@ -169,6 +199,13 @@ def sql_main(
                 display_request_and_result(
                     result, method, query_result, sql=sql_query, format_type=output_format
                 )
+            elif (
+                output_format != "table"
+                and isinstance(query_result, list)
+                and len(query_result) > STREAM_THRESHOLD
+            ):
+                # Large dumps: write rows incrementally
+                display_result_stream(query_result, output_format)
             else:
                 # Show only result
                 display_result(query_result, output_format)
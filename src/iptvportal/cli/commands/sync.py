@@ -1,15 +1,37 @@
 """Sync cache management commands."""
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+if TYPE_CHECKING:
+    from iptvportal.jsonsql import SQLTranspiler
+
 app = typer.Typer(help="Sync cache management")
 console = Console()
 
 
+@lru_cache(maxsize=1)
+def _transpiler() -> "SQLTranspiler":
+    """Return the shared transpiler; it holds no per-query state."""
+    from iptvportal.jsonsql import SQLTranspiler
+
+    return SQLTranspiler()
+
+
+@lru_cache(maxsize=256)
+def _transpile(sql: str) -> dict[str, Any]:
+    """Transpile a metadata query, reusing the result for repeated SQL.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    return _transpiler().transpile(sql)
+
+
 def get_database(cache_db_path: str | None = None):
     """Get sync database with minimal configuration."""
 
@@ -123,36 +145,81 @@ def register(
 
         settings = load_config(config_file)
 
+        import asyncio
+
+        schemas = {}
+        queries: list[dict[str, Any]] = []
+        # Per table: batch positions of its sample and stats queries,
+        # or the error raised while building them
+        query_slots: dict[str, tuple[int, int] | Exception] = {}
+
+        def add_query(sql: str) -> int:
+            queries.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": len(queries) + 1,
+                    "method": "select",
+                    "params": _transpile(sql),
+                }
+            )
+            return len(queries) - 1
+
+        for table_name in tables_to_register:
+            schema = registry.get(table_name)
+            if schema is None:
+                errors.append((table_name, "Schema not found in registry"))
+                continue
+            schemas[table_name] = schema
+
+            try:
+                has_id = any(getattr(f, "name", "").lower() == "id" for f in schema.fields.values())
+                # Row count and id range come back from one aggregate query
+                stats_sql = (
+                    "SELECT COUNT(*) as row_count, MIN(id) as min_id, MAX(id) as max_id"
+                    if has_id
+                    else "SELECT COUNT(*) as row_count"
+                )
+                query_slots[table_name] = (
+                    add_query(f"SELECT * FROM {table_name} LIMIT 1"),
+                    add_query(f"{stats_sql} FROM {table_name}"),
+                )
+            except Exception as e:
+                query_slots[table_name] = e
+
+        def unwrap(response: Any) -> Any:
+            if isinstance(response, Exception):
+                raise response
+            return response
+
         async def register_with_metadata():
             async with AsyncIPTVPortalClient(settings) as client:
                 with console.status(f"Registering {len(tables_to_register)} table(s)..."):
-                    for table_name in tables_to_register:
-                        try:
-                            schema = registry.get(table_name)
-                            if schema is None:
-                                errors.append((table_name, "Schema not found in registry"))
-                                continue
-
-                            # Fetch metadata and schema from remote table
-                            try:
-                                # Import introspector for schema introspection
-                                from iptvportal.introspector import SchemaIntrospector
+                    # Metadata for every table in one round trip
+                    try:
+                        responses = await client.execute_rpc_batch(queries)
+                    except Exception:
+                        # Batch rejected as a whole: run the same queries concurrently,
+                        # bounded so large registrations do not flood the server
+                        semaphore = asyncio.Semaphore(settings.max_concurrent_queries)
 
-                                SchemaIntrospector(client)
+                        async def execute_one(query: dict[str, Any]) -> Any:
+                            async with semaphore:
+                                return await client.execute(query)
 
-                                # Get sample row to determine total fields
-                                sample_sql = f"SELECT * FROM {table_name} LIMIT 1"
-                                from iptvportal.jsonsql.transpiler import SQLTranspiler
+                        responses = await asyncio.gather(
+                            *(execute_one(query) for query in queries),
+                            return_exceptions=True,
+                        )
 
-                                transpiler = SQLTranspiler()
-                                sample_jsonsql = transpiler.transpile(sample_sql)
-                                sample_query = {
-                                    "jsonrpc": "2.0",
-                                    "id": 1,
-                                    "method": "select",
-                                    "params": sample_jsonsql,
-                                }
-                                sample_result = await client.execute(sample_query)
+                    for table_name, schema in schemas.items():
+                        try:
+                            # Apply metadata fetched from the remote table
+                            try:
+                                slots = query_slots[table_name]
+                                if isinstance(slots, Exception):
+                                    raise slots
+                                sample_slot, stats_slot = slots
+                                sample_result = unwrap(responses[sample_slot])
 
                                 if sample_result and len(sample_result) > 0:
                                     sample_row = sample_result[0]
@@ -164,40 +231,13 @@ def register(
                                         f"📊 Remote schema for {table_name}: {total_fields} total fields"
                                     )
 
-                                    # Get row count
-                                    count_sql = f"SELECT COUNT(*) as row_count FROM {table_name}"
-                                    count_jsonsql = transpiler.transpile(count_sql)
-                                    count_query = {
-                                        "jsonrpc": "2.0",
-                                        "id": 2,
-                                        "method": "select",
-                                        "params": count_jsonsql,
-                                    }
-                                    count_result = await client.execute(count_query)
-                                    row_count = (
-                                        count_result[0][0]
-                                        if count_result and count_result[0]
-                                        else 0
-                                    )
-
-                                    # Get min/max id if id field exists
+                                    # Row count, plus min/max id if id field exists
+                                    stats_result = unwrap(responses[stats_slot])
+                                    stats_row = stats_result[0] if stats_result else None
+                                    row_count = stats_row[0] if stats_row else 0
                                     min_id = max_id = None
-                                    if any(
-                                        getattr(f, "name", "").lower() == "id"
-                                        for f in schema.fields.values()
-                                    ):
-                                        minmax_sql = f"SELECT MIN(id) as min_id, MAX(id) as max_id FROM {table_name}"
-                                        minmax_jsonsql = transpiler.transpile(minmax_sql)
-                                        minmax_query = {
-                                            "jsonrpc": "2.0",
-                                            "id": 3,
-                                            "method": "select",
-                                            "params": minmax_jsonsql,
-                                        }
-                                        minmax_result = await client.execute(minmax_query)
-                                        if minmax_result and minmax_result[0]:
-                                            min_id = minmax_result[0][0]
-                                            max_id = minmax_result[0][1]
+                                    if stats_row and len(stats_row) == 3:
+                                        min_id, max_id = stats_row[1], stats_row[2]
 
                                     # Update schema metadata
                                     if schema.metadata is None:
@@ -240,8 +280,6 @@ def register(
                             errors.append((table_name, str(e)))
 
         # Run async registration
-        import asyncio
-
         asyncio.run(register_with_metadata())
 
         # Display results
@@ -6,9 +6,28 @@ from rich.console import Console
 from iptvportal.cli.formatters import format_json, format_yaml
 from iptvportal.jsonsql import SQLTranspiler
 from iptvportal.jsonsql.exceptions import TranspilerError
+from iptvportal.jsonsql.transpiler import split_sql_statements
 
 console = Console()
 
+# Size of each read when streaming SQL from a file
+READ_CHUNK_SIZE = 65536
+
+
+def _print_transpiled(transpiler: SQLTranspiler, sql: str, format: str) -> None:
+    """Transpile one statement and print it alongside its JSONSQL."""
+    jsonsql = transpiler.transpile(sql)
+
+    console.print("\n[bold cyan]SQL Query:[/bold cyan]")
+    console.print(sql)
+    console.print()
+
+    console.print("[bold cyan]Transpiled JSONSQL:[/bold cyan]")
+    if format == "yaml":
+        format_yaml(jsonsql)
+    else:
+        format_json(jsonsql)
+
 
 def transpile_command(
     sql: str = typer.Argument(..., help="SQL query to transpile"),
@@ -22,26 +41,20 @@ def transpile_command(
         iptvportal jsonsql transpile "SELECT * FROM subscriber"
         iptvportal jsonsql transpile "SELECT * FROM subscriber WHERE disabled = false" --format yaml
         iptvportal jsonsql transpile --file query.sql
+
+    Files may contain several statements separated by semicolons.
     """
     try:
-        # Read from file if specified
-        if file:
-            with open(file) as f:
-                sql = f.read()
-
-        # Transpile SQL to JSONSQL
         transpiler = SQLTranspiler()
-        jsonsql = transpiler.transpile(sql)
 
-        console.print("\n[bold cyan]SQL Query:[/bold cyan]")
-        console.print(sql)
-        console.print()
-
-        console.print("[bold cyan]Transpiled JSONSQL:[/bold cyan]")
-        if format == "yaml":
-            format_yaml(jsonsql)
+        if file:
+            # Read the file in chunks and transpile each statement as it completes
+            with open(file) as f:
+                chunks = iter(lambda: f.read(READ_CHUNK_SIZE), "")
+                for statement in split_sql_statements(chunks):
+                    _print_transpiled(transpiler, statement, format)
         else:
-            format_json(jsonsql)
+            _print_transpiled(transpiler, sql, format)
 
     except FileNotFoundError:
         console.print(f"[bold red]Error:[/bold red] File not found: {file}")
@@ -4,7 +4,9 @@ import contextlib
 import os
 import subprocess
 import tempfile
+from typing import Any
 
+import orjson
 from rich.console import Console
 
 console = Console()
@@ -35,37 +37,22 @@ def get_editor() -> str:
     return editor
 
 
-def open_editor(
-    initial_content: str | None = None,
-    suffix: str = ".sql",
-    prompt: str | None = None,
-) -> str:
-    """
-    Open editor for user input.
-
-    Args:
-        initial_content: Initial content to populate in editor
-        suffix: File extension for temp file
-        prompt: Optional prompt to display before opening editor
-
-    Returns:
-        Content from editor
-
-    Raises:
-        RuntimeError: If editor fails or returns empty content
-    """
+def _edit_bytes(
+    initial_content: str | bytes | None,
+    suffix: str,
+    prompt: str | None,
+) -> bytes:
+    """Run the editor on a temp file and return its raw, stripped content."""
     editor = get_editor()
 
     if prompt:
         console.print(prompt)
 
+    if isinstance(initial_content, str):
+        initial_content = initial_content.encode("utf-8")
+
     # Create temporary file
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=suffix,
-        delete=False,
-        encoding="utf-8",
-    ) as tmp_file:
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
         if initial_content:
             tmp_file.write(initial_content)
         tmp_path = tmp_file.name
@@ -75,7 +62,7 @@ def open_editor(
         subprocess.run([editor, tmp_path], check=True)
 
         # Read content
-        with open(tmp_path, encoding="utf-8") as f:
+        with open(tmp_path, "rb") as f:
             content = f.read().strip()
 
         if not content:
@@ -89,6 +76,29 @@ def open_editor(
             os.unlink(tmp_path)
 
 
+def open_editor(
+    initial_content: str | bytes | None = None,
+    suffix: str = ".sql",
+    prompt: str | None = None,
+) -> str:
+    """
+    Open editor for user input.
+
+    Args:
+        initial_content: Initial content to populate in editor (bytes are
+            written as-is, str is encoded as UTF-8)
+        suffix: File extension for temp file
+        prompt: Optional prompt to display before opening editor
+
+    Returns:
+        Content from editor
+
+    Raises:
+        RuntimeError: If editor fails or returns empty content
+    """
+    return _edit_bytes(initial_content, suffix, prompt).decode("utf-8")
+
+
 def open_sql_editor(initial_sql: str | None = None) -> str:
     """
     Open editor for SQL query input.
@@ -111,21 +121,28 @@ def open_sql_editor(initial_sql: str | None = None) -> str:
     )
 
 
-def open_jsonsql_editor(initial_json: str | None = None) -> str:
+def open_jsonsql_editor(
+    initial_json: str | bytes | None = None, *, return_parsed: bool = False
+) -> Any:
     """
     Open editor for JSONSQL query input.
 
     Args:
         initial_json: Initial JSONSQL to populate
+        return_parsed: Return the decoded JSON object instead of the text;
+            the file bytes go straight to orjson without a str round trip
 
     Returns:
-        JSONSQL query from editor
+        JSONSQL query from editor, parsed if return_parsed is set
     """
     prompt_text = (
         "[cyan]Opening editor for JSONSQL query...[/cyan]\n"
         "[dim]Save and exit to execute the query[/dim]"
     )
 
+    if return_parsed:
+        return orjson.loads(_edit_bytes(initial_json, ".json", prompt_text))
+
     return open_editor(
         initial_content=initial_json,
         suffix=".json",
@@ -4,7 +4,7 @@ Includes helper `_sanitize_data` that masks secrets (pydantic SecretStr) in
 nested data structures for safe debug output and file persistence.
 """
 
-import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +13,8 @@ from pydantic import SecretStr
 from rich.console import Console
 from rich.syntax import Syntax
 
+from iptvportal.cli.formatters import dumps_json
+
 console = Console()
 
 
@@ -34,6 +36,19 @@ def _sanitize_data(data: Any) -> Any:
     return data
 
 
+@dataclass(slots=True, frozen=True)
+class LogRecord:
+    """A single logged debug step."""
+
+    step: str
+    data: Any
+    title: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a dict with sanitized data."""
+        return {"step": self.step, "data": _sanitize_data(self.data), "title": self.title}
+
+
 class DebugLogger:
     """Debug logger for CLI operations."""
 
@@ -54,7 +69,7 @@ class DebugLogger:
         self.enabled = enabled
         self.format_type = format_type
         self.output_file = output_file
-        self._logs: list[dict[str, Any]] = []
+        self._logs: list[LogRecord] = []
 
     def log(self, step: str, data: Any, title: str | None = None) -> None:
         """
@@ -69,7 +84,7 @@ class DebugLogger:
             return
 
         # Store for potential file output
-        self._logs.append({"step": step, "data": data, "title": title})
+        self._logs.append(LogRecord(step, data, title))
 
         # Display sanitized representation based on selected format
         if self.format_type == "text":
@@ -94,7 +109,7 @@ class DebugLogger:
                 console.print(sanitized)
         elif isinstance(sanitized, (dict, list)):
             # For structured data, show as formatted JSON
-            json_str = json.dumps(sanitized, indent=2, ensure_ascii=False)
+            json_str = dumps_json(sanitized)
             syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
             console.print(syntax)
         else:
@@ -105,7 +120,7 @@ class DebugLogger:
         log_entry = {"step": step, "data": _sanitize_data(data)}
         if title:
             log_entry["title"] = title
-        json_str = json.dumps(log_entry, indent=2, ensure_ascii=False)
+        json_str = dumps_json(log_entry)
         console.print(json_str)
 
     def _display_yaml(self, step: str, data: Any, title: str | None = None) -> None:
@@ -126,18 +141,18 @@ class DebugLogger:
 
         with open(output_path, "w", encoding="utf-8") as f:
             if self.format_type == "json":
-                sanitized = [{**log, "data": _sanitize_data(log["data"])} for log in self._logs]
-                json.dump(sanitized, f, indent=2, ensure_ascii=False)
+                sanitized = [record.to_dict() for record in self._logs]
+                f.write(dumps_json(sanitized))
             elif self.format_type == "yaml":
-                sanitized = [{**log, "data": _sanitize_data(log["data"])} for log in self._logs]
+                sanitized = [record.to_dict() for record in self._logs]
                 yaml.dump(sanitized, f, allow_unicode=True, default_flow_style=False)
             else:
                 # Text format
-                for log in self._logs:
-                    f.write(f"\n=== {log.get('title', log['step'])} ===\n")
-                    data_to_write = _sanitize_data(log["data"])
+                for record in self._logs:
+                    f.write(f"\n=== {record.title or record.step} ===\n")
+                    data_to_write = _sanitize_data(record.data)
                     if isinstance(data_to_write, (dict, list)):
-                        f.write(json.dumps(data_to_write, indent=2, ensure_ascii=False))
+                        f.write(dumps_json(data_to_write))
                     else:
                         f.write(str(data_to_write))
                     f.write("\n")
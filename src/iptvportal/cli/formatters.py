@@ -1,8 +1,10 @@
 """Output formatters for CLI."""
 
-import json
+import sys
+from collections.abc import Iterable
 from typing import Any
 
+import orjson
 import yaml
 from rich.console import Console
 from rich.panel import Panel
@@ -11,6 +13,25 @@ from rich.table import Table
 
 console = Console()
 
+# Row count above which large results are written incrementally
+STREAM_THRESHOLD = 1000
+
+# orjson options matching json.dumps(indent=2); non-str keys become strings
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data as 2-space indented JSON text.
+
+    Args:
+        data: Data to serialize; unsupported types are converted with str()
+
+    Returns:
+        JSON string
+    """
+    return orjson.dumps(data, default=str, option=JSON_OPTIONS).decode()
+
 
 def format_table(data: list[dict[str, Any]], title: str | None = None) -> None:
     """
@@ -48,7 +69,7 @@ def format_json(data: Any, title: str | None = None) -> None:
         data: Data to display
         title: Optional title
     """
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    json_str = dumps_json(data)
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
 
     if title:
@@ -57,6 +78,25 @@ def format_json(data: Any, title: str | None = None) -> None:
         console.print(syntax)
 
 
+def write_json(data: Any) -> None:
+    """
+    Write data as indented JSON to stdout in a single write.
+
+    Args:
+        data: Data to write
+    """
+    payload = orjson.dumps(data, default=str, option=JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(payload.decode())
+    else:
+        # Keep ordering with anything already written through the text layer
+        out.flush()
+        buffer.write(payload)
+        buffer.flush()
+
+
 def format_yaml(data: Any, title: str | None = None) -> None:
     """
     Display data as formatted YAML with syntax highlighting.
@@ -83,7 +123,11 @@ def display_result(result: Any, format_type: str = "table") -> None:
         format_type: Output format (table, json, yaml)
     """
     if format_type == "json":
-        format_json(result)
+        if console.is_terminal:
+            format_json(result)
+        else:
+            # Piped output: skip highlighting and emit the document at once
+            write_json(result)
     elif format_type == "yaml":
         format_yaml(result)
     elif format_type == "table":
@@ -96,6 +140,51 @@ def display_result(result: Any, format_type: str = "table") -> None:
         console.print(f"[red]Unknown format: {format_type}[/red]")
 
 
+def display_result_stream(rows: Iterable[Any], format_type: str = "json") -> None:
+    """
+    Write result rows incrementally instead of rendering one large document.
+
+    JSON output is a single array written row by row; YAML output is one
+    libyaml pass over all rows, emitted straight to stdout. Neither path
+    builds the full serialized string or runs syntax highlighting over it.
+    Table output needs every row to size its columns, so it falls back to
+    display_result.
+
+    Args:
+        rows: Result rows (lists or dicts)
+        format_type: Output format (json, yaml, table)
+    """
+    if format_type == "table":
+        display_result(list(rows), format_type)
+        return
+
+    out = sys.stdout
+
+    if format_type == "yaml":
+        yaml.dump(
+            list(rows),
+            out,
+            Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+            allow_unicode=True,
+            default_flow_style=False,
+        )
+        out.flush()
+        return
+
+    if format_type != "json":
+        console.print(f"[red]Unknown format: {format_type}[/red]")
+        return
+
+    out.write("[")
+    separator = "\n  "
+    for row in rows:
+        out.write(separator)
+        out.write(orjson.dumps(row, default=str).decode())
+        separator = ",\n  "
+    out.write("\n]\n" if separator != "\n  " else "]\n")
+    out.flush()
+
+
 def display_dry_run(
     jsonsql: dict[str, Any],
     method: str,
@@ -1,18 +1,27 @@
 """CLI utilities and helpers."""
 
-import json
+import sys
+from collections.abc import Iterable, Iterator
+from functools import cache
 from typing import Any
 
 import orjson
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
 from iptvportal.config.settings import IPTVPortalSettings
 from iptvportal.core.client import IPTVPortalClient
+from iptvportal.exceptions import IPTVPortalError
 
 console = Console()
 
+# ANSI styles for the error path, resolved once at import.
+_ERROR_STYLE = "\033[1;31m" if sys.stderr.isatty() else ""
+_HINT_STYLE = "\033[33m" if sys.stderr.isatty() else ""
+_RESET_STYLE = "\033[0m" if sys.stderr.isatty() else ""
+
 
 def load_config(config_file: str | None = None) -> IPTVPortalSettings:
     """
@@ -48,6 +57,7 @@ def load_config(config_file: str | None = None) -> IPTVPortalSettings:
     # Session management
     settings_kwargs["session_cache"] = bool(conf.get("core.session_cache", True))
     settings_kwargs["session_ttl"] = int(conf.get("core.session_ttl", 3600))
+    settings_kwargs["session_cache_dir"] = conf.get("core.session_cache_dir")
     
     # Logging
     settings_kwargs["log_level"] = conf.get("core.log_level", "INFO")
@@ -96,6 +106,7 @@ def load_config(config_file: str | None = None) -> IPTVPortalSettings:
     settings_kwargs["auto_sync_on_startup"] = bool(conf.get("sync.auto_sync_on_startup", False))
     settings_kwargs["auto_sync_stale_tables"] = bool(conf.get("sync.auto_sync_stale_tables", True))
     settings_kwargs["max_concurrent_syncs"] = int(conf.get("sync.max_concurrent_syncs", 3))
+    settings_kwargs["max_concurrent_queries"] = int(conf.get("sync.max_concurrent_queries", 10))
     
     # Maintenance
     settings_kwargs["auto_vacuum_enabled"] = bool(conf.get("sync.auto_vacuum_enabled", True))
@@ -106,12 +117,28 @@ def load_config(config_file: str | None = None) -> IPTVPortalSettings:
     return IPTVPortalSettings(**settings_kwargs)
 
 
-def parse_json_param(param: str | None) -> Any:
+# Expected shapes of the JSON-valued query options, keyed by option kind.
+JSON_PARAM_TYPES: dict[str, Any] = {
+    "where": dict[str, Any],
+    "set": dict[str, Any],
+    "values": list[list[Any]],
+}
+
+
+@cache
+def _json_param_adapter(kind: str) -> TypeAdapter[Any]:
+    """Build the validator for a JSON option kind once and reuse it."""
+    return TypeAdapter(JSON_PARAM_TYPES[kind])
+
+
+def parse_json_param(param: str | None, kind: str | None = None) -> Any:
     """
     Parse JSON string parameter.
 
     Args:
         param: JSON string
+        kind: Optional option kind from JSON_PARAM_TYPES; when given, the
+            value is parsed and validated against that shape in one pass
 
     Returns:
         Parsed Python object
@@ -120,7 +147,9 @@ def parse_json_param(param: str | None) -> Any:
         return None
 
     try:
-        return orjson.loads(param)
+        if kind is None:
+            return orjson.loads(param)
+        return _json_param_adapter(kind).validate_json(param)
     except Exception as e:
         console.print(f"[red]Error parsing JSON:[/red] {e}")
         raise
@@ -289,6 +318,94 @@ def execute_query(
         return client.execute(request)
 
 
+def execute_batch(
+    operations: Iterable[tuple[str, dict[str, Any]]],
+    config_file: str | None = None,
+    concurrency: int = 1,
+    rpc_batch: bool = False,
+) -> Iterator[tuple[Any, IPTVPortalError | None]]:
+    """
+    Execute several queries over one authenticated connection.
+
+    Config loading, authentication and connection setup happen once for the
+    whole batch instead of once per query.
+
+    Args:
+        operations: (method, params) pairs to execute in order
+        config_file: Optional config file path
+        concurrency: Maximum number of requests in flight. Values above 1 use
+            the async client and pipeline requests with asyncio.gather.
+        rpc_batch: Send all queries as one JSON-RPC batch array in a single
+            HTTP request (takes precedence over concurrency)
+
+    Yields:
+        (result, error) pairs in input order; error is None on success
+    """
+    settings = load_config(config_file)
+
+    if rpc_batch:
+        requests = [
+            build_jsonrpc_request(method, params, request_id)
+            for request_id, (method, params) in enumerate(operations, start=1)
+        ]
+        with IPTVPortalClient(settings) as client:
+            results = client.execute_rpc_batch(requests)
+        for result in results:
+            if isinstance(result, IPTVPortalError):
+                yield None, result
+            else:
+                yield result, None
+        return
+
+    if concurrency > 1:
+        yield from _execute_batch_async(list(operations), settings, concurrency)
+        return
+
+    with IPTVPortalClient(settings) as client:
+        for request_id, (method, params) in enumerate(operations, start=1):
+            try:
+                result = client.execute(build_jsonrpc_request(method, params, request_id))
+            except IPTVPortalError as e:
+                yield None, e
+            else:
+                yield result, None
+
+
+def _execute_batch_async(
+    operations: list[tuple[str, dict[str, Any]]],
+    settings: IPTVPortalSettings,
+    concurrency: int,
+) -> list[tuple[Any, IPTVPortalError | None]]:
+    """Run batch operations concurrently, bounded by a semaphore."""
+    import asyncio
+
+    from iptvportal.core.async_client import AsyncIPTVPortalClient
+
+    async def run() -> list[tuple[Any, IPTVPortalError | None]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with AsyncIPTVPortalClient(settings) as client:
+
+            async def run_one(
+                request_id: int, method: str, params: dict[str, Any]
+            ) -> tuple[Any, IPTVPortalError | None]:
+                async with semaphore:
+                    try:
+                        request = build_jsonrpc_request(method, params, request_id)
+                        return await client.execute(request), None
+                    except IPTVPortalError as e:
+                        return None, e
+
+            return await asyncio.gather(
+                *(
+                    run_one(request_id, method, params)
+                    for request_id, (method, params) in enumerate(operations, start=1)
+                )
+            )
+
+    return asyncio.run(run())
+
+
 def display_json(data: Any, title: str | None = None) -> None:
     """
     Display data as formatted JSON with syntax highlighting.
@@ -297,7 +414,9 @@ def display_json(data: Any, title: str | None = None) -> None:
         data: Data to display
         title: Optional title
     """
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
+    from iptvportal.cli.formatters import dumps_json
+
+    json_str = dumps_json(data)
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
 
     if title:
@@ -317,3 +436,25 @@ def display_error(message: str, exception: Exception | None = None) -> None:
     console.print(f"[bold red]Error:[/bold red] {message}")
     if exception:
         console.print(f"[red]{exception}[/red]")
+
+
+def print_query_error(kind: str, error: BaseException, debug: bool = False) -> None:
+    """
+    Write a failed-command message to stderr.
+
+    Bypasses Rich so a command that is about to exit does not pay for
+    markup parsing and console setup.
+
+    Args:
+        kind: Error prefix, e.g. "Query failed"
+        error: Exception that aborted the command
+        debug: Whether debug output was printed above
+    """
+    if debug:
+        prefix, hint = "\n", "See debug output above for details"
+    else:
+        prefix, hint = "", "Tip: Use --debug flag for detailed error information"
+    sys.stderr.write(
+        f"{prefix}{_ERROR_STYLE}{kind}:{_RESET_STYLE} {error}\n"
+        f"{_HINT_STYLE}{hint}{_RESET_STYLE}\n"
+    )
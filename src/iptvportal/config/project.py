@@ -92,6 +92,7 @@ def _init_dynaconf() -> Dynaconf:
             # Sync validators
             Validator("sync.default_chunk_size", gte=1, default=1000),
             Validator("sync.max_concurrent_syncs", gte=1, default=3),
+            Validator("sync.max_concurrent_queries", gte=1, default=10),
         ],
     )
 
@@ -83,6 +83,11 @@ class IPTVPortalSettings(BaseSettings):
         description="Session ID TTL in seconds (default 1 hour)",
     )
 
+    session_cache_dir: str | None = Field(
+        default=None,
+        description="Directory to persist session_id across processes (disabled when unset)",
+    )
+
     # Logging
     log_level: str = Field(
         default="INFO",
@@ -181,6 +186,10 @@ class IPTVPortalSettings(BaseSettings):
         default=3, description="Maximum number of tables to sync concurrently"
     )
 
+    max_concurrent_queries: int = Field(
+        default=10, ge=1, description="Maximum number of metadata queries run concurrently"
+    )
+
     # ==================== Maintenance ====================
 
     auto_vacuum_enabled: bool = Field(
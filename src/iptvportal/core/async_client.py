@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, TypeVar
 
 import httpx
+import orjson
 
 from iptvportal.config import IPTVPortalSettings
 from iptvportal.core.auth import AsyncAuthManager
@@ -118,6 +119,77 @@ class AsyncIPTVPortalClient:
             raise IPTVPortalError(
                 "Async client not connected. Use 'async with' statement or call connect()."
             )
+        data = await self._post(query)
+
+        # Debug: log response structure if log_requests is enabled
+        if self.settings.log_requests:
+            print(f"Response data type: {type(data)}")
+            print(f"Response data keys: {data.keys() if isinstance(data, dict) else 'N/A'}")
+
+        if "error" in data:
+            error_data = data["error"]
+            # Handle both string and dict error formats
+            if isinstance(error_data, str):
+                raise APIError(error_data)
+            if isinstance(error_data, dict):
+                raise APIError(
+                    error_data.get("message", "API error"),
+                    details=error_data,
+                )
+            raise APIError(f"API error: {error_data}")
+
+        # Check if result key exists
+        if "result" not in data:
+            raise APIError(
+                f"Invalid response format: missing 'result' key. Response keys: {list(data.keys()) if isinstance(data, dict) else type(data)}"
+            )
+
+        return data.get("result")
+
+    async def execute_rpc_batch(self, queries: list[dict[str, Any]]) -> list[Any]:
+        """
+        Send several JSON-RPC requests as one batch array in a single POST.
+
+        Args:
+            queries: JSON-RPC request objects with unique ids
+
+        Returns:
+            One entry per query in input order: the result, or an APIError
+            instance if that request failed
+        """
+        if not self._http_client or not self._session_id:
+            raise IPTVPortalError(
+                "Async client not connected. Use 'async with' statement or call connect()."
+            )
+        if not queries:
+            return []
+
+        data = await self._post(queries)
+        if isinstance(data, dict):
+            # The server rejected the batch as a whole
+            error = data.get("error") or {}
+            if not isinstance(error, dict):
+                error = {"message": str(error)}
+            raise APIError(error.get("message", "Invalid batch response"), details=error)
+
+        responses = {item.get("id"): item for item in data}
+        results: list[Any] = []
+        for query in queries:
+            item = responses.get(query.get("id"))
+            if item is None:
+                results.append(APIError(f"No response for request id {query.get('id')}"))
+            elif "error" in item:
+                error = item["error"]
+                if isinstance(error, dict):
+                    results.append(APIError(error.get("message", "API error"), details=error))
+                else:
+                    results.append(APIError(str(error)))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    async def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload with retries and return the decoded response body."""
         headers = {
             "Iptvportal-Authorization": f"sessionid={self._session_id}",
             "Content-Type": "application/json",
@@ -126,43 +198,19 @@ class AsyncIPTVPortalClient:
         for attempt in range(self.settings.max_retries + 1):
             try:
                 response = await self._http_client.post(
-                    self.settings.api_url, json=query, headers=headers
+                    self.settings.api_url, content=orjson.dumps(payload), headers=headers
                 )
                 response.raise_for_status()
 
                 # Try to parse JSON response
                 try:
-                    data = response.json()
+                    # Parse the raw bytes; avoids decoding large result sets to str first
+                    return orjson.loads(response.content)
                 except Exception as json_error:
                     raise APIError(
                         f"Failed to parse JSON response: {json_error}. "
                         f"Response text: {response.text[:500]}"
                     )
-
-                # Debug: log response structure if log_requests is enabled
-                if self.settings.log_requests:
-                    print(f"Response data type: {type(data)}")
-                    print(f"Response data keys: {data.keys() if isinstance(data, dict) else 'N/A'}")
-
-                if "error" in data:
-                    error_data = data["error"]
-                    # Handle both string and dict error formats
-                    if isinstance(error_data, str):
-                        raise APIError(error_data)
-                    if isinstance(error_data, dict):
-                        raise APIError(
-                            error_data.get("message", "API error"),
-                            details=error_data,
-                        )
-                    raise APIError(f"API error: {error_data}")
-
-                # Check if result key exists
-                if "result" not in data:
-                    raise APIError(
-                        f"Invalid response format: missing 'result' key. Response keys: {list(data.keys()) if isinstance(data, dict) else type(data)}"
-                    )
-
-                return data.get("result")
             except APIError:
                 # Re-raise API errors without wrapping
                 raise
@@ -192,6 +240,10 @@ class AsyncIPTVPortalClient:
                 except Exception:
                     error_msg = f"HTTP {e.response.status_code}: {e}"
 
+                if e.response.status_code == 401:
+                    # Do not hand a rejected session to the next process; a 403
+                    # only denies this request and leaves the session valid
+                    self.auth.invalidate()
                 if 400 <= e.response.status_code < 500:
                     raise APIError(error_msg) from e
                 last_error = APIError(error_msg)
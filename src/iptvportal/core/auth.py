@@ -1,6 +1,10 @@
 """Authentication managers for sync and async clients."""
 
+import hashlib
+import os
 import time
+from contextlib import suppress
+from pathlib import Path
 
 import httpx
 import orjson
@@ -9,6 +13,55 @@ from iptvportal.config import IPTVPortalSettings
 from iptvportal.exceptions import AuthenticationError
 
 
+def _session_cache_file(settings: IPTVPortalSettings) -> Path | None:
+    """Return the on-disk session cache file, or None if persistence is off."""
+    if not settings.session_cache or not settings.session_cache_dir:
+        return None
+    key = hashlib.sha256(f"{settings.auth_url}\0{settings.username}".encode()).hexdigest()
+    return Path(settings.session_cache_dir).expanduser() / f"{key[:16]}.json"
+
+
+def load_persisted_session(settings: IPTVPortalSettings) -> tuple[str, float] | None:
+    """
+    Load a session saved by an earlier process.
+
+    Returns:
+        (session_id, timestamp) if a cached session exists and is within
+        session_ttl, otherwise None
+    """
+    path = _session_cache_file(settings)
+    if path is None:
+        return None
+    try:
+        data = orjson.loads(path.read_bytes())
+        session_id, timestamp = str(data["session_id"]), float(data["timestamp"])
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+    if time.time() - timestamp >= settings.session_ttl:
+        return None
+    return session_id, timestamp
+
+
+def persist_session(settings: IPTVPortalSettings, session_id: str, timestamp: float) -> None:
+    """Save a session so later processes can skip authentication (owner-only file)."""
+    path = _session_cache_file(settings)
+    if path is None:
+        return
+    with suppress(OSError):
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps({"session_id": session_id, "timestamp": timestamp}))
+
+
+def clear_persisted_session(settings: IPTVPortalSettings) -> None:
+    """Remove the saved session, e.g. after the server rejected it."""
+    path = _session_cache_file(settings)
+    if path is not None:
+        with suppress(OSError):
+            path.unlink()
+
+
 class AuthManager:
     """Synchronous authentication manager with session caching."""
 
@@ -30,6 +83,12 @@ class AuthManager:
 
         return None
 
+    def invalidate(self) -> None:
+        """Forget the cached session in memory and on disk."""
+        self._session_id = None
+        self._session_timestamp = None
+        clear_persisted_session(self.settings)
+
     def authenticate(self, http_client: httpx.Client) -> str:
         """Authenticate and return session_id.
 
@@ -45,6 +104,9 @@ class AuthManager:
         # Check cache first
         if cached_session := self.session_id:
             return cached_session
+        if persisted := load_persisted_session(self.settings):
+            self._session_id, self._session_timestamp = persisted
+            return self._session_id
 
         payload = {
             "jsonrpc": "2.0",
@@ -80,6 +142,7 @@ class AuthManager:
             # Cache session
             self._session_id = session_id
             self._session_timestamp = time.time()
+            persist_session(self.settings, session_id, self._session_timestamp)
 
             return session_id
 
@@ -108,6 +171,12 @@ class AsyncAuthManager:
 
         return None
 
+    def invalidate(self) -> None:
+        """Forget the cached session in memory and on disk."""
+        self._session_id = None
+        self._session_timestamp = None
+        clear_persisted_session(self.settings)
+
     async def authenticate(self, http_client: httpx.AsyncClient) -> str:
         """Authenticate and return session_id (async).
 
@@ -123,6 +192,9 @@ class AsyncAuthManager:
         # Check cache first
         if cached_session := self.session_id:
             return cached_session
+        if persisted := load_persisted_session(self.settings):
+            self._session_id, self._session_timestamp = persisted
+            return self._session_id
 
         payload = {
             "jsonrpc": "2.0",
@@ -158,6 +230,7 @@ class AsyncAuthManager:
             # Cache session
             self._session_id = session_id
             self._session_timestamp = time.time()
+            persist_session(self.settings, session_id, self._session_timestamp)
 
             return session_id
 
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Any, TypeVar
 
 import httpx
+import orjson
 
 from iptvportal.config import IPTVPortalSettings
 from iptvportal.core.auth import AuthManager
@@ -138,6 +139,65 @@ class IPTVPortalClient:
                     print(f"Cache hit for query hash: {query_hash[:16]}...")
                 return cached_result
 
+        data = self._post(query)
+        if "error" in data:
+            raise APIError(
+                data["error"].get("message", "API error"),
+                details=data["error"],
+            )
+        result = data.get("result")
+
+        # Cache result for read queries
+        if self._cache and self._cache.is_read_query(query):
+            query_hash = self._cache.compute_query_hash(query)
+            self._cache.set(query_hash, result, query=query)
+            if self.settings.log_requests:
+                print(f"Cached result for query hash: {query_hash[:16]}...")
+
+        return result
+
+    def execute_rpc_batch(self, queries: list[dict[str, Any]]) -> list[Any]:
+        """
+        Send several JSON-RPC requests as one batch array in a single POST.
+
+        Args:
+            queries: JSON-RPC request objects with unique ids
+
+        Returns:
+            One entry per query in input order: the result, or an APIError
+            instance if that request failed
+        """
+        if not self._http_client or not self._session_id:
+            raise IPTVPortalError("Client not connected. Use 'with' statement or call connect().")
+        if not queries:
+            return []
+
+        data = self._post(queries)
+        if isinstance(data, dict):
+            # The server rejected the batch as a whole
+            error = data.get("error") or {}
+            if not isinstance(error, dict):
+                error = {"message": str(error)}
+            raise APIError(error.get("message", "Invalid batch response"), details=error)
+
+        responses = {item.get("id"): item for item in data}
+        results: list[Any] = []
+        for query in queries:
+            item = responses.get(query.get("id"))
+            if item is None:
+                results.append(APIError(f"No response for request id {query.get('id')}"))
+            elif "error" in item:
+                error = item["error"]
+                if isinstance(error, dict):
+                    results.append(APIError(error.get("message", "API error"), details=error))
+                else:
+                    results.append(APIError(str(error)))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC payload with retries and return the decoded response body."""
         headers = {
             "Iptvportal-Authorization": f"sessionid={self._session_id}",
             "Content-Type": "application/json",
@@ -148,25 +208,11 @@ class IPTVPortalClient:
         for attempt in range(self.settings.max_retries + 1):
             try:
                 response = self._http_client.post(
-                    self.settings.api_url, json=query, headers=headers
+                    self.settings.api_url, content=orjson.dumps(payload), headers=headers
                 )
                 response.raise_for_status()
-                data = response.json()
-                if "error" in data:
-                    raise APIError(
-                        data["error"].get("message", "API error"),
-                        details=data["error"],
-                    )
-                result = data.get("result")
-
-                # Cache result for read queries
-                if self._cache and self._cache.is_read_query(query):
-                    query_hash = self._cache.compute_query_hash(query)
-                    self._cache.set(query_hash, result, query=query)
-                    if self.settings.log_requests:
-                        print(f"Cached result for query hash: {query_hash[:16]}...")
-
-                return result
+                # Parse the raw bytes; avoids decoding large result sets to str first
+                return orjson.loads(response.content)
             except httpx.TimeoutException as e:
                 last_error = TimeoutError(f"Request timeout: {e}")
             except httpx.ConnectError as e:
@@ -190,6 +236,10 @@ class IPTVPortalClient:
                 except Exception:
                     error_msg = f"HTTP {e.response.status_code}: {e}"
 
+                if e.response.status_code == 401:
+                    # Do not hand a rejected session to the next process; a 403
+                    # only denies this request and leaves the session valid
+                    self.auth.invalidate()
                 if 400 <= e.response.status_code < 500:
                     raise APIError(error_msg)
                 last_error = APIError(error_msg)
@@ -1,5 +1,6 @@
 """Main SQL to JSONSQL transpiler."""
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 import sqlglot
@@ -23,6 +24,67 @@ from .operators import (
 )
 
 
+def split_sql_statements(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split SQL text into statements on top-level semicolons.
+
+    The text can arrive in arbitrary chunks (e.g. fixed-size file reads), so a
+    large script is never held in memory as one string. Semicolons inside
+    quoted strings, quoted identifiers and comments do not end a statement,
+    and segments that contain only whitespace or comments are skipped.
+
+    Args:
+        chunks: Pieces of SQL text in order
+
+    Yields:
+        Statements without the terminating semicolon
+    """
+    buf: list[str] = []
+    quote = ""  # active quote character
+    comment = ""  # "--" or "/*" while inside a comment
+    prev = ""
+    has_code = False
+
+    for chunk in chunks:
+        for ch in chunk:
+            # Reset after a comment marker so "/*/" or "--*/" are not re-read
+            marker = False
+            if comment == "--":
+                if ch == "\n":
+                    comment = ""
+            elif comment == "/*":
+                if prev == "*" and ch == "/":
+                    comment = ""
+                    marker = True
+            elif quote:
+                if ch == quote:
+                    quote = ""
+            elif ch in "'\"`":
+                quote = ch
+                has_code = True
+            elif prev == "-" and ch == "-":
+                comment = "--"
+                marker = True
+            elif prev == "/" and ch == "*":
+                comment = "/*"
+                marker = True
+            elif ch == ";":
+                if has_code:
+                    yield "".join(buf).strip()
+                buf.clear()
+                has_code = False
+                prev = ""
+                continue
+            elif not ch.isspace() and ch not in "-/":
+                has_code = True
+
+            buf.append(ch)
+            prev = "" if marker else ch
+
+    if has_code:
+        yield "".join(buf).strip()
+
+
 class SQLTranspiler:
     """
     Transpiler for converting SQL (PostgreSQL dialect) to JSONSQL format.
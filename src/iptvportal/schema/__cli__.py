@@ -1,17 +1,125 @@
 """Schema management CLI commands."""
 
-import json
+import re
+import reprlib
+import sys
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import typer
-from rich.console import Console
-from rich.table import Table
 
 from iptvportal.cli.utils import load_config
 from iptvportal.core.client import IPTVPortalClient
-from iptvportal.schema import SchemaLoader, TableSchema
+from iptvportal.schema import FieldType, SchemaLoader, SchemaRegistry, TableSchema
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Table name after the first FROM, and whether the query already has a LIMIT.
+FROM_TABLE_PATTERN = re.compile(r"\bFROM\s+([A-Za-z_][\w.]*)", re.IGNORECASE)
+LIMIT_PATTERN = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+# One "position:name" item of a --fields/--mappings list.
+FIELD_MAPPING_PATTERN = re.compile(r"\s*(\d+)\s*:\s*(.*?)\s*")
+
+VALID_FIELD_TYPES = frozenset(field_type.value for field_type in FieldType)
+
+# Match ratio style indexed by int(ratio * 20): below 80% red, below 95% yellow
+_MATCH_RATIO_STYLES = ("red",) * 16 + ("yellow",) * 3 + ("green",) * 2
+
+# Abbreviates JSON-like sample values (nested lists/dicts) while formatting them,
+# so a large blob is never stringified in full just to show 50 characters.
+_SAMPLE_REPR = reprlib.Repr(
+    maxlevel=3, maxdict=6, maxlist=6, maxtuple=6, maxset=6, maxstring=50, maxother=50
+)
+
+
+# This module is imported by CLI discovery on every `iptvportal` run, so the
+# console and Rich tables are only set up by the command that prints them.
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared console, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _write_tsv(rows: Iterable[Sequence[str]]) -> None:
+    """Write rows as tab-separated lines in one write (plain output for pipes)."""
+    sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+
+
+def _sample_text(value: Any, width: int = 50) -> str:
+    """Return a sample value as display text of at most ``width`` characters."""
+    text = (
+        _SAMPLE_REPR.repr(value) if isinstance(value, dict | list | tuple | set) else str(value)
+    )
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def _parse_field_mappings(value: str) -> tuple[dict[int, str], list[str]]:
+    """
+    Parse "position:name" items such as "0:id,1:name".
+
+    Returns the parsed mappings and the non-empty items that did not match.
+    """
+    mappings: dict[int, str] = {}
+    invalid: list[str] = []
+    for item in value.split(","):
+        match = FIELD_MAPPING_PATTERN.fullmatch(item)
+        if match and match.group(2):
+            mappings[int(match.group(1))] = match.group(2)
+        elif item.strip():
+            invalid.append(item.strip())
+    return mappings, invalid
+
+
+def _schema_registry(config_file: str | None) -> SchemaRegistry:
+    """
+    Return the configured schema registry without connecting to the API.
+
+    list/show/export/clear only read locally loaded schema files, so they
+    skip the HTTP client and the authentication round trip.
+    """
+    return IPTVPortalClient(load_config(config_file)).schema_registry
+
+
+def _write_schema_file(schema_dict: dict[str, Any], output_path: str, format: str) -> str:
+    """
+    Write a schema dict as JSON or YAML and return the path actually written.
+
+    JSON is serialized with orjson; YAML uses PyYAML's libyaml-backed CDumper
+    when available. Falls back to JSON when PyYAML is not installed.
+    """
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    if format != "json":
+        try:
+            import yaml
+        except ImportError:
+            _console().print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
+            output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
+        else:
+            # Dump straight to UTF-8 bytes and write them in one call
+            Path(output_path).write_bytes(
+                yaml.dump(
+                    schema_dict,
+                    Dumper=getattr(yaml, "CDumper", yaml.Dumper),
+                    encoding="utf-8",
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            )
+            return output_path
+
+    Path(output_path).write_bytes(
+        orjson.dumps(schema_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
+    return output_path
+
 
-console = Console()
 app = typer.Typer(name="schema", help="Schema management service")
 # Keep schema_app as alias for backwards compatibility in this file
 schema_app = app
@@ -28,44 +136,49 @@ def list_command(
         iptvportal schema list
         iptvportal schema list --config config.yaml
     """
+    from rich.console import Group
+    from rich.table import Table
+
+    console = _console()
     try:
-        settings = load_config(config_file)
+        registry = _schema_registry(config_file)
+        tables = registry.list_tables_metadata()
 
-        with IPTVPortalClient(settings) as client:
-            tables = client.schema_registry.list_tables()
+        if not tables:
+            console.print(
+                "[yellow]No schemas loaded[/yellow]\n"
+                "\n[dim]Load schemas from a file or generate them with:[/dim]\n"
+                '[dim]  iptvportal schema from-sql -q "SELECT * FROM table"[/dim]\n'
+            )
+            return
+
+        rows = [
+            (
+                table_name,
+                str(total_fields or defined_fields),
+                str(defined_fields),
+                "Auto-generated" if is_auto else "Predefined",
+            )
+            for table_name, total_fields, defined_fields, is_auto in sorted(tables)
+        ]
 
-            if not tables:
-                console.print("[yellow]No schemas loaded[/yellow]")
-                console.print("\n[dim]Load schemas from a file or generate them with:[/dim]")
-                console.print('[dim]  iptvportal schema from-sql -q "SELECT * FROM table"[/dim]\n')
-                return
-
-            console.print(f"\n[bold cyan]Loaded Schemas ({len(tables)} tables)[/bold cyan]\n")
-
-            table = Table(show_header=True, header_style="bold cyan")
-            table.add_column("Table Name", style="white")
-            table.add_column("Total Fields", style="green")
-            table.add_column("Defined Fields", style="blue")
-            table.add_column("Type", style="yellow")
-
-            for table_name in sorted(tables):
-                schema = client.schema_registry.get(table_name)
-                schema_type = (
-                    "Auto-generated"
-                    if not schema.fields
-                    or all(f.description == "Auto-generated field" for f in schema.fields.values())
-                    else "Predefined"
-                )
+        # Piped output: one tab-separated line per table, no Rich layout
+        if not console.is_terminal:
+            _write_tsv(rows)
+            return
 
-                table.add_row(
-                    table_name,
-                    str(schema.total_fields or len(schema.fields)),
-                    str(len(schema.fields)),
-                    schema_type,
-                )
+        table = Table(show_header=True, header_style="bold cyan")
+        table.add_column("Table Name", style="white")
+        table.add_column("Total Fields", style="green")
+        table.add_column("Defined Fields", style="blue")
+        table.add_column("Type", style="yellow")
 
-            console.print(table)
-            console.print()
+        for row in rows:
+            table.add_row(*row)
+
+        console.print(
+            Group(f"\n[bold cyan]Loaded Schemas ({len(tables)} tables)[/bold cyan]\n", table, "")
+        )
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -84,65 +197,79 @@ def show_command(
         iptvportal schema show media
         iptvportal schema show subscriber --config config.yaml
     """
-    try:
-        settings = load_config(config_file)
-
-        with IPTVPortalClient(settings) as client:
-            if not client.schema_registry.has(table_name):
-                console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
-                console.print("\n[dim]Generate it with:[/dim]")
-                console.print(
-                    f'[dim]  iptvportal schema from-sql -q "SELECT * FROM {table_name}"[/dim]\n'
-                )
-                raise typer.Exit(1)
-
-            schema = client.schema_registry.get(table_name)
+    from rich.console import Group
+    from rich.table import Table
 
-            console.print(f"\n[bold cyan]Schema for table: {table_name}[/bold cyan]\n")
-
-            # Schema metadata
-            info_table = Table(show_header=False, box=None)
-            info_table.add_column("Property", style="cyan")
-            info_table.add_column("Value", style="white")
+    console = _console()
+    try:
+        registry = _schema_registry(config_file)
 
-            info_table.add_row("Total Fields", str(schema.total_fields or len(schema.fields)))
-            info_table.add_row("Defined Fields", str(len(schema.fields)))
-            if schema.pydantic_model:
-                info_table.add_row("Pydantic Model", schema.pydantic_model.__name__)
+        schema = registry.get(table_name)
+        if schema is None:
+            console.print(
+                f"[yellow]Schema for table '{table_name}' not found[/yellow]\n"
+                "\n[dim]Generate it with:[/dim]\n"
+                f'[dim]  iptvportal schema from-sql -q "SELECT * FROM {table_name}"[/dim]\n'
+            )
+            raise typer.Exit(1)
 
-            console.print(info_table)
-            console.print()
+        # Schema metadata
+        info_table = Table(show_header=False, box=None)
+        info_table.add_column("Property", style="cyan")
+        info_table.add_column("Value", style="white")
 
-            # Field definitions
-            if schema.fields:
-                console.print("[bold]Field Definitions:[/bold]\n")
+        info_table.add_row("Total Fields", str(schema.total_fields or len(schema.fields)))
+        info_table.add_row("Defined Fields", str(len(schema.fields)))
+        if schema.pydantic_model:
+            info_table.add_row("Pydantic Model", schema.pydantic_model.__name__)
+
+        # Collected sections are rendered with a single print call
+        sections: list[Any] = [
+            f"\n[bold cyan]Schema for table: {table_name}[/bold cyan]\n",
+            info_table,
+            "",
+        ]
+
+        # Field definitions
+        if schema.fields:
+            sections.append("[bold]Field Definitions:[/bold]\n")
+
+            field_rows = [
+                (
+                    str(pos),
+                    field.name,
+                    field.field_type.value,
+                    field.alias or "-",
+                    field.python_name or "-",
+                    field.description or "-",
+                )
+                for pos, field in schema.fields.items()
+            ]
 
+            if console.is_terminal:
                 fields_table = Table(show_header=True, header_style="bold cyan")
-                fields_table.add_column("Pos", style="dim")
+                fields_table.add_column("Pos", style="dim", no_wrap=True)
                 fields_table.add_column("Name", style="white")
-                fields_table.add_column("Type", style="green")
+                fields_table.add_column("Type", style="green", no_wrap=True)
                 fields_table.add_column("Alias", style="yellow")
                 fields_table.add_column("Python Name", style="blue")
                 fields_table.add_column("Description", style="dim")
 
-                for pos in sorted(schema.fields.keys()):
-                    field = schema.fields[pos]
-                    fields_table.add_row(
-                        str(pos),
-                        field.name,
-                        field.field_type.value,
-                        field.alias or "-",
-                        field.python_name or "-",
-                        field.description or "-",
-                    )
+                for row in field_rows:
+                    fields_table.add_row(*row)
 
-                console.print(fields_table)
-                console.print()
+                sections.append(fields_table)
+            else:
+                console.print(Group(*sections))
+                _write_tsv(field_rows)
+                sections = []
+            sections.append("")
 
-            # SELECT * expansion preview
-            console.print("[bold]SELECT * Expansion:[/bold]")
-            expansion = schema.resolve_select_star()
-            console.print(f"[dim]{', '.join(expansion)}[/dim]\n")
+        # SELECT * expansion preview
+        expansion = schema.resolve_select_star()
+        sections.append("[bold]SELECT * Expansion:[/bold]")
+        sections.append(f"[dim]{', '.join(expansion)}[/dim]\n")
+        console.print(Group(*sections))
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -173,31 +300,27 @@ def from_sql_command(
         iptvportal schema from-sql -q "SELECT * FROM tv_channel" --fields "1:name,2:url"
         iptvportal schema from-sql -q "SELECT * FROM media" -s -o schemas.yaml
     """
+    from rich.console import Group
+    from rich.table import Table
+
+    console = _console()
     try:
         settings = load_config(config_file)
 
         # Extract table name from query (simple parsing)
-        query_upper = query.upper()
-        if "FROM" not in query_upper:
+        match = FROM_TABLE_PATTERN.search(query)
+        if not match:
             console.print("[red]Error: Could not extract table name from query[/red]")
             console.print("[dim]Query must contain FROM clause[/dim]")
             raise typer.Exit(1)
 
-        # Simple table name extraction
-        parts = query_upper.split("FROM")[1].split()
-        if not parts:
-            console.print("[red]Error: Could not extract table name[/red]")
-            raise typer.Exit(1)
-
-        table_name = parts[0].strip().lower()
-        # Remove any trailing clauses
-        table_name = table_name.split()[0].strip(";,")
+        table_name = match.group(1).lower()
 
         console.print(f"\n[cyan]Generating schema for table: {table_name}[/cyan]")
         console.print(f"[dim]Executing query with LIMIT {limit}...[/dim]\n")
 
         # Add LIMIT to query if not present
-        if "LIMIT" not in query_upper:
+        if not LIMIT_PATTERN.search(query):
             query = f"{query.rstrip(';')} LIMIT {limit}"
 
         with IPTVPortalClient(settings) as client:
@@ -208,9 +331,7 @@ def from_sql_command(
             jsonsql = transpiler.transpile(query)
 
             # Determine method from transpiled result
-            method = jsonsql.get("_method", "select")
-            if "_method" in jsonsql:
-                del jsonsql["_method"]
+            method = jsonsql.pop("_method", "select")
 
             # Execute query
             from iptvportal.cli.utils import build_jsonrpc_request
@@ -225,33 +346,25 @@ def from_sql_command(
             # Parse manual field mappings if provided
             field_overrides = {}
             if fields:
-                try:
-                    for mapping in fields.split(","):
-                        mapping = mapping.strip()
-                        if ":" not in mapping:
-                            console.print(
-                                f"[yellow]Warning: Invalid field mapping '{mapping}' (expected format: 'position:name')[/yellow]"
-                            )
-                            continue
-
-                        pos_str, name = mapping.split(":", 1)
-                        position = int(pos_str.strip())
-                        field_name = name.strip()
-
-                        if position < 0 or position >= len(result[0]):
-                            console.print(
-                                f"[yellow]Warning: Position {position} out of range (0-{len(result[0]) - 1})[/yellow]"
-                            )
-                            continue
-
-                        field_overrides[position] = field_name
+                mappings, invalid = _parse_field_mappings(fields)
+                for mapping in invalid:
+                    console.print(
+                        f"[yellow]Warning: Invalid field mapping '{mapping}' (expected format: 'position:name')[/yellow]"
+                    )
 
-                    if field_overrides:
+                for position, field_name in mappings.items():
+                    if position >= len(result[0]):
                         console.print(
-                            f"[dim]Applying {len(field_overrides)} manual field mapping(s)[/dim]"
+                            f"[yellow]Warning: Position {position} out of range (0-{len(result[0]) - 1})[/yellow]"
                         )
-                except ValueError as e:
-                    console.print(f"[yellow]Warning: Error parsing field mappings: {e}[/yellow]")
+                        continue
+
+                    field_overrides[position] = field_name
+
+                if field_overrides:
+                    console.print(
+                        f"[dim]Applying {len(field_overrides)} manual field mapping(s)[/dim]"
+                    )
 
             # Generate schema from first row
             sample_row = result[0]
@@ -262,27 +375,29 @@ def from_sql_command(
             # Register in current session
             client.schema_registry.register(schema)
 
-            console.print(f"[green]✓ Generated schema with {schema.total_fields} fields[/green]\n")
-
             # Display schema
-            fields_table = Table(show_header=True, header_style="bold cyan")
-            fields_table.add_column("Position", style="dim")
-            fields_table.add_column("Name", style="white")
-            fields_table.add_column("Type", style="green")
-            fields_table.add_column("Sample Value", style="yellow")
-
-            for pos, value in enumerate(sample_row):
-                field = schema.fields.get(pos)
-                if field:
-                    # Truncate long values
-                    sample_str = str(value)
-                    if len(sample_str) > 50:
-                        sample_str = sample_str[:47] + "..."
+            field_rows = [
+                (str(pos), field.name, field.field_type.value, _sample_text(value))
+                for pos, value in enumerate(sample_row)
+                if (field := schema.fields.get(pos))
+            ]
+            summary = f"[green]✓ Generated schema with {schema.total_fields} fields[/green]\n"
+
+            if console.is_terminal:
+                fields_table = Table(show_header=True, header_style="bold cyan")
+                fields_table.add_column("Position", style="dim")
+                fields_table.add_column("Name", style="white")
+                fields_table.add_column("Type", style="green")
+                fields_table.add_column("Sample Value", style="yellow")
 
-                    fields_table.add_row(str(pos), field.name, field.field_type.value, sample_str)
+                for row in field_rows:
+                    fields_table.add_row(*row)
 
-            console.print(fields_table)
-            console.print()
+                console.print(Group(summary, fields_table, ""))
+            else:
+                console.print(summary)
+                _write_tsv(field_rows)
+                console.print()
 
             # Save if requested
             if save or output:
@@ -291,26 +406,7 @@ def from_sql_command(
                 # Convert schema to dict
                 schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-                # Ensure output directory exists
-                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-                # Write to file
-                if format == "json":
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
-                else:  # yaml
-                    try:
-                        import yaml
-
-                        with open(output_path, "w") as f:
-                            yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                    except ImportError:
-                        console.print(
-                            "[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]"
-                        )
-                        output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                        with open(output_path, "w") as f:
-                            json.dump(schema_dict, f, indent=2)
+                output_path = _write_schema_file(schema_dict, output_path, format)
 
                 console.print(f"[green]✓ Schema saved to: {output_path}[/green]\n")
 
@@ -336,44 +432,26 @@ def export_command(
         iptvportal schema export media -o schemas.yaml
         iptvportal schema export subscriber --format json -o sub.json
     """
+    console = _console()
     try:
-        settings = load_config(config_file)
+        registry = _schema_registry(config_file)
 
-        with IPTVPortalClient(settings) as client:
-            if not client.schema_registry.has(table_name):
-                console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
-                raise typer.Exit(1)
+        schema = registry.get(table_name)
+        if schema is None:
+            console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
+            raise typer.Exit(1)
 
-            schema = client.schema_registry.get(table_name)
+        # Determine output path
+        output_path = output or f"config/{table_name}-schema.{format}"
 
-            # Determine output path
-            output_path = output or f"config/{table_name}-schema.{format}"
+        # Convert schema to dict
+        schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-            # Convert schema to dict
-            schema_dict = {"schemas": {table_name: schema.to_dict()}}
+        output_path = _write_schema_file(schema_dict, output_path, format)
 
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to file
-            if format == "json":
-                with open(output_path, "w") as f:
-                    json.dump(schema_dict, f, indent=2)
-            else:  # yaml
-                try:
-                    import yaml
-
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    console.print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
-                    output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
-
-            console.print(
-                f"[green]✓ Schema for '{table_name}' exported to: {output_path}[/green]\n"
-            )
+        console.print(
+            f"[green]✓ Schema for '{table_name}' exported to: {output_path}[/green]\n"
+        )
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -392,6 +470,7 @@ def import_command(
         iptvportal schema import schemas.yaml
         iptvportal schema import config/schemas.json
     """
+    console = _console()
     try:
         if not Path(file_path).exists():
             console.print(f"[red]File not found: {file_path}[/red]")
@@ -421,14 +500,21 @@ def import_command(
 
 
 @schema_app.command(name="validate")
-def validate_command(file_path: str = typer.Argument(..., help="Schema file to validate")) -> None:
+def validate_command(
+    file_path: str = typer.Argument(..., help="Schema file to validate"),
+    fail_fast: bool = typer.Option(
+        False, "--fail-fast", help="Stop at the first schema with errors"
+    ),
+) -> None:
     """
     Validate a schema file.
 
     Examples:
         iptvportal schema validate schemas.yaml
         iptvportal schema validate config/schemas.json
+        iptvportal schema validate schemas.yaml --fail-fast
     """
+    console = _console()
     try:
         if not Path(file_path).exists():
             console.print(f"[red]File not found: {file_path}[/red]")
@@ -439,45 +525,46 @@ def validate_command(file_path: str = typer.Argument(..., help="Schema file to v
         errors = []
         warnings = []
 
-        # Try to load the file
+        # Try to load the file. Raw field types are checked before a table is
+        # parsed, since SchemaLoader silently maps unknown types to "unknown".
         try:
             if file_path.endswith(".json"):
-                registry = SchemaLoader.from_json(file_path)
+                config = orjson.loads(Path(file_path).read_bytes())
             else:
-                registry = SchemaLoader.from_yaml(file_path)
+                import yaml
+
+                with open(file_path, encoding="utf-8") as f:
+                    config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         except Exception as e:
             console.print(f"[red]✗ Failed to parse file: {e}[/red]\n")
             raise typer.Exit(1)
 
-        tables = registry.list_tables()
+        tables = (config or {}).get("schemas") or {}
 
         if not tables:
             warnings.append("No schemas found in file")
 
         # Validate each schema
-        for table_name in tables:
-            schema = registry.get(table_name)
+        for table_name, table_config in tables.items():
+            # Check for invalid field types
+            for pos, field_config in (table_config.get("fields") or {}).items():
+                field_type = field_config.get("type", "unknown")
+                if field_type not in VALID_FIELD_TYPES:
+                    field_name = field_config.get("name") or f"Field_{pos}"
+                    errors.append(f"{table_name}.{field_name}: Invalid field type '{field_type}'")
 
-            # Check for duplicate positions
-            positions = list(schema.fields.keys())
-            if len(positions) != len(set(positions)):
-                errors.append(f"{table_name}: Duplicate field positions detected")
+            if errors and fail_fast:
+                break
 
-            # Check for invalid field types
-            for _pos, field in schema.fields.items():
-                if field.field_type.value not in [
-                    "integer",
-                    "string",
-                    "boolean",
-                    "float",
-                    "datetime",
-                    "date",
-                    "json",
-                    "unknown",
-                ]:
-                    errors.append(
-                        f"{table_name}.{field.name}: Invalid field type '{field.field_type.value}'"
-                    )
+            try:
+                schema = SchemaLoader.from_dict({"schemas": {table_name: table_config}}).get(
+                    table_name
+                )
+            except Exception as e:
+                errors.append(f"{table_name}: {e}")
+                if fail_fast:
+                    break
+                continue
 
             # Warn about missing total_fields
             if not schema.total_fields:
@@ -549,6 +636,10 @@ def introspect_command(
         iptvportal schema introspect tv_program --fields='0:channel_id,1:start,2:stop' --sync
         iptvportal schema introspect media --sync --sync-chunk=5000 --analyze-from-cache
     """
+    from rich.console import Group
+    from rich.table import Table
+
+    console = _console()
     try:
         settings = load_config(config_file)
 
@@ -557,19 +648,13 @@ def introspect_command(
         
         if from_sql:
             # Extract table name from SQL query
-            query_upper = from_sql.upper()
-            if "FROM" not in query_upper:
+            match = FROM_TABLE_PATTERN.search(from_sql)
+            if not match:
                 console.print("[red]Error: Could not extract table name from SQL query[/red]")
                 console.print("[dim]Query must contain FROM clause[/dim]")
                 raise typer.Exit(1)
-            
-            parts = query_upper.split("FROM")[1].split()
-            if not parts:
-                console.print("[red]Error: Could not extract table name[/red]")
-                raise typer.Exit(1)
-            
-            resolved_table_name = parts[0].strip().lower()
-            resolved_table_name = resolved_table_name.split()[0].strip(";,")
+
+            resolved_table_name = match.group(1).lower()
         
         if not resolved_table_name:
             console.print("[red]Error: Table name is required[/red]")
@@ -581,26 +666,16 @@ def introspect_command(
         # Parse manual field mappings if provided
         field_overrides = {}
         if fields:
-            try:
-                for mapping in fields.split(","):
-                    mapping = mapping.strip()
-                    if ":" not in mapping:
-                        console.print(
-                            f"[yellow]Warning: Invalid field mapping '{mapping}' (expected format: 'position:name')[/yellow]"
-                        )
-                        continue
-
-                    pos_str, name = mapping.split(":", 1)
-                    position = int(pos_str.strip())
-                    field_name = name.strip()
-                    field_overrides[position] = field_name
+            field_overrides, invalid = _parse_field_mappings(fields)
+            for mapping in invalid:
+                console.print(
+                    f"[yellow]Warning: Invalid field mapping '{mapping}' (expected format: 'position:name')[/yellow]"
+                )
 
-                if field_overrides:
-                    console.print(
-                        f"[dim]Applying {len(field_overrides)} manual field mapping(s)[/dim]"
-                    )
-            except ValueError as e:
-                console.print(f"[yellow]Warning: Error parsing field mappings: {e}[/yellow]")
+            if field_overrides:
+                console.print(
+                    f"[dim]Applying {len(field_overrides)} manual field mapping(s)[/dim]"
+                )
 
         # Use async client for introspection
         import asyncio
@@ -738,7 +813,7 @@ def introspect_command(
                             cache_data = database.fetch_rows(resolved_table_name, limit=sample_size)
                             
                             if cache_data:
-                                field_names = [schema.fields[i].name for i in sorted(schema.fields.keys())]
+                                field_names = [field.name for field in schema.fields.values()]
                                 cache_analysis = analyzer.analyze_sample(cache_data, field_names)
                                 
                                 # Update schema metadata with cache analysis
@@ -785,31 +860,32 @@ def introspect_command(
             if schema.metadata.analyzed_at:
                 info_table.add_row("Analyzed At", schema.metadata.analyzed_at)
 
-        console.print(info_table)
-        console.print()
-
         # Display detected fields
-        console.print("[bold]Detected Fields:[/bold]\n")
-
-        fields_table = Table(show_header=True, header_style="bold cyan")
-        fields_table.add_column("Pos", style="dim")
-        fields_table.add_column("Name", style="white")
-        fields_table.add_column("Type", style="green")
-        fields_table.add_column("Description", style="dim")
-
-        for pos in sorted(schema.fields.keys()):
-            field = schema.fields[pos]
-            fields_table.add_row(
-                str(pos), field.name, field.field_type.value, field.description or "-"
-            )
+        field_rows = [
+            (str(pos), field.name, field.field_type.value, field.description or "-")
+            for pos, field in schema.fields.items()
+        ]
+        sections: list[Any] = [info_table, "", "[bold]Detected Fields:[/bold]\n"]
 
-        console.print(fields_table)
-        console.print()
+        if console.is_terminal:
+            fields_table = Table(show_header=True, header_style="bold cyan")
+            fields_table.add_column("Pos", style="dim", no_wrap=True)
+            fields_table.add_column("Name", style="white")
+            fields_table.add_column("Type", style="green", no_wrap=True)
+            fields_table.add_column("Description", style="dim")
+
+            for row in field_rows:
+                fields_table.add_row(*row)
+
+            sections.append(fields_table)
+        else:
+            console.print(Group(*sections))
+            _write_tsv(field_rows)
+            sections = []
+        sections.append("")
 
         # Display sync guardrails
         if schema.sync_config:
-            console.print("[bold]Auto-generated Sync Guardrails:[/bold]\n")
-
             sync_table = Table(show_header=False, box=None)
             sync_table.add_column("Setting", style="cyan")
             sync_table.add_column("Value", style="white")
@@ -826,58 +902,59 @@ def introspect_command(
             if schema.sync_config.incremental_field:
                 sync_table.add_row("Incremental Field", schema.sync_config.incremental_field)
 
-            console.print(sync_table)
-            console.print()
+            sections += ["[bold]Auto-generated Sync Guardrails:[/bold]\n", sync_table, ""]
 
         # Timestamp ranges
         if schema.metadata and schema.metadata.timestamp_ranges:
-            console.print("[bold]Timestamp Ranges:[/bold]\n")
+            sections.append("[bold]Timestamp Ranges:[/bold]\n")
 
             for field_name, ranges in schema.metadata.timestamp_ranges.items():
-                console.print(f"  [cyan]{field_name}:[/cyan]")
+                sections.append(f"  [cyan]{field_name}:[/cyan]")
                 if ranges.get("min"):
-                    console.print(f"    Min: {ranges['min']}")
+                    sections.append(f"    Min: {ranges['min']}")
                 if ranges.get("max"):
-                    console.print(f"    Max: {ranges['max']}")
-                console.print()
+                    sections.append(f"    Max: {ranges['max']}")
+                sections.append("")
 
         # DuckDB Analysis
         if schema.metadata and hasattr(schema.metadata, "duckdb_analysis") and schema.metadata.duckdb_analysis:
             analysis = schema.metadata.duckdb_analysis
             
             if "error" not in analysis:
-                console.print("[bold]DuckDB Statistical Analysis:[/bold]\n")
+                sections.append("[bold]DuckDB Statistical Analysis:[/bold]\n")
 
                 for field_name, stats in analysis.items():
                     if isinstance(stats, dict) and "error" not in stats:
-                        console.print(f"  [cyan]{field_name}:[/cyan]")
+                        sections.append(f"  [cyan]{field_name}:[/cyan]")
                         
                         # Display basic stats
                         if "dtype" in stats:
-                            console.print(f"    Type: {stats['dtype']}")
+                            sections.append(f"    Type: {stats['dtype']}")
                         if "null_percentage" in stats:
-                            console.print(f"    Null %: {stats['null_percentage']:.2f}%")
+                            sections.append(f"    Null %: {stats['null_percentage']:.2f}%")
                         if "unique_count" in stats:
-                            console.print(f"    Unique: {stats['unique_count']} ({stats.get('cardinality', 0):.2%} cardinality)")
+                            sections.append(f"    Unique: {stats['unique_count']} ({stats.get('cardinality', 0):.2%} cardinality)")
                         
                         # Display type-specific stats
                         if "min_value" in stats and "max_value" in stats:
-                            console.print(f"    Range: [{stats['min_value']} .. {stats['max_value']}]")
+                            sections.append(f"    Range: [{stats['min_value']} .. {stats['max_value']}]")
                             if "avg_value" in stats and stats["avg_value"] is not None:
-                                console.print(f"    Average: {stats['avg_value']:.2f}")
+                                sections.append(f"    Average: {stats['avg_value']:.2f}")
                         
                         if "min_length" in stats and "max_length" in stats:
-                            console.print(f"    Length: [{stats['min_length']} .. {stats['max_length']}]")
+                            sections.append(f"    Length: [{stats['min_length']} .. {stats['max_length']}]")
                             if "avg_length" in stats and stats["avg_length"] is not None:
-                                console.print(f"    Avg Length: {stats['avg_length']:.2f}")
+                                sections.append(f"    Avg Length: {stats['avg_length']:.2f}")
                         
                         # Display top values for low cardinality
                         if "top_values" in stats and stats["top_values"]:
-                            console.print("    Top Values:")
+                            sections.append("    Top Values:")
                             for val, cnt in stats["top_values"][:3]:
-                                console.print(f"      • {val}: {cnt}")
+                                sections.append(f"      • {val}: {cnt}")
                         
-                        console.print()
+                        sections.append("")
+
+        console.print(Group(*sections))
 
         # Save if requested
         if save or output:
@@ -886,24 +963,7 @@ def introspect_command(
             # Convert schema to dict
             schema_dict = {"schemas": {resolved_table_name: schema.to_dict()}}
 
-            # Ensure output directory exists
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Write to file
-            if format == "json":
-                with open(output_path, "w") as f:
-                    json.dump(schema_dict, f, indent=2)
-            else:  # yaml
-                try:
-                    import yaml
-
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    console.print("[yellow]PyYAML not installed. Saving as JSON instead.[/yellow]")
-                    output_path = output_path.replace(".yaml", ".json").replace(".yml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
+            output_path = _write_schema_file(schema_dict, output_path, format)
 
             console.print(f"[green]✓ Schema saved to: {output_path}[/green]\n")
         else:
@@ -918,6 +978,99 @@ def introspect_command(
         raise typer.Exit(1)
 
 
+@schema_app.command(name="introspect-batch")
+def introspect_batch_command(
+    tables: str = typer.Argument(..., help="Comma-separated table names"),
+    no_metadata: bool = typer.Option(False, "--no-metadata", help="Skip metadata gathering"),
+    no_duckdb_analysis: bool = typer.Option(
+        False, "--no-duckdb-analysis", help="Skip DuckDB statistical analysis"
+    ),
+    save: bool = typer.Option(False, "--save", "-s", help="Save generated schemas to file"),
+    output: str | None = typer.Option(None, "--output", "-o", help="Output file path"),
+    format: str = typer.Option("yaml", "--format", "-f", help="Output format (yaml/json)"),
+    config_file: str | None = typer.Option(None, "--config", "-c", help="Config file path"),
+) -> None:
+    """
+    Introspect several tables concurrently over a single connection.
+
+    Examples:
+        iptvportal schema introspect-batch tv_channel,media
+        iptvportal schema introspect-batch subscriber,terminal --no-duckdb-analysis
+        iptvportal schema introspect-batch tv_channel,tv_program --save -o config/schemas.yaml
+    """
+    from rich.console import Group
+    from rich.table import Table
+
+    console = _console()
+    # Repeated names are introspected once so they do not count as failures
+    table_names = list(dict.fromkeys(name.strip() for name in tables.split(",") if name.strip()))
+    if not table_names:
+        console.print("[red]Error: At least one table name is required[/red]")
+        raise typer.Exit(1)
+
+    try:
+        settings = load_config(config_file)
+
+        import asyncio
+
+        from iptvportal.core.async_client import AsyncIPTVPortalClient
+        from iptvportal.schema.introspector import SchemaIntrospector
+
+        async def do_introspect() -> dict[str, TableSchema]:
+            async with AsyncIPTVPortalClient(settings) as client:
+                return await SchemaIntrospector(client).introspect_all_tables(
+                    table_names,
+                    gather_metadata=not no_metadata,
+                    perform_duckdb_analysis=not no_duckdb_analysis,
+                )
+
+        console.print(f"\n[cyan]Introspecting {len(table_names)} table(s)...[/cyan]\n")
+        schemas = asyncio.run(do_introspect())
+
+        # Piped output keeps row counts unformatted so they stay numeric
+        row_count_format = "{:,}" if console.is_terminal else "{}"
+        summary_rows = []
+        for name in table_names:
+            schema = schemas.get(name)
+            if schema is None:
+                summary_rows.append((name, "-", "-", "failed"))
+            else:
+                row_count = (
+                    row_count_format.format(schema.metadata.row_count) if schema.metadata else "-"
+                )
+                summary_rows.append((name, str(schema.total_fields), row_count, "ok"))
+
+        if console.is_terminal:
+            summary_table = Table(show_header=True, header_style="bold cyan")
+            summary_table.add_column("Table Name", style="white")
+            summary_table.add_column("Fields", style="green", no_wrap=True)
+            summary_table.add_column("Row Count", style="blue", no_wrap=True)
+            summary_table.add_column("Status", style="yellow")
+
+            for row in summary_rows:
+                summary_table.add_row(*row)
+
+            console.print(Group(summary_table, ""))
+        else:
+            _write_tsv(summary_rows)
+
+        if schemas and (save or output):
+            # Not config/schemas.*: that file is read by import/validate and sync register
+            output_path = output or f"config/introspected-schemas.{format}"
+            schema_dict = {"schemas": {name: schema.to_dict() for name, schema in schemas.items()}}
+
+            output_path = _write_schema_file(schema_dict, output_path, format)
+
+            console.print(f"[green]✓ {len(schemas)} schema(s) saved to: {output_path}[/green]\n")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+    if len(schemas) < len(table_names):
+        raise typer.Exit(1)
+
+
 @schema_app.command(name="validate-mapping")
 def validate_mapping_command(
     table_name: str = typer.Argument(..., help="Table name to validate"),
@@ -925,6 +1078,12 @@ def validate_mapping_command(
         ..., "--mappings", "-m", help="Field mappings to validate (e.g., '0:id,1:username,2:email')"
     ),
     sample_size: int = typer.Option(1000, "--sample-size", "-s", help="Sample size for validation"),
+    batch_size: int = typer.Option(
+        50, "--batch-size", min=1, help="Number of columns fetched per validation query"
+    ),
+    concurrency: int = typer.Option(
+        16, "--concurrency", min=1, help="Number of queries to run in parallel"
+    ),
     save: bool = typer.Option(False, "--save", help="Save validation results to schema"),
     output: str | None = typer.Option(None, "--output", "-o", help="Output file path"),
     config_file: str | None = typer.Option(None, "--config", "-c", help="Config file path"),
@@ -939,35 +1098,27 @@ def validate_mapping_command(
         iptvportal schema validate-mapping subscriber -m "0:id,1:username,2:email"
         iptvportal schema validate-mapping media -m "0:id,1:name" --sample-size 500 --save
     """
+    from rich.table import Table
+    from rich.text import Text
+
+    console = _console()
     try:
         settings = load_config(config_file)
 
         console.print(f"\n[cyan]Validating field mappings for table: {table_name}[/cyan]")
 
         # Parse mappings
-        field_mappings = {}
-        try:
-            for mapping in mappings.split(","):
-                mapping = mapping.strip()
-                if ":" not in mapping:
-                    console.print(
-                        f"[red]Error: Invalid mapping '{mapping}' (expected format: 'position:column_name')[/red]"
-                    )
-                    raise typer.Exit(1)
-
-                pos_str, col_name = mapping.split(":", 1)
-                position = int(pos_str.strip())
-                column_name = col_name.strip()
-                field_mappings[position] = column_name
-
+        field_mappings, invalid = _parse_field_mappings(mappings)
+        if invalid:
             console.print(
-                f"[dim]Validating {len(field_mappings)} field mapping(s) with sample size {sample_size}...[/dim]\n"
+                f"[red]Error: Invalid mapping '{invalid[0]}' (expected format: 'position:column_name')[/red]"
             )
-
-        except ValueError as e:
-            console.print(f"[red]Error parsing mappings: {e}[/red]")
             raise typer.Exit(1)
 
+        console.print(
+            f"[dim]Validating {len(field_mappings)} field mapping(s) with sample size {sample_size}...[/dim]\n"
+        )
+
         # Run validation
         import asyncio
 
@@ -977,35 +1128,43 @@ def validate_mapping_command(
         async def do_validation():
             async with AsyncIPTVPortalClient(settings) as client:
                 validator = RemoteFieldValidator(client)
-                return await validator.validate_table_schema(
+                results = await validator.validate_table_schema_batch(
                     table_name=table_name,
                     field_mappings=field_mappings,
                     sample_size=sample_size,
+                    batch_size=batch_size,
+                    concurrency=concurrency,
                 )
+                # The client already loaded the configured schemas; keep its
+                # registry so saving does not need a second client
+                return results, client.schema_registry
 
-        results = asyncio.run(do_validation())
+        results, registry = asyncio.run(do_validation())
 
         # Display results
         console.print("[bold]Validation Results:[/bold]\n")
 
+        # Columns with bounded content get a fixed width, so Rich does not
+        # measure every cell of them; counts never exceed the sample size
+        count_width = len(str(sample_size))
         results_table = Table(show_header=True, header_style="bold cyan")
-        results_table.add_column("Position", style="dim")
+        results_table.add_column("Position", style="dim", width=8, no_wrap=True)
         results_table.add_column("Remote Column", style="white")
-        results_table.add_column("Match Ratio", style="green")
-        results_table.add_column("Sample Size", style="blue")
+        results_table.add_column("Match Ratio", style="green", width=11, no_wrap=True)
+        results_table.add_column("Sample Size", style="blue", width=max(11, count_width))
         results_table.add_column("Dtype", style="yellow")
-        results_table.add_column("Null Count", style="dim")
-        results_table.add_column("Unique", style="dim")
+        results_table.add_column("Null Count", style="dim", width=max(10, count_width))
+        results_table.add_column("Unique", style="dim", width=max(6, count_width))
 
         all_passed = True
-        for position in sorted(results.keys()):
-            result = results[position]
-
+        # Results without errors, in position order, for the optional save below
+        valid_results = {}
+        for position, result in sorted(results.items()):
             if "error" in result:
                 results_table.add_row(
                     str(position),
                     result.get("remote_column", "?"),
-                    "[red]ERROR[/red]",
+                    Text("ERROR", style="red"),
                     "-",
                     "-",
                     "-",
@@ -1014,21 +1173,17 @@ def validate_mapping_command(
                 all_passed = False
             else:
                 match_ratio = result["match_ratio"]
-                match_ratio_str = f"{match_ratio:.2%}"
-
-                # Color code match ratio
-                if match_ratio >= 0.95:
-                    match_ratio_str = f"[green]{match_ratio_str}[/green]"
-                elif match_ratio >= 0.80:
-                    match_ratio_str = f"[yellow]{match_ratio_str}[/yellow]"
-                else:
-                    match_ratio_str = f"[red]{match_ratio_str}[/red]"
+
+                # Color code match ratio (styled Text, no markup to parse)
+                ratio_style = _MATCH_RATIO_STYLES[min(int(match_ratio * 20), 20)]
+                if ratio_style == "red":
                     all_passed = False
 
+                valid_results[position] = result
                 results_table.add_row(
                     str(position),
                     result["remote_column"],
-                    match_ratio_str,
+                    Text(f"{match_ratio:.2%}", style=ratio_style),
                     str(result["sample_size"]),
                     result["dtype"],
                     str(result["null_count"]),
@@ -1049,61 +1204,44 @@ def validate_mapping_command(
         # Save results if requested
         if save or output:
             # Load or create schema
-            with IPTVPortalClient(settings) as client:
-                if client.schema_registry.has(table_name):
-                    schema = client.schema_registry.get(table_name)
-                else:
-                    # Create minimal schema
-                    from iptvportal.schema import FieldDefinition, FieldType, TableSchema
-
-                    fields = {}
-                    for position, col_name in field_mappings.items():
-                        result = results[position]
-                        if "error" not in result:
-                            # Infer field type from dtype
-                            dtype_str = result["dtype"]
-                            validator_inst = RemoteFieldValidator(None)  # Just for dtype inference
-                            field_type_str = validator_inst.infer_field_type_from_dtype(dtype_str)
-                            field_type = FieldType(field_type_str)
-
-                            fields[position] = FieldDefinition(
-                                name=col_name,
-                                position=position,
-                                remote_name=col_name,
-                                field_type=field_type,
-                                remote_mapping=result,
-                            )
-
-                    schema = TableSchema(
-                        table_name=table_name,
-                        fields=fields,
-                        total_fields=len(fields),
+            schema = registry.get(table_name)
+            if schema is None:
+                # Create minimal schema
+                from iptvportal.schema import FieldDefinition
+
+                fields = {
+                    position: FieldDefinition(
+                        name=field_mappings[position],
+                        position=position,
+                        remote_name=field_mappings[position],
+                        field_type=FieldType(
+                            RemoteFieldValidator.infer_field_type_from_dtype(result["dtype"])
+                        ),
+                        remote_mapping=result,
                     )
+                    for position, result in valid_results.items()
+                }
+                schema = TableSchema(
+                    table_name=table_name,
+                    fields=fields,
+                    total_fields=len(fields),
+                )
+            else:
+                # Update remote_mapping for each validated field
+                for position, result in valid_results.items():
+                    field = schema.fields.get(position)
+                    if field is not None:
+                        field.remote_mapping = result
+
+            # Save schema
+            output_path = output or f"config/{table_name}-validated-schema.yaml"
+            schema_dict = {"schemas": {table_name: schema.to_dict()}}
 
-                # Update remote_mapping for each field
-                for position, result in results.items():
-                    if position in schema.fields and "error" not in result:
-                        schema.fields[position].remote_mapping = result
-
-                # Save schema
-                output_path = output or f"config/{table_name}-validated-schema.yaml"
-                schema_dict = {"schemas": {table_name: schema.to_dict()}}
-
-                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-                try:
-                    import yaml
-
-                    with open(output_path, "w") as f:
-                        yaml.dump(schema_dict, f, default_flow_style=False, sort_keys=False)
-                except ImportError:
-                    import json
-
-                    output_path = output_path.replace(".yaml", ".json")
-                    with open(output_path, "w") as f:
-                        json.dump(schema_dict, f, indent=2)
+            # A .json --output is written as JSON; anything else stays YAML
+            output_format = "json" if output_path.endswith(".json") else "yaml"
+            output_path = _write_schema_file(schema_dict, output_path, output_format)
 
-                console.print(f"[green]✓ Validated schema saved to: {output_path}[/green]\n")
+            console.print(f"[green]✓ Validated schema saved to: {output_path}[/green]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -1138,8 +1276,10 @@ def generate_models_command(
         iptvportal schema generate-models schemas.yaml -o ./models --format pydantic
         iptvportal schema generate-models schemas.yaml --no-relationships
     """
+    console = _console()
     try:
-        if not Path(schema_file).exists():
+        schema_path = Path(schema_file)
+        if not schema_path.exists():
             console.print(f"[red]File not found: {schema_file}[/red]")
             raise typer.Exit(1)
 
@@ -1148,8 +1288,8 @@ def generate_models_command(
         # Generate models
         from iptvportal.schema.codegen import ORMGenerator
 
-        results = ORMGenerator.load_and_generate(
-            schema_path=schema_file,
+        generator = ORMGenerator(SchemaLoader.from_yaml(schema_path))
+        results = generator.generate_model_files(
             output_format=format,
             output_dir=Path(output_dir),
             include_relationships=relationships,
@@ -1158,22 +1298,17 @@ def generate_models_command(
         # Display results
         console.print(f"[green]✓ Generated {len(results)} model(s):[/green]\n")
 
-        for table_name, _code in results.items():
-            # Get class name from code
-            class_name = table_name.replace("_", " ").title().replace(" ", "")
-            file_name = f"{class_name.lower()}.py"
-
-            console.print(f"  • {class_name} → {output_dir}/{file_name}")
+        for model in results.values():
+            console.print(f"  • {model.class_name} → {output_dir}/{model.file_name}")
 
         console.print(f"\n[green]✓ Models saved to: {output_dir}/[/green]\n")
 
         # Show a preview of the first model
         if results:
-            first_table = list(results.keys())[0]
-            first_code = results[first_table]
+            first_code = next(iter(results.values())).code
 
             console.print("[bold]Preview (first model):[/bold]\n")
-            console.print("[dim]" + "\n".join(first_code.split("\n")[:20]) + "[/dim]")
+            console.print("[dim]" + "\n".join(first_code.split("\n", 20)[:20]) + "[/dim]")
             console.print("[dim]...[/dim]\n")
 
     except Exception as e:
@@ -1197,43 +1332,43 @@ def clear_command(
         iptvportal schema clear media
         iptvportal schema clear --force  # Clear all schemas
     """
+    console = _console()
     try:
-        settings = load_config(config_file)
+        registry = _schema_registry(config_file)
 
-        with IPTVPortalClient(settings) as client:
-            if table_name:
-                if not client.schema_registry.has(table_name):
-                    console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
-                    raise typer.Exit(1)
-
-                if not force:
-                    confirm = typer.confirm(f"Clear schema for '{table_name}'?")
-                    if not confirm:
-                        console.print("[yellow]Cancelled[/yellow]")
-                        raise typer.Exit(0)
-
-                # Remove from registry (would need to add remove method)
-                console.print(f"[green]✓ Schema for '{table_name}' cleared[/green]")
-                console.print("[dim]Note: This only affects the current session[/dim]\n")
-            else:
-                tables = client.schema_registry.list_tables()
+        if table_name:
+            if not registry.has(table_name):
+                console.print(f"[yellow]Schema for table '{table_name}' not found[/yellow]")
+                raise typer.Exit(1)
 
-                if not tables:
-                    console.print("[yellow]No schemas to clear[/yellow]")
+            if not force:
+                confirm = typer.confirm(f"Clear schema for '{table_name}'?")
+                if not confirm:
+                    console.print("[yellow]Cancelled[/yellow]")
                     raise typer.Exit(0)
 
-                if not force:
-                    console.print(f"[yellow]This will clear {len(tables)} schema(s):[/yellow]")
-                    for t in tables:
-                        console.print(f"  • {t}")
-                    console.print()
-                    confirm = typer.confirm("Continue?")
-                    if not confirm:
-                        console.print("[yellow]Cancelled[/yellow]")
-                        raise typer.Exit(0)
+            # Remove from registry (would need to add remove method)
+            console.print(f"[green]✓ Schema for '{table_name}' cleared[/green]")
+            console.print("[dim]Note: This only affects the current session[/dim]\n")
+        else:
+            tables = registry.list_tables()
 
-                console.print(f"[green]✓ Cleared {len(tables)} schema(s)[/green]")
-                console.print("[dim]Note: This only affects the current session[/dim]\n")
+            if not tables:
+                console.print("[yellow]No schemas to clear[/yellow]")
+                raise typer.Exit(0)
+
+            if not force:
+                console.print(f"[yellow]This will clear {len(tables)} schema(s):[/yellow]")
+                for t in tables:
+                    console.print(f"  • {t}")
+                console.print()
+                confirm = typer.confirm("Continue?")
+                if not confirm:
+                    console.print("[yellow]Cancelled[/yellow]")
+                    raise typer.Exit(0)
+
+            console.print(f"[green]✓ Cleared {len(tables)} schema(s)[/green]")
+            console.print("[dim]Note: This only affects the current session[/dim]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
@@ -1250,6 +1385,9 @@ def config_show(
     config_file: str | None = typer.Option(None, "--config", help="Config file path"),
 ) -> None:
     """Show schema configuration."""
+    from rich.table import Table
+
+    console = _console()
     settings = load_config(config_file)
 
     # Display schema configuration
@@ -1276,6 +1414,7 @@ def config_set(
     value: str = typer.Argument(..., help="Config value"),
 ) -> None:
     """Set schema configuration value."""
+    console = _console()
     console.print(
         f"[yellow]Runtime schema config setting not yet implemented: schema.{key} = {value}[/yellow]"
     )
@@ -1288,6 +1427,7 @@ def config_get(
     config_file: str | None = typer.Option(None, "--config", help="Config file path"),
 ) -> None:
     """Get schema configuration value."""
+    console = _console()
     settings = load_config(config_file)
 
     if key == "file":
@@ -1,10 +1,20 @@
 """ORM model generation from YAML schemas."""
 
+from dataclasses import dataclass
 from pathlib import Path
 
 from iptvportal.schema.table import FieldType, SchemaLoader, SchemaRegistry, TableSchema
 
 
+@dataclass(slots=True, frozen=True)
+class GeneratedModel:
+    """Сгенерированная модель и имена, под которыми она сохраняется."""
+
+    class_name: str
+    file_name: str
+    code: str
+
+
 class ORMGenerator:
     """
     Генератор ORM моделей из YAML схем.
@@ -153,7 +163,29 @@ class ORMGenerator:
         Returns:
             Словарь {table_name: generated_code}
         """
+        models = self.generate_model_files(output_format, output_dir, include_relationships)
+        return {table_name: model.code for table_name, model in models.items()}
+
+    def generate_model_files(
+        self,
+        output_format: str = "sqlmodel",
+        output_dir: Path | None = None,
+        include_relationships: bool = True,
+    ) -> dict[str, GeneratedModel]:
+        """
+        Генерирует модели для всех таблиц вместе с именами классов и файлов.
+
+        Args:
+            output_format: Формат вывода ('sqlmodel' или 'pydantic')
+            output_dir: Директория для сохранения файлов (опционально)
+            include_relationships: Включать ли relationships (только для sqlmodel)
+
+        Returns:
+            Словарь {table_name: GeneratedModel}
+        """
         results = {}
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
 
         for table_name in self.registry.list_tables():
             if output_format == "sqlmodel":
@@ -163,14 +195,13 @@ class ORMGenerator:
             else:
                 raise ValueError(f"Unsupported output format: {output_format}")
 
-            results[table_name] = code
+            class_name = self._table_name_to_class_name(table_name)
+            model = GeneratedModel(class_name, f"{class_name.lower()}.py", code)
+            results[table_name] = model
 
             # Сохранить в файл если указана директория
             if output_dir:
-                output_dir.mkdir(parents=True, exist_ok=True)
-                class_name = self._table_name_to_class_name(table_name)
-                file_path = output_dir / f"{class_name.lower()}.py"
-                file_path.write_text(code, encoding="utf-8")
+                (output_dir / model.file_name).write_text(code, encoding="utf-8")
 
         return results
 
@@ -372,4 +403,4 @@ class ORMGenerator:
         return generator.generate_all_models(output_format, output_dir, include_relationships)
 
 
-__all__ = ["ORMGenerator"]
+__all__ = ["GeneratedModel", "ORMGenerator"]
@@ -141,64 +141,96 @@ class SchemaIntrospector:
         - Количество строк (COUNT(*))
         - MAX(id), MIN(id) если есть поле id
         - Диапазоны timestamp полей (MIN/MAX)
+
+        Запросы независимы, поэтому выполняются параллельно.
         """
         metadata = TableMetadata()
         metadata.analyzed_at = datetime.now().isoformat()
 
-        # Подсчёт строк
+        has_id = any(f.name == "id" for f in fields.values())
+        # Найти timestamp поля
+        timestamp_fields = [
+            f for f in fields.values() if f.field_type in (FieldType.DATETIME, FieldType.DATE)
+        ]
+
+        row_count, id_stats, ranges = await asyncio.gather(
+            self._count_rows(table_name),
+            self._id_stats(table_name) if has_id else asyncio.sleep(0, result=None),
+            self._timestamp_ranges(table_name, timestamp_fields),
+        )
+
+        metadata.row_count = row_count
+        if id_stats:
+            metadata.max_id, metadata.min_id = id_stats
+        for ts_field, ts_range in zip(timestamp_fields, ranges, strict=True):
+            if ts_range:
+                metadata.timestamp_ranges[ts_field.name] = ts_range
+
+        return metadata
+
+    async def _count_rows(self, table_name: str) -> int:
+        """Подсчёт строк (COUNT(*)), 0 при ошибке."""
         try:
             sql = f"SELECT COUNT(*) FROM {table_name}"
             jsonsql = self.transpiler.transpile(sql)
             count_query = {"jsonrpc": "2.0", "id": 2, "method": "select", "params": jsonsql}
             count_result = await self.client.execute(count_query)
-            if count_result and len(count_result) > 0:
-                metadata.row_count = (
-                    int(count_result[0][0]) if count_result[0][0] is not None else 0
-                )
+            if count_result and len(count_result) > 0 and count_result[0][0] is not None:
+                return int(count_result[0][0])
         except Exception as e:
             print(f"Warning: Could not count rows: {e}")
-            metadata.row_count = 0
+        return 0
 
-        # Получить MAX(id) и MIN(id) если есть поле id
-        id_field = next((f for f in fields.values() if f.name == "id"), None)
-        if id_field:
-            try:
-                sql = f"SELECT MAX(id), MIN(id) FROM {table_name}"
-                jsonsql = self.transpiler.transpile(sql)
-                id_stats_query = {"jsonrpc": "2.0", "id": 3, "method": "select", "params": jsonsql}
-                id_result = await self.client.execute(id_stats_query)
-                if id_result and len(id_result) > 0:
-                    max_id = id_result[0][0]
-                    min_id = id_result[0][1]
-                    metadata.max_id = int(max_id) if max_id is not None else None
-                    metadata.min_id = int(min_id) if min_id is not None else None
-            except Exception as e:
-                print(f"Warning: Could not get ID statistics: {e}")
-
-        # Найти timestamp поля и получить их диапазоны
-        timestamp_fields = [
-            f for f in fields.values() if f.field_type in (FieldType.DATETIME, FieldType.DATE)
-        ]
-
-        for idx, ts_field in enumerate(timestamp_fields, start=4):
-            try:
-                sql = f"SELECT MIN({ts_field.name}), MAX({ts_field.name}) FROM {table_name}"
-                jsonsql = self.transpiler.transpile(sql)
-                range_query = {"jsonrpc": "2.0", "id": idx, "method": "select", "params": jsonsql}
-                range_result = await self.client.execute(range_query)
-                if range_result and len(range_result) > 0:
-                    min_val = range_result[0][0]
-                    max_val = range_result[0][1]
-
-                    if min_val is not None or max_val is not None:
-                        metadata.timestamp_ranges[ts_field.name] = {
-                            "min": str(min_val) if min_val else None,
-                            "max": str(max_val) if max_val else None,
-                        }
-            except Exception as e:
-                print(f"Warning: Could not get range for {ts_field.name}: {e}")
+    async def _id_stats(self, table_name: str) -> tuple[int | None, int | None] | None:
+        """Получить (MAX(id), MIN(id)), None при ошибке."""
+        try:
+            sql = f"SELECT MAX(id), MIN(id) FROM {table_name}"
+            jsonsql = self.transpiler.transpile(sql)
+            id_stats_query = {"jsonrpc": "2.0", "id": 3, "method": "select", "params": jsonsql}
+            id_result = await self.client.execute(id_stats_query)
+            if id_result and len(id_result) > 0:
+                max_id = id_result[0][0]
+                min_id = id_result[0][1]
+                return (
+                    int(max_id) if max_id is not None else None,
+                    int(min_id) if min_id is not None else None,
+                )
+        except Exception as e:
+            print(f"Warning: Could not get ID statistics: {e}")
+        return None
+
+    async def _timestamp_ranges(
+        self, table_name: str, timestamp_fields: list[FieldDefinition]
+    ) -> list[dict[str, str | None] | None]:
+        """Диапазоны всех timestamp полей, запрашиваемые параллельно."""
+        return await asyncio.gather(
+            *(
+                self._timestamp_range(table_name, ts_field.name, idx)
+                for idx, ts_field in enumerate(timestamp_fields, start=4)
+            )
+        )
 
-        return metadata
+    async def _timestamp_range(
+        self, table_name: str, field_name: str, request_id: int
+    ) -> dict[str, str | None] | None:
+        """Получить диапазон (MIN/MAX) timestamp поля, None если пусто или при ошибке."""
+        try:
+            sql = f"SELECT MIN({field_name}), MAX({field_name}) FROM {table_name}"
+            jsonsql = self.transpiler.transpile(sql)
+            range_query = {"jsonrpc": "2.0", "id": request_id, "method": "select", "params": jsonsql}
+            range_result = await self.client.execute(range_query)
+            if range_result and len(range_result) > 0:
+                min_val = range_result[0][0]
+                max_val = range_result[0][1]
+
+                if min_val is not None or max_val is not None:
+                    return {
+                        "min": str(min_val) if min_val else None,
+                        "max": str(max_val) if max_val else None,
+                    }
+        except Exception as e:
+            print(f"Warning: Could not get range for {field_name}: {e}")
+        return None
 
     async def _perform_duckdb_analysis(
         self, table_name: str, fields: dict[int, FieldDefinition], sample_size: int
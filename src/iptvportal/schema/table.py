@@ -14,6 +14,8 @@ try:
     import yaml
 
     HAS_YAML = True
+    # C-загрузчик libyaml, если PyYAML собран с ним
+    YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     HAS_YAML = False
 
@@ -33,6 +35,9 @@ except ImportError:
     HAS_SQLMODEL = False
     SQLModel = None
 
+# Описание полей, созданных TableSchema.auto_generate
+AUTO_GENERATED_DESCRIPTION = "Auto-generated field"
+
 
 class FieldType(Enum):
     """Типы полей таблиц."""
@@ -283,12 +288,23 @@ class TableSchema:
         metadata: TableMetadata | None = None,
     ):
         self.table_name = table_name
+        # Поля храним в порядке позиций: обход fields.items() не требует сортировки
+        if list(fields) != sorted(fields):
+            fields = dict(sorted(fields.items()))
         self.fields = fields
         self.total_fields = total_fields
         self.pydantic_model = pydantic_model
         self.sync_config = sync_config or SyncConfig()
         self.metadata = metadata
 
+    @property
+    def is_auto_generated(self) -> bool:
+        """Схема без полей или только с автоматически определёнными полями."""
+        for field_def in self.fields.values():
+            if field_def.description != AUTO_GENERATED_DESCRIPTION:
+                return False
+        return True
+
     @staticmethod
     def auto_generate(
         table_name: str, sample_row: list[Any], field_name_overrides: dict[int, str] | None = None
@@ -324,7 +340,7 @@ class TableSchema:
                 name=field_name,
                 position=position,
                 field_type=field_type,
-                description="Auto-generated field"
+                description=AUTO_GENERATED_DESCRIPTION
                 if position not in field_name_overrides
                 else "Manually specified field",
             )
@@ -433,20 +449,18 @@ class TableSchema:
         if not self.total_fields and not self.fields:
             return ["*"]
 
-        max_position = self.total_fields or (max(self.fields.keys()) + 1 if self.fields else 0)
-        result = []
+        max_position = self.total_fields or max(self.fields) + 1
+        fields = self.fields
 
-        for pos in range(max_position):
-            if pos in self.fields:
-                field_def = self.fields[pos]
-                if use_aliases:
-                    result.append(field_def.mapped_name)
-                else:
-                    result.append(field_def.name)
-            else:
-                result.append(f"Field_{pos}")
-
-        return result
+        if use_aliases:
+            return [
+                field_def.mapped_name if (field_def := fields.get(pos)) else f"Field_{pos}"
+                for pos in range(max_position)
+            ]
+        return [
+            field_def.name if (field_def := fields.get(pos)) else f"Field_{pos}"
+            for pos in range(max_position)
+        ]
 
     def get_field_by_name(self, name: str) -> FieldDefinition | None:
         """Получить определение поля по имени (ищет по name, alias, python_name)."""
@@ -567,6 +581,18 @@ class SchemaRegistry:
         """Получить список всех зарегистрированных таблиц."""
         return list(self._schemas.keys())
 
+    def list_tables_metadata(self) -> list[tuple[str, int | None, int, bool]]:
+        """
+        Получить краткие сведения о всех таблицах за один проход по реестру.
+
+        Returns:
+            Кортежи (table_name, total_fields, defined_fields, is_auto_generated)
+        """
+        return [
+            (name, schema.total_fields, len(schema.fields), schema.is_auto_generated)
+            for name, schema in self._schemas.items()
+        ]
+
 
 class SchemaBuilder:
     """Билдер для удобного создания схем таблиц (fluent API)."""
@@ -651,7 +677,7 @@ class SchemaLoader:
             raise ImportError("PyYAML is not installed. Install it with: pip install pyyaml")
 
         with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_SAFE_LOADER)
 
         return SchemaLoader._parse_config(data)
 
@@ -706,6 +732,9 @@ class SchemaLoader:
         fields_config = config.get("fields", {})
         for pos_str, field_config in fields_config.items():
             position = int(pos_str)
+            # Ключи "1" и 1 (или "01") дают одну позицию — не перезаписываем молча
+            if position in fields:
+                raise ValueError(f"duplicate field position {position} in table '{table_name}'")
 
             # Получить тип поля
             field_type_str = field_config.get("type", "unknown")
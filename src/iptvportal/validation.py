@@ -1,6 +1,8 @@
 """Data-driven validation of remote field mappings using pandas."""
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 try:
@@ -90,72 +92,100 @@ class RemoteFieldValidator:
             if not result_all or not result_remote:
                 raise ValueError(f"Empty result from table '{table_name}'")
 
-            # Извлечь данные по позиции из SELECT *
-            local_values = [
-                row[local_position] if len(row) > local_position else None for row in result_all
-            ]
-
             # Извлечь данные из SELECT remote_column
             remote_values = [row[0] if row else None for row in result_remote]
 
-            # Создать pandas Series для анализа
-            pd.Series(local_values, name=f"field_{local_position}")
-            remote_series = pd.Series(remote_values, name=remote_column_name)
-
-            # Расчёт match ratio
-            # Сравниваем значения, учитывая None/NaN
-            matches = 0
-            total = min(len(local_values), len(remote_values))
-
-            for i in range(total):
-                local_val = local_values[i]
-                remote_val = remote_values[i]
-
-                # Считаем совпадением если оба None или значения равны
-                if (local_val is None and remote_val is None) or (
-                    local_val is not None and remote_val is not None and local_val == remote_val
-                ):
-                    matches += 1
-
-            match_ratio = matches / total if total > 0 else 0.0
-
-            # Анализ данных через pandas
-            dtype_str = str(remote_series.dtype)
-            null_count = int(remote_series.isna().sum())
-            unique_count = int(remote_series.nunique())
-
-            # Определить min/max для числовых и datetime типов
-            min_value = None
-            max_value = None
-
-            if pd.api.types.is_numeric_dtype(remote_series):
-                min_value = float(remote_series.min()) if not pd.isna(remote_series.min()) else None
-                max_value = float(remote_series.max()) if not pd.isna(remote_series.max()) else None
-            elif pd.api.types.is_datetime64_any_dtype(remote_series):
-                min_value = str(remote_series.min()) if not pd.isna(remote_series.min()) else None
-                max_value = str(remote_series.max()) if not pd.isna(remote_series.max()) else None
-
-            return {
-                "match_ratio": match_ratio,
-                "sample_size": total,
-                "validated_at": datetime.now().isoformat(),
-                "dtype": dtype_str,
-                "null_count": null_count,
-                "unique_count": unique_count,
-                "min_value": min_value,
-                "max_value": max_value,
-                "remote_column": remote_column_name,
-            }
+            return self._analyze_mapping(
+                result_all, local_position, remote_values, remote_column_name
+            )
 
         except Exception as e:
             raise ValueError(
                 f"Failed to validate field mapping for '{remote_column_name}': {e}"
             ) from e
 
-    def infer_field_type_from_dtype(self, dtype_str: str) -> str:
+    def _analyze_mapping(
+        self,
+        rows_all: list[list[Any]],
+        local_position: int,
+        remote_values: list[Any],
+        remote_column_name: str,
+    ) -> dict[str, Any]:
+        """
+        Сравнить значения позиции из SELECT * со значениями remote-колонки.
+
+        Args:
+            rows_all: Строки из SELECT *
+            local_position: Позиция поля в локальной схеме (0-based)
+            remote_values: Значения remote-колонки в том же порядке строк
+            remote_column_name: Имя remote колонки
+
+        Returns:
+            Метаданные валидации (см. validate_field_mapping)
+        """
+        # Извлечь данные по позиции из SELECT *
+        local_values = [
+            row[local_position] if len(row) > local_position else None for row in rows_all
+        ]
+
+        # Создать pandas Series для анализа
+        pd.Series(local_values, name=f"field_{local_position}")
+        remote_series = pd.Series(remote_values, name=remote_column_name)
+
+        # Расчёт match ratio
+        # Сравниваем значения, учитывая None/NaN
+        matches = 0
+        total = min(len(local_values), len(remote_values))
+
+        for i in range(total):
+            local_val = local_values[i]
+            remote_val = remote_values[i]
+
+            # Считаем совпадением если оба None или значения равны
+            if (local_val is None and remote_val is None) or (
+                local_val is not None and remote_val is not None and local_val == remote_val
+            ):
+                matches += 1
+
+        match_ratio = matches / total if total > 0 else 0.0
+
+        # Анализ данных через pandas
+        dtype_str = str(remote_series.dtype)
+        null_count = int(remote_series.isna().sum())
+        unique_count = int(remote_series.nunique())
+
+        # Определить min/max для числовых и datetime типов
+        min_value = None
+        max_value = None
+
+        if pd.api.types.is_numeric_dtype(remote_series):
+            min_value = float(remote_series.min()) if not pd.isna(remote_series.min()) else None
+            max_value = float(remote_series.max()) if not pd.isna(remote_series.max()) else None
+        elif pd.api.types.is_datetime64_any_dtype(remote_series):
+            min_value = str(remote_series.min()) if not pd.isna(remote_series.min()) else None
+            max_value = str(remote_series.max()) if not pd.isna(remote_series.max()) else None
+
+        return {
+            "match_ratio": match_ratio,
+            "sample_size": total,
+            "validated_at": datetime.now().isoformat(),
+            "dtype": dtype_str,
+            "null_count": null_count,
+            "unique_count": unique_count,
+            "min_value": min_value,
+            "max_value": max_value,
+            "remote_column": remote_column_name,
+        }
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def infer_field_type_from_dtype(dtype_str: str) -> str:
         """
         Определить FieldType из pandas dtype.
 
+        Не требует pandas и экземпляра валидатора; результат кэшируется,
+        т.к. одни и те же dtype повторяются во многих колонках.
+
         Args:
             dtype_str: Строка с pandas dtype (например, 'int64', 'float64', 'object', 'datetime64[ns]')
 
@@ -183,38 +213,167 @@ class RemoteFieldValidator:
         table_name: str,
         field_mappings: dict[int, str],
         sample_size: int = 1000,
+        concurrency: int = 16,
     ) -> dict[int, dict[str, Any]]:
         """
         Валидация всей схемы таблицы (множественные поля).
 
+        Поля проверяются параллельно, не более ``concurrency`` одновременно,
+        так что общее время определяется задержкой сети, а не числом полей.
+
+        Args:
+            table_name: Имя таблицы
+            field_mappings: Словарь {local_position: remote_column_name}
+            sample_size: Размер выборки для валидации
+            concurrency: Максимальное число одновременно проверяемых полей
+
+        Returns:
+            Словарь {position: validation_metadata} в порядке field_mappings
+        """
+        return await self._validate_fields(
+            table_name, field_mappings, sample_size, asyncio.Semaphore(concurrency)
+        )
+
+    async def _validate_fields(
+        self,
+        table_name: str,
+        field_mappings: dict[int, str],
+        sample_size: int,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Проверить поля по одному, не превышая лимит ``semaphore``.
+
+        Семафор передаётся снаружи, чтобы несколько вызовов делили один лимит.
+        """
+
+        async def validate_one(position: int, remote_col: str) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.validate_field_mapping(
+                        table_name=table_name,
+                        local_position=position,
+                        remote_column_name=remote_col,
+                        sample_size=sample_size,
+                    )
+                except Exception as e:
+                    return self._failed_result(position, remote_col, e)
+
+        validations = await asyncio.gather(
+            *(validate_one(position, remote_col) for position, remote_col in field_mappings.items())
+        )
+        return dict(zip(field_mappings, validations, strict=True))
+
+    async def validate_table_schema_batch(
+        self,
+        table_name: str,
+        field_mappings: dict[int, str],
+        sample_size: int = 1000,
+        batch_size: int = 50,
+        concurrency: int = 16,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Валидация всей схемы таблицы с пакетной выборкой remote-колонок.
+
+        Образец SELECT * запрашивается один раз, а remote-колонки выбираются
+        одним SELECT на каждые ``batch_size`` полей: вместо 2 × N запросов
+        выполняется 1 + ceil(N / batch_size). Если пакетный запрос не удался
+        (например, одной из колонок не существует), поля этого пакета
+        проверяются по одному, чтобы ошибка относилась к конкретному полю.
+
+        До ``concurrency`` запросов (включая проверку по одному) выполняются
+        одновременно, и каждый пакет
+        анализируется сразу после получения своих колонок, не дожидаясь
+        остальных пакетов.
+
         Args:
             table_name: Имя таблицы
             field_mappings: Словарь {local_position: remote_column_name}
             sample_size: Размер выборки для валидации
+            batch_size: Максимальное число колонок в одном SELECT
+            concurrency: Максимальное число одновременных запросов
 
         Returns:
-            Словарь {position: validation_metadata}
+            Словарь {position: validation_metadata} в порядке field_mappings
         """
-        results = {}
+        if not field_mappings:
+            return {}
+
+        from .jsonsql import SQLTranspiler
+
+        transpiler = SQLTranspiler()
+        mappings = list(field_mappings.items())
+        batches = [mappings[i : i + batch_size] for i in range(0, len(mappings), batch_size)]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def select(columns: str, query_id: int) -> Any:
+            sql = f"SELECT {columns} FROM {table_name} LIMIT {sample_size}"
+            query = {
+                "jsonrpc": "2.0",
+                "id": query_id,
+                "method": "select",
+                "params": transpiler.transpile(sql),
+            }
+            async with semaphore:
+                return await self.client.execute(query)
+
+        # Каждый пакет сравнивается с одним и тем же SELECT *: запускаем его
+        # один раз, а пакеты анализируются по мере получения своих колонок
+        rows_all_task = asyncio.ensure_future(select("*", 1))
 
-        for position, remote_col in field_mappings.items():
+        async def validate_batch(
+            batch: list[tuple[int, str]], query_id: int
+        ) -> dict[int, dict[str, Any]]:
             try:
-                validation_result = await self.validate_field_mapping(
-                    table_name=table_name,
-                    local_position=position,
-                    remote_column_name=remote_col,
-                    sample_size=sample_size,
+                rows = await select(", ".join(remote_col for _, remote_col in batch), query_id)
+                rows_all = await rows_all_task
+            except Exception:
+                # Узнать, какое именно поле не проходит, можно только по одному
+                return await self._validate_fields(table_name, dict(batch), sample_size, semaphore)
+
+            batch_results = {}
+            for index, (position, remote_col) in enumerate(batch):
+                try:
+                    if not rows_all or not rows:
+                        raise ValueError(f"Empty result from table '{table_name}'")
+                    remote_values = [row[index] if len(row) > index else None for row in rows]
+                    batch_results[position] = self._analyze_mapping(
+                        rows_all, position, remote_values, remote_col
+                    )
+                except Exception as e:
+                    batch_results[position] = self._failed_result(position, remote_col, e)
+            return batch_results
+
+        try:
+            validations = await asyncio.gather(
+                *(
+                    validate_batch(batch, query_id)
+                    for query_id, batch in enumerate(batches, start=2)
                 )
-                results[position] = validation_result
-            except Exception as e:
-                print(f"Warning: Validation failed for position {position} -> {remote_col}: {e}")
-                results[position] = {
-                    "error": str(e),
-                    "validated_at": datetime.now().isoformat(),
-                    "remote_column": remote_col,
-                }
-
-        return results
+            )
+        finally:
+            # Никто мог не дождаться SELECT * (все пакеты упали раньше или
+            # gather отменён): отменить его или забрать исключение
+            if not rows_all_task.done():
+                rows_all_task.cancel()
+            elif not rows_all_task.cancelled():
+                rows_all_task.exception()
+
+        results: dict[int, dict[str, Any]] = {}
+        for batch_results in validations:
+            results.update(batch_results)
+
+        return {position: results[position] for position in field_mappings}
+
+    @staticmethod
+    def _failed_result(position: int, remote_col: str, error: Exception) -> dict[str, Any]:
+        """Метаданные для поля, валидация которого завершилась ошибкой."""
+        print(f"Warning: Validation failed for position {position} -> {remote_col}: {error}")
+        return {
+            "error": str(error),
+            "validated_at": datetime.now().isoformat(),
+            "remote_column": remote_col,
+        }
 
 
 __all__ = ["RemoteFieldValidator"]
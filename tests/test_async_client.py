@@ -0,0 +1,106 @@
+"""Tests for the asynchronous IPTVPortal client."""
+
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import orjson
+import pytest
+from pydantic import SecretStr
+
+from iptvportal.config.settings import IPTVPortalSettings
+from iptvportal.core.async_client import AsyncIPTVPortalClient
+from iptvportal.core.auth import load_persisted_session, persist_session
+from iptvportal.exceptions import APIError
+
+
+@pytest.fixture
+def client():
+    """Create a client with a mocked, already connected HTTP session."""
+    settings = IPTVPortalSettings(
+        domain="test",
+        username="test_user",
+        password=SecretStr("test_password"),
+        max_retries=0,
+    )
+    client = AsyncIPTVPortalClient(settings)
+    client._http_client = Mock()
+    client._http_client.post = AsyncMock()
+    client._session_id = "session"
+    return client
+
+
+def respond_with(client, body):
+    """Make the mocked HTTP client return the given JSON body."""
+    response = Mock()
+    response.content = orjson.dumps(body)
+    client._http_client.post.return_value = response
+
+
+class TestExecute:
+    """Tests for single-request execution."""
+
+    async def test_returns_result(self, client):
+        """Test that the result member of the response is returned."""
+        respond_with(client, {"jsonrpc": "2.0", "id": 1, "result": [[1]]})
+
+        assert await client.execute({"jsonrpc": "2.0", "id": 1, "method": "select"}) == [[1]]
+
+    async def test_api_error_is_raised_as_is(self, client):
+        """Test that a JSON-RPC error is surfaced as APIError without retrying."""
+        respond_with(client, {"jsonrpc": "2.0", "id": 1, "error": {"message": "denied"}})
+
+        with pytest.raises(APIError, match="denied"):
+            await client.execute({"jsonrpc": "2.0", "id": 1, "method": "select"})
+        client._http_client.post.assert_called_once()
+
+
+class TestExecuteRpcBatch:
+    """Tests for JSON-RPC batch execution."""
+
+    async def test_sends_one_request_and_orders_results(self, client):
+        """Test that results are matched to requests by id."""
+        queries = [
+            {"jsonrpc": "2.0", "id": 1, "method": "select", "params": {"from": "a"}},
+            {"jsonrpc": "2.0", "id": 2, "method": "select", "params": {"from": "b"}},
+        ]
+        respond_with(
+            client,
+            [
+                {"jsonrpc": "2.0", "id": 2, "result": [[2]]},
+                {"jsonrpc": "2.0", "id": 1, "error": {"message": "denied"}},
+            ],
+        )
+
+        first, second = await client.execute_rpc_batch(queries)
+
+        client._http_client.post.assert_called_once()
+        assert orjson.loads(client._http_client.post.call_args.kwargs["content"]) == queries
+        assert isinstance(first, APIError)
+        assert str(first) == "denied"
+        assert second == [[2]]
+
+    async def test_whole_batch_rejected(self, client):
+        """Test that a single error object for the batch raises."""
+        respond_with(client, {"jsonrpc": "2.0", "id": None, "error": {"message": "no batch"}})
+
+        with pytest.raises(APIError, match="no batch"):
+            await client.execute_rpc_batch([{"jsonrpc": "2.0", "id": 1, "method": "select"}])
+
+
+class TestSessionInvalidation:
+    """Tests for dropping the saved session after HTTP auth errors."""
+
+    @pytest.mark.parametrize(("status", "kept"), [(401, False), (403, True)])
+    async def test_only_unauthorized_clears_saved_session(self, client, tmp_path, status, kept):
+        """Test that 401 forgets the saved session while 403 keeps it."""
+        client.settings.session_cache_dir = str(tmp_path)
+        persist_session(client.settings, "session", time.time())
+        client._http_client.post.return_value = httpx.Response(
+            status, request=httpx.Request("POST", client.settings.api_url)
+        )
+
+        with pytest.raises(APIError, match=str(status)):
+            await client.execute({"jsonrpc": "2.0", "id": 1, "method": "select"})
+
+        assert (load_persisted_session(client.settings) is not None) is kept
@@ -9,7 +9,7 @@ import pytest
 from pydantic import SecretStr
 
 from iptvportal.config.settings import IPTVPortalSettings
-from iptvportal.core.auth import AsyncAuthManager, AuthManager
+from iptvportal.core.auth import AsyncAuthManager, AuthManager, load_persisted_session
 from iptvportal.exceptions import AuthenticationError
 
 
@@ -336,6 +336,64 @@ class TestSessionCaching:
         assert auth_manager.session_id == "test_session"
 
 
+class TestPersistedSession:
+    """Tests for sessions shared across processes via session_cache_dir."""
+
+    @staticmethod
+    def _login(settings, session_id="persisted_session"):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps(
+            {"jsonrpc": "2.0", "id": 1, "result": {"session_id": session_id}}
+        )
+        mock_client = Mock(spec=httpx.Client)
+        mock_client.post.return_value = mock_response
+        return AuthManager(settings).authenticate(mock_client)
+
+    def test_new_manager_reuses_persisted_session(self, test_settings, tmp_path):
+        """Test that a later manager skips the auth request."""
+        test_settings.session_cache_dir = str(tmp_path)
+        self._login(test_settings)
+
+        mock_client = Mock(spec=httpx.Client)
+        session_id = AuthManager(test_settings).authenticate(mock_client)
+
+        assert session_id == "persisted_session"
+        mock_client.post.assert_not_called()
+
+    def test_file_is_owner_only(self, test_settings, tmp_path):
+        """Test that the session file is not readable by other users."""
+        test_settings.session_cache_dir = str(tmp_path)
+        self._login(test_settings)
+
+        (path,) = tmp_path.iterdir()
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_session_is_ignored(self, test_settings, tmp_path):
+        """Test that a persisted session older than session_ttl is not reused."""
+        test_settings.session_cache_dir = str(tmp_path)
+        self._login(test_settings)
+        test_settings.session_ttl = 0
+
+        assert load_persisted_session(test_settings) is None
+
+    def test_invalidate_removes_file(self, test_settings, tmp_path):
+        """Test that invalidate forgets the session in memory and on disk."""
+        test_settings.session_cache_dir = str(tmp_path)
+        self._login(test_settings)
+
+        auth_manager = AuthManager(test_settings)
+        auth_manager.invalidate()
+
+        assert auth_manager.session_id is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disabled_without_cache_dir(self, test_settings):
+        """Test that nothing is persisted by default."""
+        assert test_settings.session_cache_dir is None
+        assert load_persisted_session(test_settings) is None
+
+
 class TestAuthenticationIntegration:
     """Integration tests for authentication with settings."""
 
@@ -0,0 +1,37 @@
+"""Tests for CLI utility helpers."""
+
+import pytest
+from pydantic import ValidationError
+
+from iptvportal.cli.utils import parse_json_param
+
+
+class TestParseJsonParam:
+    """Tests for JSON option parsing."""
+
+    def test_none_passes_through(self):
+        """Test that a missing option stays None."""
+        assert parse_json_param(None, "where") is None
+
+    def test_untyped_param_accepts_any_json(self):
+        """Test that parsing without a kind accepts any JSON value."""
+        assert parse_json_param("[1, 2]") == [1, 2]
+
+    def test_where_must_be_object(self):
+        """Test that WHERE conditions are validated as objects."""
+        assert parse_json_param('{"eq": ["id", 1]}', "where") == {"eq": ["id", 1]}
+
+        with pytest.raises(ValidationError):
+            parse_json_param('["id", 1]', "where")
+
+    def test_values_must_be_rows(self):
+        """Test that INSERT values are validated as a list of rows."""
+        assert parse_json_param('[["a", 1], ["b", 2]]', "values") == [["a", 1], ["b", 2]]
+
+        with pytest.raises(ValidationError):
+            parse_json_param('["a", 1]', "values")
+
+    def test_invalid_json_is_rejected(self):
+        """Test that malformed JSON is rejected for typed params."""
+        with pytest.raises(ValidationError):
+            parse_json_param("{not json", "set")
@@ -0,0 +1,121 @@
+"""Tests for the synchronous IPTVPortal client."""
+
+import time
+from unittest.mock import Mock
+
+import httpx
+import orjson
+import pytest
+from pydantic import SecretStr
+
+from iptvportal.config.settings import IPTVPortalSettings
+from iptvportal.core.auth import load_persisted_session, persist_session
+from iptvportal.core.client import IPTVPortalClient
+from iptvportal.exceptions import APIError
+
+
+@pytest.fixture
+def client():
+    """Create a client with a mocked, already connected HTTP session."""
+    settings = IPTVPortalSettings(
+        domain="test",
+        username="test_user",
+        password=SecretStr("test_password"),
+        max_retries=0,
+    )
+    client = IPTVPortalClient(settings)
+    client._http_client = Mock()
+    client._session_id = "session"
+    return client
+
+
+def respond_with(client, body):
+    """Make the mocked HTTP client return the given JSON body."""
+    response = Mock()
+    response.content = orjson.dumps(body)
+    client._http_client.post.return_value = response
+
+
+class TestExecute:
+    """Tests for single-request execution."""
+
+    def test_api_error_is_raised_as_is(self, client):
+        """Test that a JSON-RPC error is surfaced as APIError."""
+        respond_with(client, {"jsonrpc": "2.0", "id": 1, "error": {"message": "denied"}})
+
+        with pytest.raises(APIError, match="denied"):
+            client.execute({"jsonrpc": "2.0", "id": 1, "method": "select", "params": {}})
+
+
+class TestExecuteRpcBatch:
+    """Tests for JSON-RPC batch execution."""
+
+    def test_sends_one_request_and_orders_results(self, client):
+        """Test that results are matched to requests by id."""
+        queries = [
+            {"jsonrpc": "2.0", "id": 1, "method": "select", "params": {"from": "a"}},
+            {"jsonrpc": "2.0", "id": 2, "method": "select", "params": {"from": "b"}},
+        ]
+        respond_with(
+            client,
+            [
+                {"jsonrpc": "2.0", "id": 2, "result": [[2]]},
+                {"jsonrpc": "2.0", "id": 1, "result": [[1]]},
+            ],
+        )
+
+        assert client.execute_rpc_batch(queries) == [[[1]], [[2]]]
+        client._http_client.post.assert_called_once()
+        assert orjson.loads(client._http_client.post.call_args.kwargs["content"]) == queries
+
+    def test_per_request_errors(self, client):
+        """Test that failed and missing responses become APIError entries."""
+        queries = [
+            {"jsonrpc": "2.0", "id": 1, "method": "delete", "params": {}},
+            {"jsonrpc": "2.0", "id": 2, "method": "select", "params": {}},
+        ]
+        respond_with(client, [{"jsonrpc": "2.0", "id": 1, "error": {"message": "denied"}}])
+
+        first, second = client.execute_rpc_batch(queries)
+
+        assert isinstance(first, APIError)
+        assert str(first) == "denied"
+        assert isinstance(second, APIError)
+
+    def test_whole_batch_rejected(self, client):
+        """Test that a single error object for the batch raises."""
+        respond_with(client, {"jsonrpc": "2.0", "id": None, "error": {"message": "no batch"}})
+
+        with pytest.raises(APIError, match="no batch"):
+            client.execute_rpc_batch([{"jsonrpc": "2.0", "id": 1, "method": "select"}])
+
+    def test_string_errors_become_api_errors(self, client):
+        """Test that plain-string error members are wrapped like error objects."""
+        respond_with(client, [{"jsonrpc": "2.0", "id": 1, "error": "denied"}])
+
+        (result,) = client.execute_rpc_batch([{"jsonrpc": "2.0", "id": 1, "method": "select"}])
+
+        assert isinstance(result, APIError)
+        assert str(result) == "denied"
+
+        respond_with(client, {"jsonrpc": "2.0", "id": None, "error": "no batch"})
+        with pytest.raises(APIError, match="no batch"):
+            client.execute_rpc_batch([{"jsonrpc": "2.0", "id": 1, "method": "select"}])
+
+
+class TestSessionInvalidation:
+    """Tests for dropping the saved session after HTTP auth errors."""
+
+    @pytest.mark.parametrize(("status", "kept"), [(401, False), (403, True)])
+    def test_only_unauthorized_clears_saved_session(self, client, tmp_path, status, kept):
+        """Test that 401 forgets the saved session while 403 keeps it."""
+        client.settings.session_cache_dir = str(tmp_path)
+        persist_session(client.settings, "session", time.time())
+        client._http_client.post.return_value = httpx.Response(
+            status, request=httpx.Request("POST", client.settings.api_url)
+        )
+
+        with pytest.raises(APIError, match=str(status)):
+            client.execute({"jsonrpc": "2.0", "id": 1, "method": "select"})
+
+        assert (load_persisted_session(client.settings) is not None) is kept
@@ -295,3 +295,28 @@ class TestORMGenerator:
         """Test error handling for invalid output format."""
         with pytest.raises(ValueError, match="Unsupported output format"):
             generator.generate_all_models(output_format="invalid")
+
+    def test_generate_model_files_reports_names(self, registry, tmp_path):
+        """Test that generated models carry the class and file names written to disk."""
+        generator = ORMGenerator(registry)
+
+        output_dir = tmp_path / "models"
+        models = generator.generate_model_files(
+            output_format="pydantic", output_dir=output_dir, include_relationships=False
+        )
+
+        model = models["subscriber"]
+        assert model.class_name == "Subscriber"
+        assert (output_dir / model.file_name).read_text() == model.code
+
+    def test_load_and_generate_returns_code(self, tmp_path):
+        """Test that load_and_generate keeps returning source text per table."""
+        schema_path = tmp_path / "schemas.yaml"
+        schema_path.write_text(
+            "schemas:\n  media:\n    fields:\n      0: {name: id, type: integer}\n"
+        )
+
+        results = ORMGenerator.load_and_generate(schema_path, output_format="pydantic")
+
+        assert list(results) == ["media"]
+        assert "class Media(BaseModel):" in results["media"]
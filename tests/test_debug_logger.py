@@ -160,9 +160,9 @@ class TestDebugLogger:
         logger = DebugLogger(enabled=True)
         logger.log("test", {"key": "value"}, "Test Title")
         assert len(logger._logs) == 1
-        assert logger._logs[0]["step"] == "test"
-        assert logger._logs[0]["data"] == {"key": "value"}
-        assert logger._logs[0]["title"] == "Test Title"
+        assert logger._logs[0].step == "test"
+        assert logger._logs[0].data == {"key": "value"}
+        assert logger._logs[0].title == "Test Title"
 
     def test_log_with_secret_str(self, capsys):
         """Test that SecretStr is masked in console output."""
@@ -174,7 +174,7 @@ class TestDebugLogger:
         logger.log("config", data, "Configuration")
 
         # Verify data is stored as-is (not yet sanitized)
-        assert isinstance(logger._logs[0]["data"]["password"], SecretStr)
+        assert isinstance(logger._logs[0].data["password"], SecretStr)
 
         # Verify console output contains masked password
         captured = capsys.readouterr()
@@ -303,3 +303,13 @@ class TestDebugLogger:
 
         captured = capsys.readouterr()
         assert captured.out == ""
+
+    def test_save_to_file_text_without_title(self, tmp_path):
+        """Test that text logs fall back to the step name as heading."""
+        output_file = tmp_path / "debug.txt"
+        logger = DebugLogger(enabled=True, output_file=str(output_file))
+
+        logger.log("result", [1, 2])
+        logger.save_to_file()
+
+        assert "=== result ===" in output_file.read_text()
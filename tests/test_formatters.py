@@ -0,0 +1,65 @@
+"""Tests for CLI output formatters."""
+
+import json
+from unittest.mock import patch
+
+import yaml
+
+from iptvportal.cli.formatters import display_result, display_result_stream
+
+
+class TestDisplayResultStream:
+    """Tests for incremental result output."""
+
+    def test_json_stream_is_valid_array(self, capsys):
+        """Test that streamed JSON output parses back to the original rows."""
+        rows = [[1, "alice"], {"id": 2, "name": "bob"}]
+
+        display_result_stream(iter(rows), "json")
+
+        assert json.loads(capsys.readouterr().out) == rows
+
+    def test_json_stream_empty(self, capsys):
+        """Test that an empty result is written as an empty array."""
+        display_result_stream(iter([]), "json")
+
+        assert json.loads(capsys.readouterr().out) == []
+
+    def test_yaml_stream_is_sequence(self, capsys):
+        """Test that streamed YAML output is a single block sequence."""
+        rows = [{"id": 1}, {"id": 2}]
+
+        display_result_stream(iter(rows), "yaml")
+
+        assert yaml.safe_load(capsys.readouterr().out) == rows
+
+    def test_yaml_stream_dumps_once(self, capsys):
+        """Test that all rows are serialized in a single YAML dump."""
+        rows = [{"id": i} for i in range(5)]
+
+        with patch("iptvportal.cli.formatters.yaml.dump", wraps=yaml.dump) as dump:
+            display_result_stream(iter(rows), "yaml")
+
+        dump.assert_called_once()
+        assert yaml.safe_load(capsys.readouterr().out) == rows
+
+
+class TestDisplayResult:
+    """Tests for whole-result output."""
+
+    def test_piped_json_matches_indented_dump(self, capsys):
+        """Test that non-terminal JSON output is plain indented JSON."""
+        result = [{"id": 1, "name": "алиса"}, {"id": 2, "name": None}]
+
+        display_result(result, "json")
+
+        out = capsys.readouterr().out
+        assert out == json.dumps(result, indent=2, ensure_ascii=False) + "\n"
+
+    def test_dumps_json_handles_non_str_keys_and_objects(self):
+        """Test that int keys and non-JSON values are stringified."""
+        from datetime import date
+
+        from iptvportal.cli.formatters import dumps_json
+
+        assert json.loads(dumps_json({1: date(2024, 1, 2)})) == {"1": "2024-01-02"}
@@ -5,6 +5,7 @@ Run with:
     uv run pytest tests/test_introspector.py -v
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -251,6 +252,33 @@ class TestSchemaIntrospector:
         assert schema.sync_config.cache_strategy == "full"
         assert schema.sync_config.chunk_size == 100  # max(row_count, 100) = max(2, 100) = 100
 
+    @pytest.mark.asyncio
+    async def test_metadata_queries_run_concurrently(self, introspector, mock_client):
+        """Test that count, ID and timestamp queries are in flight together."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def execute(query):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {2: [[5]], 3: [[5, 1]]}.get(query["id"], [["2023-01-01", "2023-02-01"]])
+
+        mock_client.execute.side_effect = execute
+        fields = {
+            0: FieldDefinition(name="id", position=0, field_type=FieldType.INTEGER),
+            1: FieldDefinition(name="created_at", position=1, field_type=FieldType.DATETIME),
+        }
+
+        metadata = await introspector._gather_metadata("users", fields)
+
+        assert max_in_flight == 3
+        assert metadata.row_count == 5
+        assert (metadata.max_id, metadata.min_id) == (5, 1)
+        assert metadata.timestamp_ranges["created_at"] == {"min": "2023-01-01", "max": "2023-02-01"}
+
     @pytest.mark.asyncio
     async def test_introspect_table_with_field_overrides(self, introspector, mock_client):
         """Test table introspection with field name overrides."""
@@ -320,15 +348,13 @@ class TestSchemaIntrospector:
     @pytest.mark.asyncio
     async def test_introspect_all_tables(self, introspector, mock_client):
         """Test introspecting multiple tables."""
-        # Mock responses for two tables
-        mock_client.execute.side_effect = [
-            [[1, "User1"]],  # table1 sample
-            [{"count": 1}],  # table1 count
-            [{"max_id": 1, "min_id": 1}],  # table1 ID stats
-            [[2, "User2"]],  # table2 sample
-            [{"count": 1}],  # table2 count
-            [{"max_id": 2, "min_id": 2}],  # table2 ID stats
-        ]
+        # Tables are introspected concurrently, so answer by request id
+        # (1 = sample, 2 = count, 3 = ID stats) rather than by call order
+        samples = iter([[[1, "User1"]], [[2, "User2"]]])
+        responses = {2: [[1]], 3: [[2, 1]]}
+        mock_client.execute.side_effect = lambda query: (
+            next(samples) if query["id"] == 1 else responses[query["id"]]
+        )
 
         schemas = await introspector.introspect_all_tables(["table1", "table2"], perform_duckdb_analysis=False)
 
@@ -342,13 +368,20 @@ class TestSchemaIntrospector:
     @pytest.mark.asyncio
     async def test_introspect_all_tables_with_errors(self, introspector, mock_client):
         """Test introspecting multiple tables with some errors."""
-        # First table succeeds, second fails
-        mock_client.execute.side_effect = [
-            [[1, "User1"]],  # table1 sample
-            [{"count": 1}],  # table1 count
-            [{"max_id": 1, "min_id": 1}],  # table1 ID stats
-            Exception("Connection failed"),  # table2 fails
-        ]
+        # First table succeeds, second fails; answered by request id because
+        # the tables are introspected concurrently
+        samples = iter([[[1, "User1"]], Exception("Connection failed")])
+        responses = {2: [[1]], 3: [[1, 1]]}
+
+        def execute(query):
+            if query["id"] != 1:
+                return responses[query["id"]]
+            sample = next(samples)
+            if isinstance(sample, Exception):
+                raise sample
+            return sample
+
+        mock_client.execute.side_effect = execute
 
         schemas = await introspector.introspect_all_tables(["table1", "table2"], perform_duckdb_analysis=False)
 
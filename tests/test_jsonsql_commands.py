@@ -0,0 +1,394 @@
+"""Tests for JSONSQL CLI commands."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from typer.testing import CliRunner
+
+from iptvportal.cli.commands.jsonsql import (
+    build_select_params,
+    jsonsql_app,
+    load_batch_operations,
+    split_columns,
+)
+from iptvportal.exceptions import APIError
+
+runner = CliRunner()
+
+
+class TestBuildSelectParams:
+    """Tests for SELECT parameter construction."""
+
+    def test_defaults_to_all_columns(self):
+        """Test that only data is set when no options are given."""
+        params = build_select_params(None, None, None, None, None, None, False, None)
+
+        assert params == {"data": ["*"]}
+
+    def test_includes_all_options_in_order(self):
+        """Test that every option is mapped and zero limit/offset are kept."""
+        params = build_select_params(
+            "id, username", "subscriber", '{"eq": ["id", 1]}', "id", 0, 0, True, "id"
+        )
+
+        assert list(params) == [
+            "data",
+            "from",
+            "where",
+            "order_by",
+            "limit",
+            "offset",
+            "distinct",
+            "group_by",
+        ]
+        assert params["data"] == ["id", "username"]
+        assert params["where"] == {"eq": ["id", 1]}
+        assert params["limit"] == 0
+        assert params["offset"] == 0
+        assert params["distinct"] is True
+
+    def test_drops_empty_strings(self):
+        """Test that empty string options are omitted."""
+        params = build_select_params("", "", "", "", None, None, False, "")
+
+        assert params == {"data": ["*"]}
+
+
+class TestSplitColumns:
+    """Tests for column list parsing."""
+
+    def test_trims_whitespace_around_names(self):
+        """Test that spaces around names and commas are removed."""
+        assert split_columns("  id ,name,\tcreated_at  ") == ["id", "name", "created_at"]
+
+    def test_matches_strip_per_item(self):
+        """Test that results match stripping each comma-separated item."""
+        value = " a , , b ,"
+        assert split_columns(value) == [col.strip() for col in value.split(",")]
+
+
+class TestLoadBatchOperations:
+    """Tests for NDJSON batch parsing."""
+
+    def test_parses_records_and_skips_blank_lines(self):
+        """Test that records keep their line numbers and blank lines are ignored."""
+        lines = io.StringIO(
+            '{"op": "select", "params": {"from": "subscriber", "limit": 1}}\n'
+            "\n"
+            '{"op": "delete", "params": {"from": "terminal"}}\n'
+        )
+
+        operations = load_batch_operations(lines)
+
+        assert operations == [
+            (1, "select", {"from": "subscriber", "limit": 1}),
+            (3, "delete", {"from": "terminal"}),
+        ]
+
+    def test_rejects_unknown_op(self):
+        """Test that unsupported operations are rejected with the line number."""
+        with pytest.raises(ValueError, match="line 1"):
+            load_batch_operations(['{"op": "drop", "params": {}}'])
+
+    def test_rejects_invalid_json(self):
+        """Test that malformed lines are rejected."""
+        with pytest.raises(ValueError, match="invalid JSON"):
+            load_batch_operations(["{not json"])
+
+    def test_rejects_missing_params(self):
+        """Test that records without params object are rejected."""
+        with pytest.raises(ValueError, match="'params'"):
+            load_batch_operations(['{"op": "select"}'])
+
+
+class TestBatchCommand:
+    """Tests for `jsonsql batch`."""
+
+    def test_batch_reuses_one_client(self, tmp_path):
+        """Test that all queries run over a single client and are emitted as JSON lines."""
+        batch_file = tmp_path / "queries.ndjson"
+        batch_file.write_text(
+            '{"op": "select", "params": {"from": "subscriber"}}\n'
+            '{"op": "select", "params": {"from": "media"}}\n'
+        )
+
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.execute.side_effect = [[[1, "a"]], [[2, "b"]]]
+
+        with (
+            patch("iptvportal.cli.utils.load_config"),
+            patch("iptvportal.cli.utils.IPTVPortalClient", return_value=client) as client_cls,
+        ):
+            result = runner.invoke(jsonsql_app, ["batch", "--file", str(batch_file)])
+
+        assert result.exit_code == 0
+        client_cls.assert_called_once()
+        assert client.execute.call_count == 2
+
+        lines = [orjson.loads(line) for line in result.stdout.splitlines()]
+        assert lines == [
+            {"line": 1, "op": "select", "result": [[1, "a"]]},
+            {"line": 2, "op": "select", "result": [[2, "b"]]},
+        ]
+
+    def test_batch_reports_failed_queries(self, tmp_path):
+        """Test that a failing query is reported and the exit code is 1."""
+        batch_file = tmp_path / "queries.ndjson"
+        batch_file.write_text(
+            '{"op": "select", "params": {"from": "subscriber"}}\n'
+            '{"op": "delete", "params": {"from": "terminal"}}\n'
+        )
+
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.execute.side_effect = [[[1]], APIError("denied")]
+
+        with (
+            patch("iptvportal.cli.utils.load_config"),
+            patch("iptvportal.cli.utils.IPTVPortalClient", return_value=client),
+        ):
+            result = runner.invoke(jsonsql_app, ["batch", "--file", str(batch_file)])
+
+        assert result.exit_code == 1
+        lines = [orjson.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+        assert lines[1] == {"line": 2, "op": "delete", "error": "denied"}
+
+    def test_unreadable_batch_file_is_reported(self, tmp_path):
+        """Test that a directory passed as --file fails cleanly instead of with a traceback."""
+        result = runner.invoke(jsonsql_app, ["batch", "--file", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert not isinstance(result.exception, OSError)
+        assert "Cannot read" in result.output
+
+
+class TestQueryErrors:
+    """Tests for the query command error path."""
+
+    def test_query_error_is_written_to_stderr(self):
+        """Test that API errors go to stderr and exit with code 1."""
+        with patch("iptvportal.cli.utils.execute_query", side_effect=APIError("denied")):
+            result = runner.invoke(jsonsql_app, ["select", "--from", "subscriber"])
+
+        assert result.exit_code == 1
+        assert "Query failed: denied" in result.stderr
+        assert "Tip: Use --debug flag" in result.stderr
+        assert "Query failed" not in result.stdout
+
+    def test_missing_from_exits_without_unexpected_error(self):
+        """Test that usage errors are not reported as unexpected errors."""
+        result = runner.invoke(jsonsql_app, ["delete", "--where", '{"eq": ["id", 1]}'])
+
+        assert result.exit_code == 1
+        assert "--from is required" in result.stdout
+        assert "Unexpected error" not in result.stderr
+
+
+class TestRegisterSubcommands:
+    """Tests for jsonsql subcommand registration."""
+
+    def test_registration_is_idempotent(self):
+        """Test that calling the registration again does not duplicate commands."""
+        from iptvportal.cli.commands.jsonsql import _register_subcommands
+
+        commands = len(jsonsql_app.registered_commands)
+        groups = len(jsonsql_app.registered_groups)
+
+        _register_subcommands()
+
+        assert len(jsonsql_app.registered_commands) == commands
+        assert len(jsonsql_app.registered_groups) == groups
+
+    def test_skipped_when_completing_other_command(self, monkeypatch):
+        """Test that completion outside jsonsql does not need the subcommands."""
+        from iptvportal.cli.commands.jsonsql import _completing_other_command
+
+        monkeypatch.setenv("_IPTVPORTAL_COMPLETE", "bash_complete")
+        monkeypatch.setenv("COMP_WORDS", "iptvportal config sh")
+        assert _completing_other_command()
+
+        monkeypatch.setenv("COMP_WORDS", "iptvportal jsonsql sc")
+        assert not _completing_other_command()
+
+
+class TestNativeParams:
+    """Tests for params built from CLI options."""
+
+    def test_update_params_include_optional_keys(self):
+        """Test that update keeps where/returning only when given."""
+        with patch("iptvportal.cli.formatters.display_dry_run") as dry_run:
+            runner.invoke(
+                jsonsql_app,
+                ["update", "--table", "t", "--set", '{"a": 1}', "--returning", "id", "--dry-run"],
+            )
+
+        assert dry_run.call_args.args[0] == {"table": "t", "set": {"a": 1}, "returning": "id"}
+
+    def test_delete_params_with_where(self):
+        """Test that delete includes a parsed where condition."""
+        with patch("iptvportal.cli.formatters.display_dry_run") as dry_run:
+            runner.invoke(
+                jsonsql_app, ["delete", "--from", "t", "--where", '{"eq": ["id", 1]}', "--dry-run"]
+            )
+
+        assert dry_run.call_args.args[0] == {"from": "t", "where": {"eq": ["id", 1]}}
+
+
+class TestEditorMode:
+    """Tests for --edit."""
+
+    def test_templates_are_precomputed_json(self):
+        """Test that every query method has a serialized template ready at import."""
+        from iptvportal.cli.commands.jsonsql import BATCH_METHODS, EDITOR_TEMPLATES
+
+        assert set(EDITOR_TEMPLATES) == set(BATCH_METHODS)
+        for template in EDITOR_TEMPLATES.values():
+            assert isinstance(template, bytes)
+            assert isinstance(orjson.loads(template), dict)
+
+    def test_editor_starts_from_template(self, monkeypatch):
+        """Test that an unchanged template is parsed back as the query."""
+        # `true` exits without touching the file, so the template comes back as-is
+        monkeypatch.setenv("EDITOR", "true")
+
+        with patch("iptvportal.cli.formatters.display_dry_run") as dry_run:
+            result = runner.invoke(jsonsql_app, ["delete", "--edit", "--dry-run"])
+
+        assert result.exit_code == 0
+        assert dry_run.call_args.args[0] == {"from": "table_name", "where": {"eq": ["id", 123]}}
+
+    def test_editor_warns_about_ignored_zero_limit(self, monkeypatch):
+        """Test that an explicit --limit 0 counts as a CLI parameter."""
+        monkeypatch.setenv("EDITOR", "true")
+
+        with patch("iptvportal.cli.formatters.display_dry_run"):
+            result = runner.invoke(jsonsql_app, ["select", "--edit", "--limit", "0", "--dry-run"])
+
+        assert "CLI parameters will be ignored" in result.stdout
+
+
+class TestRpcBatch:
+    """Tests for `jsonsql batch --rpc-batch`."""
+
+    def test_rpc_batch_sends_single_request(self, tmp_path):
+        """Test that all queries are sent through one JSON-RPC batch call."""
+        batch_file = tmp_path / "queries.ndjson"
+        batch_file.write_text(
+            '{"op": "select", "params": {"from": "subscriber"}}\n'
+            '{"op": "delete", "params": {"from": "terminal"}}\n'
+        )
+
+        client = MagicMock()
+        client.__enter__.return_value = client
+        client.execute_rpc_batch.return_value = [[[1]], APIError("denied")]
+
+        with (
+            patch("iptvportal.cli.utils.load_config"),
+            patch("iptvportal.cli.utils.IPTVPortalClient", return_value=client),
+        ):
+            result = runner.invoke(jsonsql_app, ["batch", "--file", str(batch_file), "--rpc-batch"])
+
+        assert result.exit_code == 1
+        client.execute.assert_not_called()
+        requests = client.execute_rpc_batch.call_args.args[0]
+        assert [r["id"] for r in requests] == [1, 2]
+        lines = [orjson.loads(line) for line in result.stdout.splitlines()]
+        assert lines == [
+            {"line": 1, "op": "select", "result": [[1]]},
+            {"line": 2, "op": "delete", "error": "denied"},
+        ]
+
+
+class TestRunQueryCommand:
+    """Tests for the shared query command flow."""
+
+    def test_select_executes_with_schema_mapping_flag(self):
+        """Test that select passes its schema-mapping flag through to execute_query."""
+        with patch("iptvportal.cli.utils.execute_query", return_value=[{"id": 1}]) as execute_query:
+            result = runner.invoke(
+                jsonsql_app, ["select", "--from", "t", "--no-map-schema", "--format", "json"]
+            )
+
+        assert result.exit_code == 0
+        assert execute_query.call_args.args[:2] == ("select", {"data": ["*"], "from": "t"})
+        assert execute_query.call_args.kwargs["use_schema_mapping"] is False
+        assert orjson.loads(result.stdout) == [{"id": 1}]
+
+    def test_insert_does_not_pass_schema_mapping(self):
+        """Test that non-select commands call execute_query without extra options."""
+        with patch("iptvportal.cli.utils.execute_query", return_value=[[1]]) as execute_query:
+            result = runner.invoke(
+                jsonsql_app,
+                ["insert", "--into", "t", "--columns", "a", "--values", "[[1]]"],
+            )
+
+        assert result.exit_code == 0
+        assert "use_schema_mapping" not in execute_query.call_args.kwargs
+
+    @pytest.mark.parametrize(("rows", "streamed"), [(1001, True), (3, False)])
+    def test_select_streams_by_result_size(self, rows, streamed):
+        """Test that select without --limit streams only results above the threshold."""
+        query_result = [[i] for i in range(rows)]
+        with (
+            patch("iptvportal.cli.utils.execute_query", return_value=query_result),
+            patch("iptvportal.cli.formatters.display_result") as display_result,
+            patch("iptvportal.cli.formatters.display_result_stream") as display_stream,
+        ):
+            result = runner.invoke(jsonsql_app, ["select", "--from", "t", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert display_stream.called is streamed
+        assert display_result.called is not streamed
+
+
+class TestSqlCommand:
+    """Tests for `jsonsql sql`."""
+
+    def test_dry_run_transpiles_without_executing(self):
+        """Test that --dry-run shows the transpiled query and detected method only."""
+        with (
+            patch("iptvportal.cli.formatters.display_dry_run") as dry_run,
+            patch("iptvportal.cli.utils.execute_query") as execute_query,
+        ):
+            result = runner.invoke(
+                jsonsql_app, ["sql", "-q", "SELECT id FROM media WHERE id = 1", "--dry-run"]
+            )
+
+        assert result.exit_code == 0
+        execute_query.assert_not_called()
+        jsonsql, method = dry_run.call_args.args
+        assert method == "select"
+        assert jsonsql["data"] == ["id"]
+
+    @pytest.mark.parametrize(("rows", "streamed"), [(1001, True), (1000, False)])
+    def test_large_results_are_streamed(self, rows, streamed):
+        """Test that results above the stream threshold are written row by row."""
+        query_result = [[i] for i in range(rows)]
+        with (
+            patch("iptvportal.cli.utils.execute_query", return_value=query_result),
+            patch("iptvportal.cli.formatters.display_result") as display_result,
+            patch("iptvportal.cli.formatters.display_result_stream") as display_stream,
+        ):
+            result = runner.invoke(jsonsql_app, ["sql", "-q", "SELECT id FROM media", "-f", "json"])
+
+        assert result.exit_code == 0
+        assert display_stream.called is streamed
+        assert display_result.called is not streamed
+
+    def test_dry_run_reports_inferred_method(self):
+        """Test that --dry-run shows the inferred method without loading config."""
+        with (
+            patch("iptvportal.cli.formatters.display_dry_run") as dry_run,
+            patch("iptvportal.cli.utils.load_config") as load_config,
+        ):
+            result = runner.invoke(
+                jsonsql_app,
+                ["sql", "-q", "INSERT INTO media (id) VALUES (1)", "--dry-run"],
+            )
+
+        assert result.exit_code == 0
+        load_config.assert_not_called()
+        assert dry_run.call_args.args[1] == "insert"
@@ -1,5 +1,7 @@
 """Tests for the schema system."""
 
+import pytest
+
 from iptvportal.schema import (
     FieldDefinition,
     FieldType,
@@ -73,6 +75,24 @@ class TestTableSchema:
         result = schema.resolve_select_star()
         assert result == ["*"]
 
+    def test_resolve_select_star_without_total_fields(self):
+        """Test that the highest described position bounds the expansion."""
+        fields = {
+            3: FieldDefinition("email", 3, field_type=FieldType.STRING),
+            0: FieldDefinition("id", 0, field_type=FieldType.INTEGER),
+        }
+        schema = TableSchema("users", fields)
+
+        assert schema.resolve_select_star() == ["id", "Field_1", "Field_2", "email"]
+
+    def test_resolve_select_star_after_unordered_insert(self):
+        """Test that fields added after construction still bound the expansion."""
+        schema = TableSchema("users", {0: FieldDefinition("id", 0, field_type=FieldType.INTEGER)})
+        schema.fields[2] = FieldDefinition("email", 2, field_type=FieldType.STRING)
+        schema.fields[1] = FieldDefinition("name", 1, field_type=FieldType.STRING)
+
+        assert schema.resolve_select_star() == ["id", "name", "email"]
+
     def test_get_field_by_name(self):
         """Test getting field by name."""
         field_def = FieldDefinition("subscriber_id", 0, alias="sub_id")
@@ -147,6 +167,31 @@ class TestTableSchema:
         assert result["fields"]["0"]["description"] == "User ID"
         assert result["fields"]["1"]["alias"] == "full_name"
 
+    def test_is_auto_generated(self):
+        """Test detection of schemas made only of auto-generated fields."""
+        schema = TableSchema.auto_generate("media", [1, "name"])
+        assert schema.is_auto_generated
+
+        overridden = TableSchema.auto_generate(
+            "media", [1, "name"], field_name_overrides={1: "title"}
+        )
+        assert not overridden.is_auto_generated
+
+        assert TableSchema("empty", {}).is_auto_generated
+
+    def test_fields_ordered_by_position(self):
+        """Test that fields are iterated by position regardless of input order."""
+        fields = {
+            2: FieldDefinition(name="c", position=2),
+            0: FieldDefinition(name="a", position=0),
+            1: FieldDefinition(name="b", position=1),
+        }
+
+        schema = TableSchema("t", fields)
+
+        assert list(schema.fields) == [0, 1, 2]
+        assert [f.name for f in schema.fields.values()] == ["a", "b", "c"]
+
 
 class TestSchemaRegistry:
     """Tests for SchemaRegistry."""
@@ -177,6 +222,19 @@ class TestSchemaRegistry:
         assert "posts" in tables
         assert len(tables) == 2
 
+    def test_list_tables_metadata(self):
+        """Test per-table summary used by `schema list`."""
+        registry = SchemaRegistry()
+        registry.register(
+            TableSchema("users", {0: FieldDefinition(name="id", position=0)}, total_fields=3)
+        )
+        registry.register(TableSchema.auto_generate("posts", [1, "title"]))
+
+        assert sorted(registry.list_tables_metadata()) == [
+            ("posts", 2, 2, True),
+            ("users", 3, 1, False),
+        ]
+
 
 class TestSchemaBuilder:
     """Tests for SchemaBuilder fluent API."""
@@ -267,6 +325,13 @@ class TestSchemaLoader:
         assert schema.fields[1].transformer is not None
         assert schema.fields[1].transformer("42") == 42
 
+    def test_from_dict_rejects_duplicate_positions(self):
+        """Test that keys naming the same position are not silently merged."""
+        config = {"schemas": {"users": {"fields": {"1": {"name": "a"}, 1: {"name": "b"}}}}}
+
+        with pytest.raises(ValueError, match="duplicate field position 1"):
+            SchemaLoader.from_dict(config)
+
     def test_builtin_transformers(self):
         """Test all built-in transformers."""
         # Test int transformer
@@ -0,0 +1,386 @@
+"""Tests for the `iptvportal schema` service commands."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+from typer.testing import CliRunner
+
+from iptvportal.config.settings import IPTVPortalSettings
+from iptvportal.schema import SchemaLoader
+from iptvportal.schema.__cli__ import app
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    """Write a small schema file and point the loaded settings at it."""
+    path = tmp_path / "schemas.yaml"
+    path.write_text(
+        "schemas:\n"
+        "  media:\n"
+        "    total_fields: 2\n"
+        "    fields:\n"
+        "      0: {name: id, type: integer}\n"
+        "      1: {name: name, type: string}\n"
+    )
+    settings = IPTVPortalSettings(domain="test", username="u", password="p", schema_file=str(path))
+    with patch("iptvportal.schema.__cli__.load_config", return_value=settings):
+        yield path
+
+
+class TestLocalSchemaCommands:
+    """Tests for commands that only read the local schema registry."""
+
+    def test_list_does_not_authenticate(self, schema_file):
+        """Test that listing schemas needs no HTTP client or session."""
+        with patch("iptvportal.core.client.IPTVPortalClient.connect") as connect:
+            result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        assert result.stdout == "media\t2\t2\tPredefined\n"
+        connect.assert_not_called()
+
+    def test_show_reports_fields(self, schema_file):
+        """Test that show renders the field table from the local file."""
+        with patch("iptvportal.core.client.IPTVPortalClient.connect") as connect:
+            result = runner.invoke(app, ["show", "media"])
+
+        assert result.exit_code == 0
+        assert "Field Definitions" in result.stdout
+        assert "0\tid\tinteger\t-\t-\t-\n1\tname\tstring\t-\t-\t-\n" in result.stdout
+        connect.assert_not_called()
+
+    def test_list_renders_table_on_terminal(self, schema_file):
+        """Test that an interactive terminal still gets the Rich table."""
+        from iptvportal.schema.__cli__ import _console
+
+        with patch.object(type(_console()), "is_terminal", True):
+            result = runner.invoke(app, ["list"])
+
+        assert result.exit_code == 0
+        assert "Loaded Schemas (1 tables)" in result.stdout
+        assert "Predefined" in result.stdout
+
+    def test_export_writes_json(self, schema_file, tmp_path):
+        """Test that export writes the schema without connecting."""
+        output = tmp_path / "out" / "media.json"
+        with patch("iptvportal.core.client.IPTVPortalClient.connect") as connect:
+            result = runner.invoke(app, ["export", "media", "-f", "json", "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert output.exists()
+        connect.assert_not_called()
+
+    def test_export_yaml_round_trips(self, schema_file, tmp_path):
+        """Test that exported YAML loads back into the same schema."""
+        output = tmp_path / "media.yaml"
+        result = runner.invoke(app, ["export", "media", "-o", str(output)])
+
+        assert result.exit_code == 0
+        schema = SchemaLoader.from_yaml(str(output)).get("media")
+        assert [f.name for f in schema.fields.values()] == ["id", "name"]
+
+
+class TestGenerateModels:
+    """Tests for `iptvportal schema generate-models`."""
+
+    def test_lists_generated_files(self, schema_file, tmp_path):
+        """Test that each model is reported with the file it was written to."""
+        output_dir = tmp_path / "models"
+
+        result = runner.invoke(
+            app, ["generate-models", str(schema_file), "-o", str(output_dir), "-f", "pydantic"]
+        )
+
+        assert result.exit_code == 0
+        assert "• Media →" in result.stdout
+        assert "media.py" in result.stdout
+        assert (output_dir / "media.py").exists()
+
+
+class TestSqlTableName:
+    """Tests for table-name extraction from --query/--from-sql."""
+
+    @pytest.mark.parametrize(
+        ("query", "table"),
+        [
+            ("SELECT * FROM media LIMIT 5", "media"),
+            ("select id from Tv_Channel;", "tv_channel"),
+            ("SELECT *\nFROM\n  subscriber, terminal", "subscriber"),
+        ],
+    )
+    def test_extracts_first_table(self, query, table):
+        """Test that the table after FROM is found regardless of case and layout."""
+        from iptvportal.schema.__cli__ import FROM_TABLE_PATTERN
+
+        assert FROM_TABLE_PATTERN.search(query).group(1).lower() == table
+
+    def test_limit_detection_ignores_identifiers(self):
+        """Test that LIMIT inside a longer identifier does not count."""
+        from iptvportal.schema.__cli__ import LIMIT_PATTERN
+
+        assert LIMIT_PATTERN.search("select * from media limit 1")
+        assert not LIMIT_PATTERN.search("SELECT rate_limit FROM media")
+
+    def test_introspect_requires_from_clause(self):
+        """Test that --from-sql without FROM is rejected."""
+        with patch("iptvportal.schema.__cli__.load_config"):
+            result = runner.invoke(app, ["introspect", "--from-sql", "SELECT 1"])
+
+        assert result.exit_code == 1
+        assert "Query must contain FROM clause" in result.stdout
+
+
+class TestFieldMappings:
+    """Tests for --fields/--mappings parsing."""
+
+    def test_parses_pairs_and_collects_invalid_items(self):
+        """Test that whitespace is trimmed and malformed items are returned separately."""
+        from iptvportal.schema.__cli__ import _parse_field_mappings
+
+        mappings, invalid = _parse_field_mappings(" 0:id, 2 : user name ,bad,x:y,3:,")
+
+        assert mappings == {0: "id", 2: "user name"}
+        assert invalid == ["bad", "x:y", "3:"]
+
+
+class TestSampleText:
+    """Tests for sample value display in from-sql."""
+
+    def test_short_values_are_unchanged(self):
+        """Test that short scalars and containers render like str()."""
+        from iptvportal.schema.__cli__ import _sample_text
+
+        assert _sample_text("name") == "name"
+        assert _sample_text({"a": 1}) == "{'a': 1}"
+
+    def test_long_values_are_truncated(self):
+        """Test that long strings and large containers fit the column width."""
+        from iptvportal.schema.__cli__ import _sample_text
+
+        assert _sample_text("x" * 100) == "x" * 47 + "..."
+        assert _sample_text(list(range(10_000))) == "[0, 1, 2, 3, 4, 5, ...]"
+
+
+class TestValidateCommand:
+    """Tests for `iptvportal schema validate`."""
+
+    def test_valid_file_passes(self, tmp_path):
+        """Test that a well-formed schema file validates."""
+        path = tmp_path / "schemas.yaml"
+        path.write_text(
+            "schemas:\n"
+            "  media:\n"
+            "    total_fields: 1\n"
+            "    fields:\n"
+            "      0: {name: id, type: integer}\n"
+        )
+
+        result = runner.invoke(app, ["validate", str(path)])
+
+        assert result.exit_code == 0
+        assert "Validation passed" in result.stdout
+
+    def test_invalid_field_type_is_reported(self, tmp_path):
+        """Test that unknown type names in the file fail validation."""
+        path = tmp_path / "schemas.yaml"
+        path.write_text(
+            "schemas:\n"
+            "  media:\n"
+            "    total_fields: 1\n"
+            "    fields:\n"
+            "      0: {name: id, type: bigint}\n"
+        )
+
+        result = runner.invoke(app, ["validate", str(path)])
+
+        assert result.exit_code == 1
+        assert "media.id: Invalid field type 'bigint'" in result.stdout
+
+    def test_fail_fast_stops_at_first_invalid_schema(self, tmp_path):
+        """Test that --fail-fast does not check schemas after the first error."""
+        path = tmp_path / "schemas.json"
+        path.write_text(
+            '{"schemas": {'
+            '"media": {"fields": {"0": {"name": "id", "type": "bigint"}}},'
+            '"tv_channel": {"fields": {"0": {"name": "id", "type": "uuid4"}}}'
+            "}}"
+        )
+
+        full = runner.invoke(app, ["validate", str(path)])
+        fast = runner.invoke(app, ["validate", str(path), "--fail-fast"])
+
+        assert "tv_channel.id" in full.stdout
+        assert fast.exit_code == 1
+        assert "media.id" in fast.stdout
+        assert "tv_channel.id" not in fast.stdout
+
+
+class TestIntrospectBatch:
+    """Tests for `iptvportal schema introspect-batch`."""
+
+    def test_introspects_tables_over_one_client(self, tmp_path):
+        """Test that all tables share one client and are saved to one file."""
+        from iptvportal.schema import TableSchema
+
+        schemas = {
+            "media": TableSchema.auto_generate("media", [1, "name"]),
+            "tv_channel": TableSchema.auto_generate("tv_channel", [1]),
+        }
+        client = MagicMock()
+        client.__aenter__.return_value = client
+        output = tmp_path / "schemas.yaml"
+
+        with (
+            patch("iptvportal.schema.__cli__.load_config"),
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client) as cls,
+            patch(
+                "iptvportal.schema.introspector.SchemaIntrospector.introspect_all_tables",
+                new=AsyncMock(return_value=schemas),
+            ) as introspect_all,
+        ):
+            result = runner.invoke(
+                app, ["introspect-batch", "media, tv_channel", "-o", str(output)]
+            )
+
+        assert result.exit_code == 0
+        cls.assert_called_once()
+        assert introspect_all.call_args.args[0] == ["media", "tv_channel"]
+        assert "media\t2\t-\tok\ntv_channel\t1\t-\tok\n" in result.stdout
+        assert sorted(SchemaLoader.from_yaml(str(output)).list_tables()) == ["media", "tv_channel"]
+
+    def test_failed_table_sets_exit_code(self):
+        """Test that a table missing from the results fails the command."""
+        client = MagicMock()
+        client.__aenter__.return_value = client
+
+        with (
+            patch("iptvportal.schema.__cli__.load_config"),
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client),
+            patch(
+                "iptvportal.schema.introspector.SchemaIntrospector.introspect_all_tables",
+                new=AsyncMock(return_value={}),
+            ),
+        ):
+            result = runner.invoke(app, ["introspect-batch", "media"])
+
+        assert result.exit_code == 1
+
+    def test_duplicate_tables_are_introspected_once(self):
+        """Test that a repeated table name neither doubles work nor fails the command."""
+        from iptvportal.schema import TableSchema
+
+        client = MagicMock()
+        client.__aenter__.return_value = client
+
+        with (
+            patch("iptvportal.schema.__cli__.load_config"),
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client),
+            patch(
+                "iptvportal.schema.introspector.SchemaIntrospector.introspect_all_tables",
+                new=AsyncMock(return_value={"media": TableSchema.auto_generate("media", [1])}),
+            ) as introspect_all,
+        ):
+            result = runner.invoke(app, ["introspect-batch", "media,media"])
+
+        assert result.exit_code == 0
+        assert introspect_all.call_args.args[0] == ["media"]
+
+    def test_save_does_not_overwrite_schemas_file(self, tmp_path, monkeypatch):
+        """Test that --save without -o keeps the shared config/schemas file intact."""
+        from iptvportal.schema import TableSchema
+
+        monkeypatch.chdir(tmp_path)
+        schemas_file = tmp_path / "config" / "schemas.yaml"
+        schemas_file.parent.mkdir()
+        schemas_file.write_text("schemas: {}\n")
+        client = MagicMock()
+        client.__aenter__.return_value = client
+
+        with (
+            patch("iptvportal.schema.__cli__.load_config"),
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client),
+            patch(
+                "iptvportal.schema.introspector.SchemaIntrospector.introspect_all_tables",
+                new=AsyncMock(return_value={"media": TableSchema.auto_generate("media", [1])}),
+            ),
+        ):
+            result = runner.invoke(app, ["introspect-batch", "media", "--save"])
+
+        assert result.exit_code == 0
+        assert schemas_file.read_text() == "schemas: {}\n"
+        saved = SchemaLoader.from_yaml(str(tmp_path / "config" / "introspected-schemas.yaml"))
+        assert saved.list_tables() == ["media"]
+
+
+class TestValidateMapping:
+    """Tests for `iptvportal schema validate-mapping`."""
+
+    RESULTS = {
+        1: {"error": "no data", "remote_column": "name"},
+        0: {
+            "remote_column": "id",
+            "match_ratio": 1.0,
+            "sample_size": 10,
+            "dtype": "int64",
+            "null_count": 0,
+            "unique_count": 10,
+        },
+    }
+
+    def _invoke(self, schema_file, args):
+        client = MagicMock()
+        client.__aenter__.return_value = client
+        client.schema_registry = SchemaLoader.from_yaml(str(schema_file))
+        with (
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client),
+            patch(
+                "iptvportal.validation.RemoteFieldValidator.validate_table_schema_batch",
+                new=AsyncMock(return_value=self.RESULTS),
+            ),
+            patch("iptvportal.schema.__cli__.IPTVPortalClient") as sync_client,
+        ):
+            result = runner.invoke(app, ["validate-mapping", *args])
+        sync_client.assert_not_called()
+        return result
+
+    def test_save_updates_existing_schema(self, schema_file, tmp_path):
+        """Test that only error-free results are stored on the loaded schema."""
+        output = tmp_path / "validated.json"
+
+        result = self._invoke(schema_file, ["media", "-m", "0:id,1:name", "-o", str(output)])
+
+        assert result.exit_code == 0
+        saved = orjson.loads(output.read_bytes())["schemas"]["media"]["fields"]
+        assert saved["0"]["remote_mapping"]["match_ratio"] == 1.0
+        assert "remote_mapping" not in saved["1"]
+
+    def test_save_creates_schema_for_unknown_table(self, schema_file, tmp_path):
+        """Test that a new schema is built from the validated columns."""
+        output = tmp_path / "validated.yaml"
+
+        result = self._invoke(schema_file, ["subscriber", "-m", "0:id,1:name", "-o", str(output)])
+
+        assert result.exit_code == 0
+        schema = SchemaLoader.from_yaml(str(output)).get("subscriber")
+        assert list(schema.fields) == [0]
+        assert schema.fields[0].field_type.value == "integer"
+
+    @pytest.mark.parametrize(
+        ("ratio", "style"),
+        [
+            (0.0, "red"),
+            (0.7999, "red"),
+            (0.8, "yellow"),
+            (0.9499, "yellow"),
+            (0.95, "green"),
+            (1.0, "green"),
+        ],
+    )
+    def test_match_ratio_style_thresholds(self, ratio, style):
+        """Test that the style lookup keeps the 80%/95% thresholds."""
+        from iptvportal.schema.__cli__ import _MATCH_RATIO_STYLES
+
+        assert _MATCH_RATIO_STYLES[min(int(ratio * 20), 20)] == style
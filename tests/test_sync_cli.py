@@ -0,0 +1,118 @@
+"""Tests for the `iptvportal sync` commands."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from iptvportal.cli.commands.sync import app
+from iptvportal.config.settings import IPTVPortalSettings
+from iptvportal.exceptions import APIError
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def schema_file(tmp_path):
+    """Write two table schemas, one with an id field."""
+    path = tmp_path / "schemas.yaml"
+    path.write_text(
+        "schemas:\n"
+        "  media:\n"
+        "    fields:\n"
+        "      0: {name: id, type: integer}\n"
+        "  tv_channel:\n"
+        "    fields:\n"
+        "      0: {name: name, type: string}\n"
+    )
+    return path
+
+
+class TestRegister:
+    """Tests for `iptvportal sync register`."""
+
+    def _invoke(self, schema_file, client):
+        database = MagicMock()
+        client.__aenter__.return_value = client
+        with (
+            patch("iptvportal.cli.commands.sync.get_database", return_value=database),
+            patch(
+                "iptvportal.cli.utils.load_config",
+                return_value=IPTVPortalSettings(
+                    domain="test", username="u", password="p", max_concurrent_queries=2
+                ),
+            ),
+            patch("iptvportal.core.async_client.AsyncIPTVPortalClient", return_value=client),
+        ):
+            result = runner.invoke(app, ["register", "--file", str(schema_file)])
+        return result, database
+
+    def test_metadata_fetched_in_one_batch(self, schema_file):
+        """Test that all tables' metadata queries go out as one JSON-RPC batch."""
+        client = MagicMock()
+        client.execute_rpc_batch = AsyncMock(
+            return_value=[
+                [[1, "a", "b"]],  # media sample
+                [[42, 1, 42]],  # media count, min/max id
+                APIError("HTTP 403: Forbidden"),  # tv_channel sample
+                [[0]],  # tv_channel count
+            ]
+        )
+
+        result, database = self._invoke(schema_file, client)
+
+        assert result.exit_code == 0
+        client.execute_rpc_batch.assert_awaited_once()
+        assert len(client.execute_rpc_batch.call_args.args[0]) == 4
+        media, tv_channel = (call.args[0] for call in database.register_table.call_args_list)
+        assert media.total_fields == 3
+        assert (media.metadata.row_count, media.metadata.max_id) == (42, 42)
+        assert tv_channel.sync_config.disabled is True
+
+    def test_falls_back_to_single_queries(self, schema_file):
+        """Test that a rejected batch is replaced by individual queries."""
+        client = MagicMock()
+        client.execute_rpc_batch = AsyncMock(side_effect=APIError("no batch"))
+        client.execute = AsyncMock(return_value=[[7]])
+
+        result, database = self._invoke(schema_file, client)
+
+        assert result.exit_code == 0
+        assert client.execute.await_count == 4
+        assert database.register_table.call_count == 2
+
+    def test_fallback_concurrency_is_bounded(self, schema_file):
+        """Test that fallback queries respect max_concurrent_queries."""
+        active = peak = 0
+
+        async def execute(query):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return [[7]]
+
+        client = MagicMock()
+        client.execute_rpc_batch = AsyncMock(side_effect=APIError("no batch"))
+        client.execute = execute
+
+        result, _ = self._invoke(schema_file, client)
+
+        assert result.exit_code == 0
+        assert peak == 2
+
+    def test_metadata_queries_are_transpiled_once(self, schema_file):
+        """Test that re-registering reuses the transpiled metadata queries."""
+        from iptvportal.cli.commands.sync import _transpile
+
+        client = MagicMock()
+        client.execute_rpc_batch = AsyncMock(return_value=[[[0]]] * 4)
+
+        _transpile.cache_clear()
+        self._invoke(schema_file, client)
+        self._invoke(schema_file, client)
+
+        assert _transpile.cache_info().misses == 4
+        assert _transpile.cache_info().hits == 4
@@ -4,6 +4,7 @@ import pytest
 
 from iptvportal.jsonsql import SQLTranspiler
 from iptvportal.jsonsql.exceptions import ParseError, TranspilerError
+from iptvportal.jsonsql.transpiler import split_sql_statements
 
 
 @pytest.fixture
@@ -419,3 +420,33 @@ class TestErrors:
         """Test that empty SQL raises error."""
         with pytest.raises((ParseError, TranspilerError)):
             transpiler.transpile("")
+
+
+class TestSplitSqlStatements:
+    """Test streaming statement splitting."""
+
+    SCRIPT = (
+        "SELECT 1; -- first;\n"
+        "SELECT 'a;b' /* skip; */ FROM t\n"
+        ";  /* only a comment */ ;\n"
+        "DELETE FROM t WHERE id = 1"
+    )
+
+    def test_splits_on_top_level_semicolons(self):
+        """Test that quoted and commented semicolons do not split statements."""
+        assert list(split_sql_statements([self.SCRIPT])) == [
+            "SELECT 1",
+            "-- first;\nSELECT 'a;b' /* skip; */ FROM t",
+            "DELETE FROM t WHERE id = 1",
+        ]
+
+    def test_chunk_boundaries_do_not_matter(self):
+        """Test that splitting is independent of how the text is chunked."""
+        chunks = (self.SCRIPT[i : i + 3] for i in range(0, len(self.SCRIPT), 3))
+        assert list(split_sql_statements(chunks)) == list(split_sql_statements([self.SCRIPT]))
+
+    def test_statements_transpile(self, transpiler):
+        """Test that split statements are accepted by the transpiler."""
+        results = [transpiler.transpile(sql) for sql in split_sql_statements([self.SCRIPT])]
+        assert len(results) == 3
+        assert "where" in results[2]
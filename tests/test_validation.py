@@ -179,6 +179,11 @@ class TestRemoteFieldValidator:
         assert validator.infer_field_type_from_dtype("string") == "string"
         assert validator.infer_field_type_from_dtype("unknown_type") == "unknown"
 
+    def test_infer_field_type_without_instance(self):
+        """Test that dtype inference is callable on the class itself."""
+        assert RemoteFieldValidator.infer_field_type_from_dtype("int32") == "integer"
+        assert RemoteFieldValidator.infer_field_type_from_dtype("date") == "date"
+
     @pytest.mark.asyncio
     async def test_validate_field_mapping_error_handling(self, validator, mock_client):
         """Test error handling in validation."""
@@ -216,3 +221,179 @@ class TestRemoteFieldValidator:
         # Second field should have error
         assert "error" in results[1]
         assert "Field not found" in results[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_limits_concurrency(self, validator):
+        """Test that fields are validated in parallel up to the concurrency limit."""
+        import asyncio
+
+        active = peak = 0
+
+        async def validate_field_mapping(
+            table_name, local_position, remote_column_name, sample_size
+        ):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return {"remote_column": remote_column_name}
+
+        validator.validate_field_mapping = validate_field_mapping
+        field_mappings = {position: f"col{position}" for position in (3, 0, 2, 1, 4)}
+
+        results = await validator.validate_table_schema(
+            table_name="subscriber", field_mappings=field_mappings, concurrency=2
+        )
+
+        assert peak == 2
+        assert list(results) == [3, 0, 2, 1, 4]
+        assert results[2] == {"remote_column": "col2"}
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_batch_fetches_columns_together(
+        self, validator, mock_client
+    ):
+        """Test that one SELECT * and one SELECT per column batch are issued."""
+        rows_all = [[1, "user1", "a@x"], [2, "user2", "b@x"]]
+        responses = {
+            "*": rows_all,
+            "id, username": [[1, "user1"], [2, "user2"]],
+            "email": [["a@x"], ["c@x"]],
+        }
+
+        async def execute(query):
+            columns = query["params"]["data"]
+            return responses[", ".join(columns)]
+
+        mock_client.execute.side_effect = execute
+
+        results = await validator.validate_table_schema_batch(
+            table_name="subscriber",
+            field_mappings={0: "id", 1: "username", 2: "email"},
+            sample_size=2,
+            batch_size=2,
+        )
+
+        assert mock_client.execute.call_count == 3
+        assert list(results) == [0, 1, 2]
+        assert results[0]["match_ratio"] == 1.0
+        assert results[1]["match_ratio"] == 1.0
+        assert results[2]["match_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_batch_falls_back_per_field(self, validator, mock_client):
+        """Test that a failed batch is retried field by field to isolate the error."""
+
+        async def execute(query):
+            columns = query["params"]["data"]
+            if "nonexistent" in columns:
+                raise Exception("Field not found")
+            return [[1, "user1"]] if columns == ["*"] else [[1]]
+
+        mock_client.execute.side_effect = execute
+
+        results = await validator.validate_table_schema_batch(
+            table_name="subscriber", field_mappings={0: "id", 1: "nonexistent"}, sample_size=1
+        )
+
+        assert results[0]["match_ratio"] == 1.0
+        assert "Field not found" in results[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_batch_analyzes_batches_as_they_arrive(
+        self, validator, mock_client
+    ):
+        """Test that a finished batch is analyzed while another batch is still running."""
+        import asyncio
+
+        first_analyzed = asyncio.Event()
+
+        async def execute(query):
+            columns = query["params"]["data"]
+            if columns == ["username"]:
+                # Only completes once the other batch has been analyzed
+                await asyncio.wait_for(first_analyzed.wait(), timeout=1)
+                return [["user1"]]
+            return [[1, "user1"]] if columns == ["*"] else [[1]]
+
+        mock_client.execute.side_effect = execute
+        analyze = validator._analyze_mapping
+
+        def analyze_mapping(*args):
+            first_analyzed.set()
+            return analyze(*args)
+
+        validator._analyze_mapping = analyze_mapping
+
+        results = await validator.validate_table_schema_batch(
+            table_name="subscriber",
+            field_mappings={0: "id", 1: "username"},
+            sample_size=1,
+            batch_size=1,
+        )
+
+        # No per-field fallback: SELECT * and one SELECT per batch only
+        assert mock_client.execute.call_count == 3
+        assert results[0]["match_ratio"] == 1.0
+        assert results[1]["match_ratio"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_batch_fallback_shares_concurrency_limit(
+        self, validator, mock_client
+    ):
+        """Test that batches falling back at once stay within one concurrency limit."""
+        import asyncio
+
+        active = peak = 0
+
+        async def execute(query):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            raise Exception("SELECT * denied")
+
+        mock_client.execute.side_effect = execute
+
+        results = await validator.validate_table_schema_batch(
+            table_name="subscriber",
+            field_mappings={position: f"col{position}" for position in range(4)},
+            batch_size=1,
+            concurrency=2,
+        )
+
+        assert peak == 2
+        assert all("error" in result for result in results.values())
+
+    @pytest.mark.asyncio
+    async def test_validate_table_schema_batch_cleans_up_select_all(self, validator, mock_client):
+        """Test that a SELECT * nobody awaited is cancelled rather than left running."""
+        import asyncio
+
+        select_all_started = asyncio.Event()
+        select_all_cancelled = False
+
+        async def execute(query):
+            nonlocal select_all_cancelled
+            if not select_all_started.is_set():
+                # The shared SELECT * is issued first and never completes
+                select_all_started.set()
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    select_all_cancelled = True
+                    raise
+            await select_all_started.wait()
+            raise Exception("denied")
+
+        mock_client.execute.side_effect = execute
+
+        results = await validator.validate_table_schema_batch(
+            table_name="subscriber", field_mappings={0: "id"}, sample_size=1
+        )
+        await asyncio.sleep(0)
+
+        assert "error" in results[0]
+        assert select_all_cancelled